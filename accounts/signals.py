@@ -0,0 +1,62 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from departments.models import Department
+from utils.membership import invalidate_membership
+from utils.signals import restored, soft_deleted
+
+from .models import User
+
+
+@receiver(m2m_changed, sender=User.departments.through)
+def invalidate_membership_on_departments_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """
+    Drop the cached membership of users whose departments changed.
+
+    Handles both sides of the relation: `user.departments.add(...)` and
+    `department.users.add(...)`. Clearing the users of a department does
+    not report which users were affected, so the whole namespace is
+    invalidated in that case.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        invalidate_membership([instance.pk])
+    elif pk_set:
+        invalidate_membership(pk_set)
+    elif action == "post_clear":
+        invalidate_membership()
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def invalidate_membership_on_department_change(sender, instance, **kwargs):
+    """
+    Invalidate every cached membership when a department changes.
+
+    Renames can grant or revoke the "Administração" status and soft
+    deletes remove the department from its users, so every membership
+    built before the change is versioned out. New departments have no
+    users yet and are skipped.
+    """
+    if kwargs.get("created"):
+        return
+    invalidate_membership()
+
+
+@receiver(soft_deleted, sender=Department)
+@receiver(restored, sender=Department)
+def invalidate_membership_on_department_bulk_change(sender, pks, **kwargs):
+    """Invalidate every cached membership when departments are soft deleted or restored in bulk."""
+    invalidate_membership()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_membership_on_user_change(sender, instance, **kwargs):
+    """Drop the cached membership of a created or deleted user."""
+    if kwargs.get("created", True):
+        invalidate_membership([instance.pk])
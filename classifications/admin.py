@@ -1,5 +1,7 @@
 from django.contrib import admin
 
+from utils.admin import SoftDeleteAdminMixin
+
 from .models import (
     DamageClassification,
     IncidentClassification,
@@ -8,7 +10,7 @@ from .models import (
 
 
 @admin.register(IncidentClassification)
-class IncidentClassificationAdmin(admin.ModelAdmin):
+class IncidentClassificationAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ('classification',)
     search_fields = ('classification',)
     list_filter = ('classification',)
@@ -17,7 +19,7 @@ class IncidentClassificationAdmin(admin.ModelAdmin):
 
 
 @admin.register(OcurrenceClassification)
-class OcurrenceClassificationAdmin(admin.ModelAdmin):
+class OcurrenceClassificationAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ('classification',)
     search_fields = ('classification',)
     list_filter = ('classification',)
@@ -26,7 +28,7 @@ class OcurrenceClassificationAdmin(admin.ModelAdmin):
 
 
 @admin.register(DamageClassification)
-class DamageClassificationAdmin(admin.ModelAdmin):
+class DamageClassificationAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ('classification',)
     search_fields = ('classification',)
     list_filter = ('classification',)
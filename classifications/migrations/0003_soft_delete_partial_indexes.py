@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classifications', '0002_alter_damageclassification_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='damageclassification',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['created_at'], name='classificat_created_d53fa3_nd'),
+        ),
+        migrations.AddIndex(
+            model_name='incidentclassification',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['created_at'], name='classificat_created_02a827_nd'),
+        ),
+        migrations.AddIndex(
+            model_name='ocurrenceclassification',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['created_at'], name='classificat_created_10246e_nd'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+"""Cache configuration read from the environment."""
+
+import os
+
+BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+}
+
+
+def caches_from_env(environ=os.environ, base_dir=".") -> dict:
+    """
+    Build the `CACHES` setting from environment variables.
+
+    - `CACHE_BACKEND`: "locmem" (default), memory of each process;
+      "file", files shared by the processes of a host; or "redis", any
+      server speaking the Redis protocol, shared by every host. "redis"
+      requires the `redis` package (`poetry install -E redis`).
+    - `CACHE_LOCATION`: the name of the memory, the directory of the files
+      or the `redis://` URL. Defaults to "safecare", `<base_dir>/cache`
+      and "redis://127.0.0.1:6379/1".
+    - `CACHE_TIMEOUT`: the default timeout, in seconds. Defaults to 300.
+    - `CACHE_MAX_ENTRIES`: the entries kept before culling, for the
+      "locmem" and "file" backends. Defaults to 10000.
+    - `CACHE_KEY_PREFIX`: the prefix of every key. Defaults to "safecare".
+
+    Args:
+        environ (Mapping[str, str]): The environment variables.
+        base_dir (str | Path): The directory of the project.
+
+    Returns:
+        dict: The `CACHES` setting.
+
+    Raises:
+        ValueError: If `CACHE_BACKEND` is not a known backend.
+
+    >>> caches_from_env({})["default"]["BACKEND"]
+    'django.core.cache.backends.locmem.LocMemCache'
+    """
+    backend = environ.get("CACHE_BACKEND", "locmem").lower()
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"CACHE_BACKEND must be one of {', '.join(BACKENDS)}, not {backend!r}."
+        )
+    locations = {
+        "locmem": "safecare",
+        "file": os.path.join(base_dir, "cache"),
+        "redis": "redis://127.0.0.1:6379/1",
+    }
+    config = {
+        "BACKEND": BACKENDS[backend],
+        "LOCATION": environ.get("CACHE_LOCATION", locations[backend]),
+        "TIMEOUT": int(environ.get("CACHE_TIMEOUT", 300)),
+        "KEY_PREFIX": environ.get("CACHE_KEY_PREFIX", "safecare"),
+    }
+    if backend != "redis":
+        config["OPTIONS"] = {
+            "MAX_ENTRIES": int(environ.get("CACHE_MAX_ENTRIES", 10000)),
+        }
+    return {"default": config}
@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 import os
 from pathlib import Path
 
+from core.caches import caches_from_env
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -67,6 +69,7 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "utils.context_processors.department_membership",
             ],
         },
     },
@@ -86,6 +89,13 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Chosen by the CACHE_* environment variables, see `core.caches`.
+
+CACHES = caches_from_env(os.environ, BASE_DIR)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -137,3 +147,35 @@ LOGIN_REDIRECT_URL = "/"
 LOGOUT_REDIRECT_URL = "/login/"
 
 AUTH_USER_MODEL = "accounts.User"
+
+# Seconds a user's department membership stays cached between requests.
+# Changes to departments or to the user's departments invalidate it earlier.
+MEMBERSHIP_CACHE_TIMEOUT = 60 * 60
+
+# Models ("app_label.ModelName") whose department visibility is materialized
+# in departments.DepartmentVisibility. DepartmentListFilterMixin filters them
+# with a single indexed lookup. Run `manage.py rebuild_visibility_index`
+# after adding a model here.
+VISIBILITY_INDEX_MODELS = []
+
+# Days a soft deleted row stays in its table before
+# `manage.py archive_soft_deleted` moves it to the archive table.
+ARCHIVE_SOFT_DELETED_AFTER_DAYS = 90
+
+# Hours an idempotency key of an occurrence submission is recognized.
+# Replays within this window return the original occurrence. Expired keys
+# are deleted by `manage.py prune_idempotency_keys`.
+IDEMPOTENCY_KEY_TTL_HOURS = 24
+
+# Seconds the choices of model select fields (utils.forms) stay cached.
+# Saving or deleting a row of the model invalidates them earlier.
+CHOICES_CACHE_TIMEOUT = 60 * 60
+
+# Seconds a page of a view with a cache policy (utils.mixins.CachePolicyMixin)
+# stays cached. Changes to the data of its tags invalidate it earlier.
+VIEW_CACHE_TIMEOUT = 5 * 60
+
+# Seconds an aggregate, such as the count of a list, is served from the cache
+# (utils.cache.get_or_refresh). It is recomputed by a single worker, while
+# the others keep the previous value, so it may lag behind writes.
+AGGREGATE_CACHE_TIMEOUT = 60
@@ -1,10 +1,14 @@
 from django.contrib import admin
 
+from utils.admin import IndexedSearchAdminMixin, SoftDeleteAdminMixin
+
 from . import forms
 from .models import Department
 
 
-class DepartmentAdmin(admin.ModelAdmin):
+class DepartmentAdmin(
+    IndexedSearchAdminMixin, SoftDeleteAdminMixin, admin.ModelAdmin
+):
     form = forms.DepartmentForm
     list_display = (
         "name",
@@ -13,7 +17,7 @@ class DepartmentAdmin(admin.ModelAdmin):
         "updated_at",
         "owner",
     )
-    search_fields = ("name",)
+    folded_search_fields = ("name_search",)
     list_filter = (
         "name",
         "created_at",
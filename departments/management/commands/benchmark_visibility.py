@@ -0,0 +1,113 @@
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from departments.models import Department
+from utils.membership import DepartmentMembership
+from utils.visibility import filter_visible
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the department visibility filter: the legacy OR-join with "
+        "DISTINCT against the semi-join filter. Runs inside a transaction "
+        "that is rolled back, so no data is kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--users", type=int, default=500)
+        parser.add_argument("--departments-per-user", type=int, default=3)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        with transaction.atomic():
+            user = self.populate(
+                options["rows"],
+                options["users"],
+                options["departments_per_user"],
+            )
+            self.compare(user, options["repeat"])
+            transaction.set_rollback(True)
+
+    def populate(self, rows, users, departments_per_user):
+        """Create the benchmark users, departments and memberships."""
+        User = get_user_model()
+        self.stdout.write(f"Creating {users} users and {rows} departments...")
+
+        created_users = User.objects.bulk_create(
+            User(
+                email=f"bench{index}@benchmark.local",
+                username=f"bench{index}",
+                password="!",
+            )
+            for index in range(users)
+        )
+        user_ids = [user.pk for user in created_users]
+        Department.objects.bulk_create(
+            (
+                Department(
+                    name=f"benchmark-{index:07d}",
+                    owner_id=random.choice(user_ids),
+                )
+                for index in range(rows)
+            ),
+            batch_size=5000,
+        )
+        department_ids = list(
+            Department.objects.filter(
+                name__startswith="benchmark-"
+            ).values_list("id", flat=True)
+        )
+        Membership = User.departments.through
+        Membership.objects.bulk_create(
+            (
+                Membership(user_id=user_id, department_id=department_id)
+                for user_id in user_ids
+                for department_id in random.sample(
+                    department_ids, departments_per_user
+                )
+            ),
+            batch_size=5000,
+        )
+        return created_users[0]
+
+    def compare(self, user, repeat):
+        """Time both visibility filters for the same user."""
+        membership = DepartmentMembership(
+            user.pk, user.departments.values_list("id", "name")
+        )
+        department_ids = membership.department_ids
+        base = Department.objects.filter(is_deleted=False)
+
+        legacy = base.filter(
+            Q(owner=user) | Q(owner__departments__in=department_ids)
+        ).distinct()
+        subquery = filter_visible(base, membership)
+
+        for label, queryset in (("legacy", legacy), ("subquery", subquery)):
+            count, count_time = self.measure(queryset.count, repeat)
+            _, page_time = self.measure(
+                lambda: list(queryset.order_by("name")[:50]), repeat
+            )
+            self.stdout.write(
+                f"{label:>8}: {count} visible rows | "
+                f"count {count_time * 1000:.1f} ms | "
+                f"first page {page_time * 1000:.1f} ms"
+            )
+
+    def measure(self, func, repeat):
+        """Return the result of `func` and its best time over `repeat` runs."""
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return result, best
@@ -0,0 +1,43 @@
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from departments.services import visibility_services
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the department visibility index from scratch, in batches, "
+        "for the models listed in VISIBILITY_INDEX_MODELS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            choices=settings.VISIBILITY_INDEX_MODELS,
+            help="Indexed model to rebuild (app_label.ModelName). Defaults to every indexed model.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options["models"]:
+            models = [apps.get_model(label) for label in options["models"]]
+        else:
+            models = visibility_services.indexed_models()
+
+        if not models:
+            self.stdout.write(
+                self.style.WARNING("No model is listed in VISIBILITY_INDEX_MODELS.")
+            )
+            return
+
+        for model in models:
+            indexed = visibility_services.rebuild(model, options["batch_size"])
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Visibility index of "{model._meta.label}" rebuilt: '
+                    f"{indexed} objects indexed."
+                )
+            )
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('departments', '0002_alter_department_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DepartmentVisibility',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+                ('department', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='visible_rows', to='departments.department')),
+            ],
+            options={
+                'verbose_name': 'Visibilidade por Departamento',
+                'verbose_name_plural': 'Visibilidades por Departamento',
+                'indexes': [models.Index(fields=['content_type', 'department', 'object_id'], name='dept_visibility_lookup_idx')],
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id', 'department'), name='unique_department_visibility')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0003_departmentvisibility'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['created_at'], name='departments_created_11fda6_nd'),
+        ),
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['owner', 'created_at'], name='departments_owner_i_effaed_nd'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:33
+
+import django.utils.timezone
+from django.db import migrations, models
+
+import utils.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0004_soft_delete_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedDepartment',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('owner_id', models.BigIntegerField(db_index=True)),
+                ('name', models.CharField(help_text='Nome do departamento. Deve ser único.', max_length=255, validators=[utils.validators.validate_not_empty])),
+                ('description', models.CharField(blank=True, help_text='Descrição do departamento. Opcional.', max_length=255, null=True)),
+                ('archived_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Departamento (arquivo)',
+                'verbose_name_plural': 'Departamentos (arquivo)',
+                'db_table': 'departments_department_archive',
+            },
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:59
+
+import unicodedata
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fold(value):
+    # Snapshot of `utils.text.fold` at the time of this migration.
+    decomposed = unicodedata.normalize('NFKD', value or '')
+    return ''.join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold()
+
+
+def backfill(apps, schema_editor):
+    """Fill `name_search` from `name`, 1000 rows per query."""
+    manager = apps.get_model('departments', 'Department')._base_manager
+    last_pk = 0
+    while True:
+        rows = list(
+            manager.filter(pk__gt=last_pk)
+            .order_by('pk')
+            .only('pk', 'name', 'name_search')[:1000]
+        )
+        if not rows:
+            return
+        last_pk = rows[-1].pk
+        for row in rows:
+            row.name_search = fold(row.name)
+        manager.bulk_update(rows, ['name_search'])
+
+
+def create_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS departments_name_search_trgm '
+        'ON departments_department USING gin (name_search gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS departments_name_search_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0005_archive_tables'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archiveddepartment',
+            name='name_search',
+            field=models.CharField(default='', editable=False, help_text='Nome normalizado para busca, sem acentos.', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='department',
+            name='name_search',
+            field=models.CharField(default='', editable=False, help_text='Nome normalizado para busca, sem acentos.', max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(fields=['name_search'], name='departments_name_se_34815d_idx'),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
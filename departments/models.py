@@ -1,7 +1,10 @@
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models
 
 from utils import mixins, validators
+from utils.archive import archive_model
+from utils.text import fold
 
 
 class Department(
@@ -24,6 +27,8 @@ class Department(
     Attributes:
         name (CharField): The name of the department, which must be unique.
         description (CharField): An optional description of the department.
+        name_search (CharField): The name lowercased and without diacritics, 
+            set on save and indexed for accent-insensitive searches.
 
     Meta:
         ordering (list): The default ordering of departments by name.
@@ -51,6 +56,12 @@ class Department(
         null=True,
         help_text="Descrição do departamento. Opcional.",
     )
+    name_search = models.CharField(
+        max_length=255,
+        default="",
+        editable=False,
+        help_text="Nome normalizado para busca, sem acentos.",
+    )
 
     class Meta:
         """Meta options for Department model."""
@@ -59,6 +70,7 @@ class Department(
         verbose_name_plural = "Departamentos"
         indexes = [
             models.Index(fields=["name"]),
+            models.Index(fields=["name_search"]),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -72,7 +84,8 @@ class Department(
         Override the save method to ensure the `name` field is not empty or whitespace-only.
 
         This method raises a `ValidationError` if the `name` field is empty or contains only whitespace.
-        After the validation, it calls the parent class's `save` method to store the department in the database.
+        After the validation, it refreshes `name_search` and calls the parent class's `save` method 
+        to store the department in the database.
 
         Args:
             *args: Additional positional arguments to be passed to the parent save method.
@@ -80,6 +93,10 @@ class Department(
         """
         if not self.name or not self.name.strip():
             raise ValidationError("O campo 'name' não pode estar vazio.")
+        self.name_search = fold(self.name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "name_search"}
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -93,3 +110,65 @@ class Department(
             str: The name of the department.
         """
         return self.name
+
+
+class DepartmentVisibility(models.Model):
+    """
+    Denormalized index of the departments that can see a row.
+
+    Each entry states that `department` can see the object identified by
+    `content_type` and `object_id`. Entries are derived from the owner's
+    departments and, for models with a `department` field, from that
+    department. The index is optional: only the models listed in the
+    `VISIBILITY_INDEX_MODELS` setting are indexed, and the signals in
+    `departments.signals` keep their entries current.
+
+    Attributes:
+        content_type (ForeignKey): The model of the indexed object.
+        object_id (PositiveBigIntegerField): The primary key of the indexed object.
+        department (ForeignKey): A department that can see the object.
+
+    Meta:
+        verbose_name (str): A human-readable singular name for the model.
+        verbose_name_plural (str): A human-readable plural name for the model.
+        indexes (list): A covering index to look up visible objects by department.
+        constraints (list): A unique constraint on content type, object and department.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    department = models.ForeignKey(
+        Department,
+        on_delete=models.CASCADE,
+        related_name="visible_rows",
+    )
+
+    class Meta:
+        """Meta options for DepartmentVisibility model."""
+        verbose_name = "Visibilidade por Departamento"
+        verbose_name_plural = "Visibilidades por Departamento"
+        indexes = [
+            models.Index(
+                fields=["content_type", "department", "object_id"],
+                name="dept_visibility_lookup_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id", "department"],
+                name="unique_department_visibility",
+            ),
+        ]
+
+    def __str__(self):
+        """
+        Return a string representation of the visibility entry.
+
+        Returns:
+            str: The indexed object and the department that can see it.
+        """
+        return f"{self.content_type_id}:{self.object_id} -> {self.department_id}"
+
+
+ArchivedDepartment = archive_model(Department, __name__)
+"""Departments soft deleted long ago, moved out of `departments_department`."""
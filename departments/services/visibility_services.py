@@ -0,0 +1,195 @@
+"""Service to maintain the department visibility index."""
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+
+from departments.models import DepartmentVisibility
+
+
+def indexed_models() -> list:
+    """
+    Return the models listed in the `VISIBILITY_INDEX_MODELS` setting.
+
+    Returns:
+        list[type[Model]]: The models whose visibility is materialized.
+    """
+    return [apps.get_model(label) for label in settings.VISIBILITY_INDEX_MODELS]
+
+
+def is_indexed(model) -> bool:
+    """
+    Check if the visibility of a model is materialized.
+
+    Args:
+        model (type[Model]): The model to be checked.
+
+    Returns:
+        bool: True if the model is listed in `VISIBILITY_INDEX_MODELS`.
+    """
+    return model._meta.label in settings.VISIBILITY_INDEX_MODELS
+
+
+def batched(iterable, size):
+    """
+    Split an iterable into lists of at most `size` items.
+
+    Args:
+        iterable (Iterable): The items to be split.
+        size (int): The maximum size of each batch.
+
+    Yields:
+        list: The next batch of items.
+    """
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def index_objects(model, object_ids) -> int:
+    """
+    Rebuild the visibility entries of some objects.
+
+    The objects, their owners' departments and the existing entries are
+    read with one query each, then the entries are replaced inside a
+    single transaction.
+
+    Args:
+        model (type[Model]): The model of the objects.
+        object_ids (Iterable[int]): The primary keys of the objects.
+
+    Returns:
+        int: The number of entries written.
+    """
+    object_ids = list(object_ids)
+    content_type = ContentType.objects.get_for_model(model)
+    fields = ["pk", "owner_id"]
+    if hasattr(model, "department"):
+        fields.append("department_id")
+
+    rows = list(
+        model._base_manager.filter(pk__in=object_ids).values_list(*fields)
+    )
+    owner_departments = defaultdict(set)
+    user_departments = get_user_model().departments.through.objects
+    for user_id, department_id in user_departments.filter(
+        user_id__in={row[1] for row in rows}
+    ).values_list("user_id", "department_id"):
+        owner_departments[user_id].add(department_id)
+
+    entries = []
+    for pk, owner_id, *department in rows:
+        department_ids = owner_departments[owner_id].union(
+            department_id for department_id in department if department_id
+        )
+        entries.extend(
+            DepartmentVisibility(
+                content_type=content_type,
+                object_id=pk,
+                department_id=department_id,
+            )
+            for department_id in department_ids
+        )
+
+    with transaction.atomic():
+        DepartmentVisibility.objects.filter(
+            content_type=content_type, object_id__in=object_ids
+        ).delete()
+        DepartmentVisibility.objects.bulk_create(entries)
+    return len(entries)
+
+
+def remove_objects(model, object_ids) -> None:
+    """
+    Delete the visibility entries of some objects.
+
+    Args:
+        model (type[Model]): The model of the objects.
+        object_ids (Iterable[int]): The primary keys of the objects.
+    """
+    DepartmentVisibility.objects.filter(
+        content_type=ContentType.objects.get_for_model(model),
+        object_id__in=list(object_ids),
+    ).delete()
+
+
+def reindex_owners(user_ids, batch_size=1000) -> None:
+    """
+    Rebuild the entries of every indexed object owned by some users.
+
+    Called when the departments of the users change.
+
+    Args:
+        user_ids (Iterable[int]): The primary keys of the owners.
+        batch_size (int, optional): Objects reindexed per transaction. Defaults to 1000.
+    """
+    user_ids = list(user_ids)
+    for model in indexed_models():
+        object_ids = model._base_manager.filter(
+            owner_id__in=user_ids
+        ).values_list("pk", flat=True)
+        for batch in batched(object_ids.iterator(), batch_size):
+            index_objects(model, batch)
+
+
+def reindex_department(department_id, batch_size=1000) -> None:
+    """
+    Rebuild the entries of every indexed object visible to a department.
+
+    Called when all the users of a department are removed at once, which
+    does not report the affected users.
+
+    Args:
+        department_id (int): The primary key of the department.
+        batch_size (int, optional): Objects reindexed per transaction. Defaults to 1000.
+    """
+    for model in indexed_models():
+        object_ids = DepartmentVisibility.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            department_id=department_id,
+        ).values_list("object_id", flat=True)
+        for batch in batched(list(object_ids), batch_size):
+            index_objects(model, batch)
+
+
+def rebuild(model, batch_size=1000) -> int:
+    """
+    Rebuild the visibility index of a model from scratch.
+
+    Objects are walked in primary key order and each batch is replaced in
+    its own transaction, so readers never see an empty index and no lock
+    is held for the whole run. Entries of objects that no longer exist are
+    deleted at the end.
+
+    Args:
+        model (type[Model]): The model to be reindexed.
+        batch_size (int, optional): Objects reindexed per transaction. Defaults to 1000.
+
+    Returns:
+        int: The number of objects indexed.
+    """
+    indexed = 0
+    last_pk = 0
+    queryset = model._base_manager.order_by("pk").values_list("pk", flat=True)
+    while True:
+        object_ids = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+        if not object_ids:
+            break
+        index_objects(model, object_ids)
+        indexed += len(object_ids)
+        last_pk = object_ids[-1]
+
+    DepartmentVisibility.objects.filter(
+        content_type=ContentType.objects.get_for_model(model)
+    ).exclude(
+        object_id__in=model._base_manager.values("pk")
+    ).delete()
+    return indexed
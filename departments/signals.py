@@ -0,0 +1,80 @@
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from departments.models import Department
+from departments.services import visibility_services
+from utils import signals
+from utils.cache import invalidate_tags
+
+VISIBILITY_FIELDS = {"owner", "owner_id", "department", "department_id"}
+
+
+@receiver(post_save)
+def index_visibility_on_save(sender, instance, created, update_fields, **kwargs):
+    """
+    Index the visibility of created objects and of objects whose owner or
+    department may have changed.
+
+    Only models listed in `VISIBILITY_INDEX_MODELS` are handled. Saves
+    restricted by `update_fields` to other columns are skipped.
+    """
+    if not visibility_services.is_indexed(sender):
+        return
+    if created or update_fields is None or VISIBILITY_FIELDS & set(update_fields):
+        visibility_services.index_objects(sender, [instance.pk])
+
+
+@receiver(post_delete)
+def remove_visibility_on_delete(sender, instance, **kwargs):
+    """Delete the visibility entries of deleted objects."""
+    if visibility_services.is_indexed(sender):
+        visibility_services.remove_objects(sender, [instance.pk])
+
+
+@receiver(m2m_changed, sender=get_user_model().departments.through)
+def reindex_visibility_on_departments_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """
+    Reindex the objects owned by users whose departments changed.
+
+    When every user of a department is removed at once the affected users
+    are unknown, so the objects currently visible to that department are
+    reindexed instead.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not visibility_services.indexed_models():
+        return
+
+    if not reverse:
+        visibility_services.reindex_owners([instance.pk])
+    elif pk_set:
+        visibility_services.reindex_owners(pk_set)
+    elif action == "post_clear":
+        visibility_services.reindex_department(instance.pk)
+
+
+@receiver(signals.restored)
+def index_visibility_on_restore(sender, pks, **kwargs):
+    """
+    Index the visibility of restored objects.
+
+    Rows restored from an archive table come back with raw SQL, without
+    `post_save`, and their entries were removed when they were archived.
+    """
+    if visibility_services.is_indexed(sender):
+        visibility_services.index_objects(sender, pks)
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+@receiver(signals.soft_deleted, sender=Department)
+@receiver(signals.restored, sender=Department)
+def invalidate_department_pages(sender, **kwargs):
+    """Drop the cached pages showing departments, once the change is committed."""
+    transaction.on_commit(partial(invalidate_tags, "departments"))
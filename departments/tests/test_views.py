@@ -0,0 +1,106 @@
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.test import RequestFactory, override_settings
+
+from departments import views
+from departments.models import Department
+from utils.test import SetUpInitial
+
+
+@override_settings(ROOT_URLCONF='departments.tests.urls')
+class DepartmentPermissionViewsTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+        self.department = Department.objects.get(name='TI')
+        self.set_permission(Department, 'view_department')
+        self.set_permission(Department, 'delete_department')
+        self.user = self.User.objects.get(pk=self.user.pk)
+
+    def make_request(self, method='get', **headers):
+        request = getattr(self.factory, method)('/', **headers)
+        request.user = self.user
+        request.session = self.client.session
+        request._messages = FallbackStorage(request)
+        return request
+
+    def test_detail_loads_object_once(self):
+        """Testa se a página de detalhe carrega o objeto uma única vez."""
+        request = self.make_request()
+        with self.assertNumQueries(5):
+            response = views.DepartmentDetailView.as_view()(
+                request, pk=self.department.pk
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context_data['department'], self.department)
+
+    def test_detail_for_cached_membership_and_permissions(self):
+        """Testa se, com cache aquecido, restam só as consultas do objeto."""
+        views.DepartmentDetailView.as_view()(
+            self.make_request(), pk=self.department.pk
+        )
+        with self.assertNumQueries(2):
+            views.DepartmentDetailView.as_view()(
+                self.make_request(), pk=self.department.pk
+            )
+
+    def test_detail_not_modified(self):
+        """Testa se a página de detalhe inalterada responde 304 sem renderizar."""
+        response = views.DepartmentDetailView.as_view()(
+            self.make_request(), pk=self.department.pk
+        )
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+
+        response = views.DepartmentDetailView.as_view()(
+            self.make_request(HTTP_IF_NONE_MATCH=etag), pk=self.department.pk
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(hasattr(response, 'context_data'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.department.description = 'Outra descrição'
+            self.department.save()
+        response = views.DepartmentDetailView.as_view()(
+            self.make_request(HTTP_IF_NONE_MATCH=etag), pk=self.department.pk
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_list_etag_follows_changes(self):
+        """Testa se o ETag da listagem muda quando um setor muda."""
+        def etag():
+            view = views.DepartmentListView()
+            view.setup(self.make_request())
+            return view.get_validators()[0]
+
+        before = etag()
+        self.assertEqual(etag(), before)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.department.name = 'Tecnologia'
+            self.department.save()
+        self.assertNotEqual(etag(), before)
+
+    def test_list_ordered_by_name(self):
+        """Testa se a listagem pagina os setores em ordem alfabética."""
+        for name in ('Zeladoria', 'Compras', 'Manutenção', 'Recepção'):
+            Department.objects.create(name=name, owner=self.user)
+        view = views.DepartmentListView()
+        view.setup(self.make_request())
+        _, _, departments, _ = view.paginate_queryset(
+            view.get_queryset(), 5
+        )
+        names = [department.name for department in departments]
+        self.assertEqual(
+            names, ['Administração', 'Compras', 'Manutenção', 'Recepção', 'TI']
+        )
+
+    def test_delete_reuses_loaded_object(self):
+        """Testa se a exclusão lógica reaproveita o objeto carregado."""
+        request = self.make_request('post')
+        response = views.DepartmentDeleteView.as_view()(
+            request, pk=self.department.pk
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            Department.all_objects.get(pk=self.department.pk).is_deleted
+        )
@@ -0,0 +1,83 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+
+from departments.models import Department, DepartmentVisibility
+from utils.membership import DepartmentMembership
+from utils.test import SetUpInitial
+from utils.visibility import filter_visible
+
+
+@override_settings(VISIBILITY_INDEX_MODELS=['departments.Department'])
+class DepartmentVisibilityIndexTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.ti = Department.objects.get(name='TI')
+        self.other = self.User.objects.create_user(
+            email='other@123.com', username='other', password='password'
+        )
+        self.viewer = self.User.objects.create_user(
+            email='viewer@123.com', username='viewer', password='password'
+        )
+        self.viewer.departments.add(self.ti)
+
+    def visible_to(self, user):
+        membership = DepartmentMembership.for_user(user)
+        return list(filter_visible(Department.objects.all(), membership))
+
+    def entries_of(self, department):
+        return set(
+            DepartmentVisibility.objects.filter(
+                object_id=department.pk
+            ).values_list('department_id', flat=True)
+        )
+
+    def test_created_object_is_indexed(self):
+        """Testa se objetos criados são indexados com os setores do dono."""
+        self.other.departments.add(self.ti)
+        purchases = Department.objects.create(name='Compras', owner=self.other)
+        self.assertEqual(self.entries_of(purchases), {self.ti.pk})
+        self.assertEqual(self.visible_to(self.viewer), [purchases])
+
+    def test_owner_departments_change_reindexes(self):
+        """Testa se mudanças nos setores do dono atualizam o índice."""
+        purchases = Department.objects.create(name='Compras', owner=self.other)
+        self.assertEqual(self.visible_to(self.viewer), [])
+
+        self.ti.users.add(self.other)
+        self.assertEqual(self.visible_to(self.viewer), [purchases])
+
+        self.ti.users.clear()
+        self.assertEqual(self.entries_of(purchases), set())
+
+    def test_owner_change_reindexes(self):
+        """Testa se a troca de dono atualiza o índice."""
+        purchases = Department.objects.create(name='Compras', owner=self.other)
+        purchases.owner = self.viewer
+        purchases.save()
+        self.assertEqual(self.entries_of(purchases), {self.ti.pk})
+
+    def test_rebuild_command(self):
+        """Testa se o comando reconstrói o índice do zero."""
+        self.other.departments.add(self.ti)
+        purchases = Department.objects.create(name='Compras', owner=self.other)
+        DepartmentVisibility.objects.all().delete()
+
+        out = StringIO()
+        call_command('rebuild_visibility_index', batch_size=1, stdout=out)
+        self.assertIn('3 objects indexed', out.getvalue())
+        self.assertEqual(self.entries_of(purchases), {self.ti.pk})
+        self.assertEqual(self.entries_of(self.ti), {1})
+
+    def test_rebuild_command_rejects_models_not_indexed(self):
+        """Testa se o comando recusa modelos fora de VISIBILITY_INDEX_MODELS."""
+        with self.assertRaises(CommandError):
+            call_command(
+                'rebuild_visibility_index', '--model', 'events.EventOcurrence',
+                stdout=StringIO(),
+            )
+        call_command(
+            'rebuild_visibility_index', '--model', 'departments.Department',
+            stdout=StringIO(),
+        )
@@ -12,14 +12,17 @@ from django.views.generic import (
 )
 
 from utils import mixins
+from utils.search import folded_condition
 
 from . import forms, models
 
 
 class DepartmentListView(
     mixins.DepartmentListFilterMixin,
+    mixins.CursorPaginationMixin,
     LoginRequiredMixin,
     PermissionRequiredMixin,
+    mixins.ConditionalGetMixin,
     ListView,
 ):
     """
@@ -27,7 +30,9 @@ class DepartmentListView(
 
     This view retrieves and displays a paginated list of departments. It allows 
     filtering departments by their name through a query parameter (`name`), and 
-    requires the user to be logged in with the necessary permissions.
+    requires the user to be logged in with the necessary permissions. Pages 
+    are selected by cursor on (name, id), keeping the alphabetical order. 
+    Refreshes of an unchanged list are answered with 304 Not Modified.
 
     Attributes:
         model (models.Department): The model representing a department.
@@ -35,6 +40,8 @@ class DepartmentListView(
         context_object_name (str): The name of the context variable to be used in the template.
         paginate_by (int): The number of departments to display per page.
         permission_required (str): The permission required to access this view.
+        cache_tags (tuple[str]): The data shown by the page, changing its ETag.
+        cursor_ordering (tuple[str]): The ordering of the pages, by name.
 
     Methods:
         get_queryset():
@@ -45,11 +52,16 @@ class DepartmentListView(
     context_object_name = "departments"
     paginate_by = 5
     permission_required = "departments.view_department"
+    cache_tags = ("departments",)
+    cursor_ordering = ("name", "id")
 
     def get_queryset(self):
         """
         Retrieves a filtered list of departments based on the query parameter `name`.
 
+        The name is matched anywhere in the accent-folded `name_search`
+        column, so "administracao" finds "Administração".
+
         Returns:
             queryset: A queryset of departments, optionally filtered by the `name` query parameter.
         """
@@ -57,7 +69,9 @@ class DepartmentListView(
         name = self.request.GET.get("name")
 
         if name:
-            queryset = queryset.filter(name__icontains=name)
+            queryset = queryset.filter(
+                folded_condition(queryset, "name_search", name)
+            )
         return queryset
 
 
@@ -96,19 +110,23 @@ class DepartmentDetailView(
     mixins.DepartmentPermissionMixin,
     LoginRequiredMixin,
     PermissionRequiredMixin,
+    mixins.ConditionalGetMixin,
+    mixins.CachePolicyMixin,
     DetailView,
 ):
     """
     View for displaying the details of a specific department.
 
     This view retrieves a specific department based on its ID and displays its details. 
-    Only users with the appropriate permissions can view the department details.
+    Only users with the appropriate permissions can view the department details. 
+    Refreshes of an unchanged department are answered with 304 Not Modified.
 
     Attributes:
         model (models.Department): The model for the department.
         template_name (str): The template used to render the department details.
         context_object_name (str): The name of the context variable to be used in the template.
         permission_required (str): The permission required to access this view.
+        cache_tags (tuple[str]): The data shown by the page, invalidating its cache.
 
     Methods:
         get_context_data():
@@ -118,6 +136,7 @@ class DepartmentDetailView(
     template_name = "department_detail.html"
     context_object_name = "department"
     permission_required = "departments.view_department"
+    cache_tags = ("departments",)
 
 
 class DepartmentUpdateView(
@@ -1,12 +1,15 @@
 from django.contrib import admin
 
+from events.models.deadline_rule_models import DeadlineRule
 from events.models.event_ocurrence_models import EventOcurrence
 from events.models.event_patient_models import EventPatient
 from events.models.gender_models import Gender
 from events.models.metas_models import Metas
 from events.models.ocurrence_description_models import OcurrenceDescription
+from events.models.overdue_counter_models import DepartmentOverdueCounter
 from events.models.race_models import Race
 from events.models.response_ocurrence_models import ResponseOcurrence
+from utils.admin import IndexedSearchAdminMixin, SoftDeleteAdminMixin
 
 
 @admin.register(Gender)
@@ -25,24 +28,27 @@ class RaceAdmin(admin.ModelAdmin):
     ordering = ('id',)
 
 @admin.register(EventPatient)
-class EventPatientAdmin(admin.ModelAdmin):
+class EventPatientAdmin(
+    IndexedSearchAdminMixin, SoftDeleteAdminMixin, admin.ModelAdmin
+):
     list_display = (
         'patient_name', 'attendance', 'record', 'birth_date', 'internment_date'
     )
-    search_fields = ('patient_name', 'attendance', 'record')
+    folded_search_fields = ('patient_name_search',)
+    exact_search_fields = ('attendance', 'record')
     list_filter = ('internment_date', 'birth_date')
     date_hierarchy = 'internment_date'
     ordering = ('patient_name',)
 
 
 @admin.register(EventOcurrence)
-class EventOcurrenceAdmin(admin.ModelAdmin):
+class EventOcurrenceAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = (
         'ocurrence_date', 'ocurrence_time', 'reporting_department', 
-        'notified_department', 'patient_involved'
+        'notified_department', 'patient_involved', 'status'
     )
     search_fields = ('reporting_department__name', 'notified_department__name')
-    list_filter = ('ocurrence_date', 'patient_involved')
+    list_filter = ('ocurrence_date', 'patient_involved', 'status')
     date_hierarchy = 'ocurrence_date'
     ordering = ('ocurrence_date',)
 
@@ -80,11 +86,36 @@ class ResponseOcurrenceAdmin(admin.ModelAdmin):
         'ocurrence', 'meta', 'description', 
         'send_manager', 'event_investigation', 
         'ocurrence_classification', 'damage_classification', 
-        'incident_classification',
+        'incident_classification', 'deadline_response', 'is_overdue',
     )
     search_fields = (
         'ocurrence', 'meta', 'send_manager', 'event_investigation',
     )
-    list_filter = ('ocurrence', 'meta', 'send_manager', 'event_investigation',)
+    list_filter = (
+        'ocurrence', 'meta', 'send_manager', 'event_investigation', 'is_overdue',
+    )
     date_hierarchy = 'created_at'
     ordering = ('created_at',)
+
+
+@admin.register(DeadlineRule)
+class DeadlineRuleAdmin(admin.ModelAdmin):
+    list_display = ('ocurrence_classification', 'damage_classification', 'days')
+    list_editable = ('days',)
+    list_filter = ('ocurrence_classification', 'damage_classification')
+    list_select_related = ('ocurrence_classification', 'damage_classification')
+    ordering = ('ocurrence_classification', 'damage_classification')
+
+
+@admin.register(DepartmentOverdueCounter)
+class DepartmentOverdueCounterAdmin(admin.ModelAdmin):
+    list_display = ('department', 'overdue', 'updated_at')
+    list_select_related = ('department',)
+    ordering = ('-overdue',)
+
+    # Os contadores são mantidos pelo comando sweep_overdue_responses
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -4,4 +4,10 @@ from django.apps import AppConfig
 class EventsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'events'
-    verbose_name = 'Eventos'
\ No newline at end of file
+    verbose_name = 'Eventos'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .services import reference_services
+
+        reference_services.install()
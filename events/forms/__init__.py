@@ -2,4 +2,5 @@
 # flake8: noqa
 from .event_ocurrence_forms import EventOcurrenceForm
 from .event_patient_forms import EventPatientForm
+from .ingestion_forms import OcurrenceRecordForm, PatientRecordForm
 from .response_ocurrence_forms import ResponseOcurrenceForm
@@ -1,6 +1,7 @@
 from django import forms
 
 from events.models import EventOcurrence
+from utils.forms import CachedModelChoiceField, CachedSelect
 
 
 class EventOcurrenceForm(forms.ModelForm):
@@ -30,10 +31,10 @@ class EventOcurrenceForm(forms.ModelForm):
             'ocurrence_time': forms.TimeInput(
                 attrs={'class': 'form-control', 'type': 'time'}
             ),
-            'reporting_department': forms.Select(
+            'reporting_department': CachedSelect(
                 attrs={'class': 'form-select'}
             ),
-            'notified_department': forms.Select(
+            'notified_department': CachedSelect(
                 attrs={'class': 'form-select'}
             ),
             'description_ocurrence': forms.Textarea(
@@ -51,6 +52,10 @@ class EventOcurrenceForm(forms.ModelForm):
                 }
             ),
         }
+        field_classes = {
+            'reporting_department': CachedModelChoiceField,
+            'notified_department': CachedModelChoiceField,
+        }
         labels = {
             'patient_involved': 'Paciente envolvido ?',
             'ocurrence_date': 'Data da Ocorrência',
@@ -1,6 +1,7 @@
 from django import forms
 
 from events.models import EventPatient
+from utils.forms import CachedModelChoiceField, CachedSelect
 
 
 class EventPatientForm(forms.ModelForm):
@@ -58,13 +59,17 @@ class EventPatientForm(forms.ModelForm):
                 },
                 format='%Y-%m-%d',
             ),
-            'genere': forms.Select(
+            'genere': CachedSelect(
                 attrs={'class': 'form-select'}
             ),
-            'race': forms.Select(
+            'race': CachedSelect(
                 attrs={'class': 'form-select'}
             ),
         }
+        field_classes = {
+            'genere': CachedModelChoiceField,
+            'race': CachedModelChoiceField,
+        }
         labels = {
             'patient_name': 'Nome do Paciente',
             'attendance': 'Atendimento',
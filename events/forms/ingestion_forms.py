@@ -0,0 +1,42 @@
+from django import forms
+
+from events.models import EventOcurrence, EventPatient
+
+
+class OcurrenceRecordForm(forms.ModelForm):
+    """
+    Form validating an occurrence received by batch ingestion.
+
+    The departments are left out: they are resolved from a preloaded
+    lookup table (see `events.services.ingestion_services`) instead of a
+    query per record.
+    """
+    class Meta:
+        """A class meta"""
+        model = EventOcurrence
+        fields = [
+            'patient_involved',
+            'ocurrence_date',
+            'ocurrence_time',
+            'description_ocurrence',
+            'immediate_action',
+        ]
+
+
+class PatientRecordForm(forms.ModelForm):
+    """
+    Form validating the patient embedded in an ingested occurrence.
+
+    The gender and race are resolved from the lookup table, like the
+    departments of the occurrence.
+    """
+    class Meta:
+        """A class meta"""
+        model = EventPatient
+        fields = [
+            'patient_name',
+            'attendance',
+            'record',
+            'birth_date',
+            'internment_date',
+        ]
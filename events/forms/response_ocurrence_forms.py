@@ -1,6 +1,7 @@
 from django import forms
 
 from events.models import ResponseOcurrence
+from utils.forms import CachedModelChoiceField, CachedSelect
 
 
 class ResponseOcurrenceForm(forms.ModelForm):
@@ -16,7 +17,7 @@ class ResponseOcurrenceForm(forms.ModelForm):
             'damage_classification',
         ]
         widgets = {
-            'meta': forms.Select(
+            'meta': CachedSelect(
                 attrs={'class': 'form-select'}
             ),
             'description': forms.Textarea(
@@ -32,16 +33,22 @@ class ResponseOcurrenceForm(forms.ModelForm):
             'event_investigation': forms.RadioSelect(
                 choices=[(True, 'Sim'), (False, 'Não')]
             ),
-            'incident_classification': forms.Select(
+            'incident_classification': CachedSelect(
                 attrs={'class': 'form-select'}
             ),
-            'ocurrence_classification': forms.Select(
+            'ocurrence_classification': CachedSelect(
                 attrs={'class': 'form-select'}
             ),
-            'damage_classification': forms.Select(
+            'damage_classification': CachedSelect(
                 attrs={'class': 'form-select'}
             ),
         }
+        field_classes = {
+            'meta': CachedModelChoiceField,
+            'incident_classification': CachedModelChoiceField,
+            'ocurrence_classification': CachedModelChoiceField,
+            'damage_classification': CachedModelChoiceField,
+        }
         labels = {
             'ocurrence': 'Ocorrência',
             'meta': 'Meta',
@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from events.services import archive_services
+
+
+class Command(BaseCommand):
+    help = (
+        "Move rows soft deleted more than --days days ago to their archive "
+        "tables, in short batches. Safe to interrupt and run again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=settings.ARCHIVE_SOFT_DELETED_AFTER_DAYS
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Maximum number of batches per model. Defaults to no limit.",
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            choices=list(archive_services.ARCHIVES),
+            help="Model to archive. Defaults to every archivable model.",
+        )
+
+    def handle(self, *args, **options):
+        labels = [
+            label
+            for label in archive_services.ARCHIVES
+            if not options["models"] or label in options["models"]
+        ]
+        for label in labels:
+            archived = 0
+            for moved in archive_services.archive_soft_deleted(
+                label,
+                options["days"],
+                options["batch_size"],
+                options["max_batches"],
+            ):
+                archived += moved
+                self.stdout.write(f"{label}: {moved} rows archived.")
+            self.stdout.write(
+                self.style.SUCCESS(f'"{label}" archived: {archived} rows.')
+            )
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from events.models import EventOcurrence, ResponseOcurrence
+from events.services import ocurrence_status_services
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the response status of every occurrence from its "
+        "response, in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        updated = 0
+        for count in ocurrence_status_services.backfill_status(
+            EventOcurrence, ResponseOcurrence, options["batch_size"]
+        ):
+            updated += count
+            self.stdout.write(f"{updated} occurrences processed...")
+        self.stdout.write(
+            self.style.SUCCESS(f"Status of {updated} occurrences recomputed.")
+        )
@@ -0,0 +1,37 @@
+import json
+import sys
+
+from django.core.management.base import BaseCommand
+
+from events.services import ingestion_services
+
+
+class Command(BaseCommand):
+    help = (
+        "Insert occurrences from an NDJSON file, one occurrence per line, "
+        "in transactional chunks. Prints the errors of the rejected lines."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="The NDJSON file, or - for stdin.")
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        if options["path"] == "-":
+            self.ingest(sys.stdin, options["chunk_size"])
+        else:
+            with open(options["path"], encoding="utf-8") as lines:
+                self.ingest(lines, options["chunk_size"])
+
+    def ingest(self, lines, chunk_size):
+        created = rejected = 0
+        for result in ingestion_services.ingest(lines, chunk_size=chunk_size):
+            if "errors" in result:
+                rejected += 1
+                self.stderr.write(json.dumps(result, ensure_ascii=False))
+            else:
+                created += 1
+        style = self.style.SUCCESS if not rejected else self.style.WARNING
+        self.stdout.write(
+            style(f"{created} occurrences created, {rejected} lines rejected.")
+        )
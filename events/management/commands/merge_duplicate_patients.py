@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from events.models import EventOcurrence, EventPatient
+from events.services import patient_services
+from utils import signals
+
+
+class Command(BaseCommand):
+    help = (
+        "Merge the patients sharing an attendance and record into the first "
+        "one, re-pointing their occurrences, in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="The number of attendance and record pairs per batch.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the duplicated pairs.",
+        )
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            groups = patient_services.duplicate_groups(EventPatient)
+            self.stdout.write(
+                f"{groups.count()} attendance and record pairs with duplicated patients."
+            )
+            return
+        merged = 0
+        for pks in patient_services.merge_duplicates(
+            EventPatient, EventOcurrence, options["batch_size"]
+        ):
+            signals.soft_deleted.send(sender=EventPatient, pks=pks)
+            merged += len(pks)
+            self.stdout.write(f"{merged} patients merged...")
+        self.stdout.write(
+            self.style.SUCCESS(f"{merged} duplicated patients merged.")
+        )
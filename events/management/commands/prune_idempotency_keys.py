@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from events.services import idempotency_services
+
+
+class Command(BaseCommand):
+    help = "Delete the expired idempotency keys of occurrence submissions, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--max-batches", type=int, default=None)
+
+    def handle(self, *args, **options):
+        deleted = sum(
+            idempotency_services.prune(options["batch_size"], options["max_batches"])
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"{deleted} expired idempotency keys deleted.")
+        )
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from events.services import search_services
+
+
+class Command(BaseCommand):
+    help = "Refill the full-text index of occurrences from their tables."
+
+    def handle(self, *args, **options):
+        if not search_services.is_supported():
+            self.stdout.write(
+                self.style.WARNING("Full-text search is not supported by this database.")
+            )
+            return
+        with transaction.atomic():
+            search_services.rebuild()
+        self.stdout.write(self.style.SUCCESS("Full-text index rebuilt."))
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+
+from classifications.models import (
+    DamageClassification,
+    OcurrenceClassification,
+)
+from events.services import response_ocurrence_services
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the deadline of every open response from the deadline "
+        "rules, with one UPDATE per occurrence classification."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the deadlines that would change without writing them.",
+        )
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            self.report()
+            return
+        updated = 0
+        for _, count in response_ocurrence_services.recompute_deadlines():
+            updated += count
+        self.stdout.write(
+            self.style.SUCCESS(f"Deadline of {updated} open responses recomputed.")
+        )
+
+    def report(self):
+        ocurrences = dict(
+            OcurrenceClassification.all_objects.values_list("id", "classification")
+        )
+        damages = dict(
+            DamageClassification.all_objects.values_list("id", "classification")
+        )
+        changed = 0
+        for row in response_ocurrence_services.deadline_diff():
+            changed += row["changed"]
+            days = "no rule" if row["days"] is None else f"{row['days']} days"
+            self.stdout.write(
+                f"{ocurrences.get(row['ocurrence_classification_id'])} / "
+                f"{damages.get(row['damage_classification_id'])}: {days}, "
+                f"{row['changed']} of {row['open']} open responses would change."
+            )
+        self.stdout.write(
+            self.style.WARNING(f"Dry run: {changed} deadlines would change.")
+        )
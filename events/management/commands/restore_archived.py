@@ -0,0 +1,30 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from events.services import archive_services
+
+
+class Command(BaseCommand):
+    help = "Move archived rows back to their table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", choices=list(archive_services.ARCHIVES))
+        parser.add_argument("pks", nargs="+", type=int)
+
+    def handle(self, *args, **options):
+        try:
+            restored = archive_services.restore_archived(
+                options["model"], options["pks"]
+            )
+        except ValidationError as error:
+            raise CommandError(" ".join(error.messages))
+
+        if restored < len(set(options["pks"])):
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{len(set(options['pks'])) - restored} rows were not found in the archive."
+                )
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f'"{options["model"]}" restored: {restored} rows.')
+        )
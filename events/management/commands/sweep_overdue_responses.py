@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from events.services import overdue_services
+
+
+class Command(BaseCommand):
+    help = (
+        "Flag the open responses past their deadline, unflag the ones that "
+        "no longer are, and refresh the overdue counters of the departments."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop flagging after this many batches; the next run resumes.",
+        )
+
+    def handle(self, *args, **options):
+        batches = {
+            "batch_size": options["batch_size"],
+            "max_batches": options["max_batches"],
+        }
+        flagged = sum(overdue_services.flag_overdue(**batches))
+        cleared = sum(overdue_services.clear_overdue(**batches))
+        departments = overdue_services.refresh_counters()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{flagged} responses flagged and {cleared} unflagged as overdue; "
+                f"{departments} departments with overdue responses."
+            )
+        )
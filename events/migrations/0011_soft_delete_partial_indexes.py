@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0004_soft_delete_partial_indexes'),
+        ('events', '0010_alter_responseocurrence_meta'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventocurrence',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['created_at'], name='events_even_created_7d921d_nd'),
+        ),
+        migrations.AddIndex(
+            model_name='eventocurrence',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['patient', 'created_at'], name='events_even_patient_331355_nd'),
+        ),
+        migrations.AddIndex(
+            model_name='eventocurrence',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['reporting_department', 'created_at'], name='events_even_reporti_c7ff12_nd'),
+        ),
+        migrations.AddIndex(
+            model_name='eventocurrence',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['notified_department', 'created_at'], name='events_even_notifie_a076a3_nd'),
+        ),
+        migrations.AddIndex(
+            model_name='eventpatient',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['created_at'], name='events_even_created_94d4f8_nd'),
+        ),
+        migrations.AddIndex(
+            model_name='eventpatient',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['genere', 'created_at'], name='events_even_genere__f4ba51_nd'),
+        ),
+        migrations.AddIndex(
+            model_name='eventpatient',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['race', 'created_at'], name='events_even_race_id_5ebe3e_nd'),
+        ),
+    ]
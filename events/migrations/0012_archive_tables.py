@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:33
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0011_soft_delete_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedEventOcurrence',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('patient_involved', models.BooleanField(default=False, help_text='A ocorrência envolveu algum paciente ?')),
+                ('ocurrence_date', models.DateField(help_text='Data da ocorrência')),
+                ('ocurrence_time', models.TimeField(help_text='Hora da ocorrência')),
+                ('patient_id', models.BigIntegerField(blank=True, db_index=True, null=True)),
+                ('reporting_department_id', models.BigIntegerField(db_index=True)),
+                ('notified_department_id', models.BigIntegerField(db_index=True)),
+                ('description_ocurrence', models.TextField(help_text='Descrição da ocorrência')),
+                ('immediate_action', models.TextField(help_text='O que foi realizado após a ocorrência / Ação imediata')),
+                ('archived_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Ocorrência (arquivo)',
+                'verbose_name_plural': 'Ocorrências (arquivo)',
+                'db_table': 'events_eventocurrence_archive',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedEventPatient',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('patient_name', models.CharField(help_text='Nome do paciente', max_length=225)),
+                ('attendance', models.IntegerField(help_text='Número do Atendimento')),
+                ('record', models.IntegerField(help_text='Número do prontuário.')),
+                ('birth_date', models.DateField(help_text='Data de nascimento.')),
+                ('internment_date', models.DateField(help_text='Data de internação.')),
+                ('genere_id', models.BigIntegerField(blank=True, db_index=True, null=True)),
+                ('race_id', models.BigIntegerField(blank=True, db_index=True, null=True)),
+                ('archived_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Paciente Ocorrência (arquivo)',
+                'verbose_name_plural': 'Pacientes Ocorrências (arquivo)',
+                'db_table': 'events_eventpatient_archive',
+            },
+        ),
+    ]
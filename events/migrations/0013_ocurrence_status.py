@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:40
+
+from django.db import migrations, models
+from django.db.models import Case, Exists, OuterRef, Value, When
+
+
+def backfill(apps, schema_editor):
+    """
+    Compute the status of existing occurrences from their responses, one
+    `UPDATE` per range of 1000 primary keys.
+    """
+    EventOcurrence = apps.get_model('events', 'EventOcurrence')
+    ResponseOcurrence = apps.get_model('events', 'ResponseOcurrence')
+    responses = ResponseOcurrence._base_manager.filter(ocurrence=OuterRef('pk'))
+    status = Case(
+        When(Exists(responses.filter(resolved=True)), then=Value('resolved')),
+        When(Exists(responses), then=Value('responded')),
+        default=Value('pending'),
+    )
+    queryset = EventOcurrence._base_manager.order_by('pk')
+    last_pk = 0
+    while True:
+        pks = list(
+            queryset.filter(pk__gt=last_pk).values_list('pk', flat=True)[:1000]
+        )
+        if not pks:
+            return
+        last_pk = pks[-1]
+        queryset.filter(pk__gte=pks[0], pk__lte=last_pk).update(status=status)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0005_archive_tables'),
+        ('events', '0012_archive_tables'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedeventocurrence',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pendente'), ('responded', 'Respondida'), ('resolved', 'Resolvida')], default='pending', editable=False, help_text='Situação da tratativa da ocorrência', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='eventocurrence',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pendente'), ('responded', 'Respondida'), ('resolved', 'Resolvida')], default='pending', editable=False, help_text='Situação da tratativa da ocorrência', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='eventocurrence',
+            index=models.Index(fields=['status'], name='events_even_status_39c3ef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventocurrence',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('status', 'pending')), fields=['created_at', 'id'], name='events_ocurrence_pending_idx'),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,214 @@
+from django.db import migrations
+
+# The statements are a snapshot of `events.services.search_services` at the
+# time of this migration, so later changes to the service do not alter it.
+SEARCH_TABLE = "events_ocurrence_search"
+
+SQLITE_INSTALL = [
+    f"""
+    CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5(
+        description_ocurrence,
+        immediate_action,
+        response_description,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_ocurrence_insert
+    AFTER INSERT ON events_eventocurrence BEGIN
+        INSERT INTO {SEARCH_TABLE} (
+            rowid, description_ocurrence, immediate_action, response_description
+        )
+        VALUES (new.id, new.description_ocurrence, new.immediate_action, '');
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_ocurrence_update
+    AFTER UPDATE OF description_ocurrence, immediate_action
+    ON events_eventocurrence BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET description_ocurrence = new.description_ocurrence,
+            immediate_action = new.immediate_action
+        WHERE rowid = new.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_ocurrence_delete
+    AFTER DELETE ON events_eventocurrence BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_response_insert
+    AFTER INSERT ON events_responseocurrence BEGIN
+        UPDATE {SEARCH_TABLE} SET response_description = new.description
+        WHERE rowid = new.ocurrence_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_response_update
+    AFTER UPDATE OF description, ocurrence_id ON events_responseocurrence BEGIN
+        UPDATE {SEARCH_TABLE} SET response_description = ''
+        WHERE rowid = old.ocurrence_id;
+        UPDATE {SEARCH_TABLE} SET response_description = new.description
+        WHERE rowid = new.ocurrence_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_response_delete
+    AFTER DELETE ON events_responseocurrence BEGIN
+        UPDATE {SEARCH_TABLE} SET response_description = ''
+        WHERE rowid = old.ocurrence_id;
+    END
+    """,
+]
+
+SQLITE_UNINSTALL = [
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_{name}"
+    for name in (
+        "ocurrence_insert",
+        "ocurrence_update",
+        "ocurrence_delete",
+        "response_insert",
+        "response_update",
+        "response_delete",
+    )
+] + [f"DROP TABLE IF EXISTS {SEARCH_TABLE}"]
+
+SQLITE_REBUILD = [
+    f"DELETE FROM {SEARCH_TABLE}",
+    f"""
+    INSERT INTO {SEARCH_TABLE} (
+        rowid, description_ocurrence, immediate_action, response_description
+    )
+    SELECT o.id, o.description_ocurrence, o.immediate_action,
+           COALESCE(r.description, '')
+    FROM events_eventocurrence o
+    LEFT JOIN events_responseocurrence r ON r.ocurrence_id = o.id
+    """,
+]
+
+# Portuguese stemming with accent folding: the `portuguese` configuration
+# with `unaccent` applied before the stemmer.
+POSTGRESQL_DOCUMENT = """
+    setweight(to_tsvector('pt_unaccent', coalesce({ocurrence}.description_ocurrence, '')), 'A')
+    || setweight(to_tsvector('pt_unaccent', coalesce({ocurrence}.immediate_action, '')), 'B')
+    || setweight(to_tsvector('pt_unaccent', coalesce({response}, '')), 'B')
+"""
+
+POSTGRESQL_INSTALL = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    """
+    DO $$ BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'pt_unaccent') THEN
+            CREATE TEXT SEARCH CONFIGURATION pt_unaccent (COPY = portuguese);
+            ALTER TEXT SEARCH CONFIGURATION pt_unaccent
+                ALTER MAPPING FOR hword, hword_part, word
+                WITH unaccent, portuguese_stem;
+        END IF;
+    END $$
+    """,
+    f"""
+    CREATE TABLE {SEARCH_TABLE} (
+        ocurrence_id bigint PRIMARY KEY
+            REFERENCES events_eventocurrence (id) ON DELETE CASCADE,
+        response_description text NOT NULL DEFAULT '',
+        document tsvector NOT NULL
+    )
+    """,
+    f"CREATE INDEX {SEARCH_TABLE}_document_idx ON {SEARCH_TABLE} USING GIN (document)",
+    f"""
+    CREATE FUNCTION {SEARCH_TABLE}_ocurrence_sync() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO {SEARCH_TABLE} (ocurrence_id, document)
+        VALUES (new.id, {POSTGRESQL_DOCUMENT.format(ocurrence="new", response="''")})
+        ON CONFLICT (ocurrence_id) DO UPDATE SET document =
+            {POSTGRESQL_DOCUMENT.format(ocurrence="new", response=f"{SEARCH_TABLE}.response_description")};
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_ocurrence_sync
+    AFTER INSERT OR UPDATE OF description_ocurrence, immediate_action
+    ON events_eventocurrence
+    FOR EACH ROW EXECUTE FUNCTION {SEARCH_TABLE}_ocurrence_sync()
+    """,
+    f"""
+    CREATE FUNCTION {SEARCH_TABLE}_response_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE {SEARCH_TABLE} s SET response_description = '', document =
+                {POSTGRESQL_DOCUMENT.format(ocurrence="o", response="''")}
+            FROM events_eventocurrence o
+            WHERE s.ocurrence_id = old.ocurrence_id AND o.id = old.ocurrence_id;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE {SEARCH_TABLE} s SET response_description = new.description, document =
+                {POSTGRESQL_DOCUMENT.format(ocurrence="o", response="new.description")}
+            FROM events_eventocurrence o
+            WHERE s.ocurrence_id = new.ocurrence_id AND o.id = new.ocurrence_id;
+        END IF;
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_response_sync
+    AFTER INSERT OR DELETE OR UPDATE OF description, ocurrence_id
+    ON events_responseocurrence
+    FOR EACH ROW EXECUTE FUNCTION {SEARCH_TABLE}_response_sync()
+    """,
+]
+
+POSTGRESQL_UNINSTALL = [
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_response_sync ON events_responseocurrence",
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ocurrence_sync ON events_eventocurrence",
+    f"DROP FUNCTION IF EXISTS {SEARCH_TABLE}_response_sync()",
+    f"DROP FUNCTION IF EXISTS {SEARCH_TABLE}_ocurrence_sync()",
+    f"DROP TABLE IF EXISTS {SEARCH_TABLE}",
+]
+
+POSTGRESQL_REBUILD = [
+    f"DELETE FROM {SEARCH_TABLE}",
+    f"""
+    INSERT INTO {SEARCH_TABLE} (ocurrence_id, response_description, document)
+    SELECT o.id, coalesce(r.description, ''),
+           {POSTGRESQL_DOCUMENT.format(ocurrence="o", response="r.description")}
+    FROM events_eventocurrence o
+    LEFT JOIN events_responseocurrence r ON r.ocurrence_id = o.id
+    """,
+]
+
+STATEMENTS = {
+    "sqlite": (SQLITE_INSTALL, SQLITE_UNINSTALL, SQLITE_REBUILD),
+    "postgresql": (POSTGRESQL_INSTALL, POSTGRESQL_UNINSTALL, POSTGRESQL_REBUILD),
+}
+
+
+def execute(schema_editor, statements):
+    with schema_editor.connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def install(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor in STATEMENTS:
+        install_sql, _, rebuild_sql = STATEMENTS[vendor]
+        execute(schema_editor, install_sql + rebuild_sql)
+
+
+def uninstall(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor in STATEMENTS:
+        execute(schema_editor, STATEMENTS[vendor][1])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0013_ocurrence_status'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
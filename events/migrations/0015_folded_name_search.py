@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:59
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+def fold(value):
+    # Snapshot of `utils.text.fold` at the time of this migration.
+    decomposed = unicodedata.normalize('NFKD', value or '')
+    return ''.join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold()
+
+
+def backfill(apps, schema_editor):
+    """Fill `patient_name_search` from `patient_name`, 1000 rows per query."""
+    manager = apps.get_model('events', 'EventPatient')._base_manager
+    last_pk = 0
+    while True:
+        rows = list(
+            manager.filter(pk__gt=last_pk)
+            .order_by('pk')
+            .only('pk', 'patient_name', 'patient_name_search')[:1000]
+        )
+        if not rows:
+            return
+        last_pk = rows[-1].pk
+        for row in rows:
+            row.patient_name_search = fold(row.patient_name)
+        manager.bulk_update(rows, ['patient_name_search'])
+
+
+def create_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS events_patient_name_search_trgm '
+        'ON events_eventpatient USING gin (patient_name_search gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS events_patient_name_search_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0014_ocurrence_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedeventpatient',
+            name='patient_name_search',
+            field=models.CharField(default='', editable=False, help_text='Nome do paciente normalizado para busca, sem acentos.', max_length=225),
+        ),
+        migrations.AddField(
+            model_name='eventpatient',
+            name='patient_name_search',
+            field=models.CharField(default='', editable=False, help_text='Nome do paciente normalizado para busca, sem acentos.', max_length=225),
+        ),
+        migrations.AddIndex(
+            model_name='eventpatient',
+            index=models.Index(fields=['patient_name_search'], name='events_even_patient_95e24e_idx'),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classifications', '0003_soft_delete_partial_indexes'),
+        ('events', '0015_folded_name_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeadlineRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('days', models.PositiveSmallIntegerField(help_text='Prazo da resposta, em dias')),
+                ('damage_classification', models.ForeignKey(help_text='Classificação do Dano', on_delete=django.db.models.deletion.CASCADE, related_name='deadline_rules', to='classifications.damageclassification')),
+                ('ocurrence_classification', models.ForeignKey(help_text='Classificação da Ocorrência', on_delete=django.db.models.deletion.CASCADE, related_name='deadline_rules', to='classifications.ocurrenceclassification')),
+            ],
+            options={
+                'verbose_name': 'Regra de Prazo',
+                'verbose_name_plural': 'Regras de Prazo',
+                'ordering': ['ocurrence_classification', 'damage_classification'],
+                'constraints': [models.UniqueConstraint(fields=('ocurrence_classification', 'damage_classification'), name='unique_deadline_rule')],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.db import migrations
+
+# Days formerly hard-coded in CalculateDeadline.calculate. The deadline
+# of a pair was the sum of both, and pairs adding up to 0 had none.
+LEGACY_OCURRENCE_DAYS = {
+    'Improcedente': 1,
+    'Não conformidade': 15,
+    'Circustância de Risco': 15,
+    'Quebra de contratualização': 15,
+    'Desvio da Qualidade': 15,
+    'Incidente sem dano': 10,
+}
+LEGACY_DAMAGE_DAYS = {
+    'Nenhum': 15,
+    'Dano Leve': 7,
+    'Dano Moderado': 5,
+    'Dano Grave': 3,
+    'Dano Óbito': 15,
+}
+
+
+def seed_rules(apps, schema_editor):
+    DeadlineRule = apps.get_model('events', 'DeadlineRule')
+    OcurrenceClassification = apps.get_model(
+        'classifications', 'OcurrenceClassification'
+    )
+    DamageClassification = apps.get_model('classifications', 'DamageClassification')
+
+    damages = list(DamageClassification._base_manager.values_list('id', 'classification'))
+    rules = []
+    for ocurrence_id, ocurrence in OcurrenceClassification._base_manager.values_list(
+        'id', 'classification'
+    ):
+        for damage_id, damage in damages:
+            days = LEGACY_OCURRENCE_DAYS.get(ocurrence, 0) + LEGACY_DAMAGE_DAYS.get(damage, 0)
+            if days > 0:
+                rules.append(
+                    DeadlineRule(
+                        ocurrence_classification_id=ocurrence_id,
+                        damage_classification_id=damage_id,
+                        days=days,
+                    )
+                )
+    DeadlineRule.objects.bulk_create(rules, batch_size=500, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classifications', '0003_soft_delete_partial_indexes'),
+        ('events', '0016_deadline_rule'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_rules, migrations.RunPython.noop),
+    ]
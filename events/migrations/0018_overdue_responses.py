@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Snapshot of the full-text search triggers of the response table, from
+# migration 0014.
+RESPONSE_SEARCH_TRIGGERS = [
+    """
+    CREATE TRIGGER events_ocurrence_search_response_insert
+    AFTER INSERT ON events_responseocurrence BEGIN
+        UPDATE events_ocurrence_search SET response_description = new.description
+        WHERE rowid = new.ocurrence_id;
+    END
+    """,
+    """
+    CREATE TRIGGER events_ocurrence_search_response_update
+    AFTER UPDATE OF description, ocurrence_id ON events_responseocurrence BEGIN
+        UPDATE events_ocurrence_search SET response_description = ''
+        WHERE rowid = old.ocurrence_id;
+        UPDATE events_ocurrence_search SET response_description = new.description
+        WHERE rowid = new.ocurrence_id;
+    END
+    """,
+    """
+    CREATE TRIGGER events_ocurrence_search_response_delete
+    AFTER DELETE ON events_responseocurrence BEGIN
+        UPDATE events_ocurrence_search SET response_description = ''
+        WHERE rowid = old.ocurrence_id;
+    END
+    """,
+]
+
+
+def reinstall_search(apps, schema_editor):
+    # SQLite rebuilds the response table to add the column, dropping the
+    # full-text search triggers attached to it.
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for name in ('insert', 'update', 'delete'):
+            cursor.execute(
+                f'DROP TRIGGER IF EXISTS events_ocurrence_search_response_{name}'
+            )
+        for statement in RESPONSE_SEARCH_TRIGGERS:
+            cursor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classifications', '0003_soft_delete_partial_indexes'),
+        ('departments', '0006_folded_name_search'),
+        ('events', '0017_seed_deadline_rules'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, reinstall_search),
+        migrations.CreateModel(
+            name='DepartmentOverdueCounter',
+            fields=[
+                ('department', models.OneToOneField(help_text='Setor', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='overdue_counter', serialize=False, to='departments.department')),
+                ('overdue', models.PositiveIntegerField(default=0, help_text='Tratativas com prazo vencido')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Tratativas Vencidas do Setor',
+                'verbose_name_plural': 'Tratativas Vencidas dos Setores',
+                'ordering': ['department'],
+            },
+        ),
+        migrations.AddField(
+            model_name='responseocurrence',
+            name='is_overdue',
+            field=models.BooleanField(default=False, editable=False, help_text='Prazo vencido ?'),
+        ),
+        migrations.AddIndex(
+            model_name='responseocurrence',
+            index=models.Index(condition=models.Q(('resolved', False)), fields=['deadline_response'], name='events_response_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='responseocurrence',
+            index=models.Index(condition=models.Q(('is_overdue', True)), fields=['deadline_response'], name='events_response_overdue_idx'),
+        ),
+        migrations.RunPython(reinstall_search, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:24
+
+from django.db import migrations, models
+from django.db.models import Case, Count, Min, Q, Value, When
+from django.utils import timezone
+
+
+def merge(apps, schema_editor):
+    """
+    Merge the non-deleted patients sharing an attendance and record before
+    the constraint is added. The first patient of each pair is kept, the
+    occurrences of the others are re-pointed to it and the others are soft
+    deleted, 500 pairs at a time.
+    """
+    EventPatient = apps.get_model('events', 'EventPatient')
+    EventOcurrence = apps.get_model('events', 'EventOcurrence')
+    patients = EventPatient._base_manager
+    while True:
+        groups = list(
+            patients.filter(is_deleted=False)
+            .values('attendance', 'record')
+            .annotate(keep=Min('pk'), patients=Count('pk'))
+            .filter(patients__gt=1)
+            .order_by('attendance', 'record')[:500]
+        )
+        if not groups:
+            return
+        keep = {(group['attendance'], group['record']): group['keep'] for group in groups}
+        condition = Q()
+        for attendance, record in keep:
+            condition |= Q(attendance=attendance, record=record)
+        duplicates = {
+            pk: keep[(attendance, record)]
+            for pk, attendance, record in patients.filter(condition, is_deleted=False)
+            .exclude(pk__in=keep.values())
+            .values_list('pk', 'attendance', 'record')
+        }
+        EventOcurrence._base_manager.filter(patient_id__in=duplicates).update(
+            patient_id=Case(
+                *[
+                    When(patient_id=duplicate, then=Value(kept))
+                    for duplicate, kept in duplicates.items()
+                ]
+            )
+        )
+        patients.filter(pk__in=duplicates).update(
+            is_deleted=True, updated_at=timezone.now()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0018_overdue_responses'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='eventpatient',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('attendance', 'record'), name='unique_active_patient'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0019_unique_active_patient'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='Chave da submissão', max_length=64, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField(help_text='Validade da chave')),
+                ('ocurrence', models.ForeignKey(help_text='Ocorrência criada pela submissão', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='idempotency_keys', to='events.eventocurrence')),
+            ],
+            options={
+                'verbose_name': 'Chave de Idempotência',
+                'verbose_name_plural': 'Chaves de Idempotência',
+                'indexes': [models.Index(fields=['expires_at'], name='events_idem_expires_e79710_idx')],
+            },
+        ),
+    ]
@@ -1,5 +1,9 @@
 """ INIT """
 # flake8: noqa
-from .event_ocurrence_models import EventOcurrence
+from .archive_models import ArchivedEventOcurrence, ArchivedEventPatient
+from .deadline_rule_models import DeadlineRule
+from .event_ocurrence_models import EventOcurrence, OcurrenceStatus
 from .event_patient_models import EventPatient
-from .response_ocurrence_models import ResponseOcurrence
\ No newline at end of file
+from .idempotency_key_models import IdempotencyKey
+from .overdue_counter_models import DepartmentOverdueCounter
+from .response_ocurrence_models import ResponseOcurrence
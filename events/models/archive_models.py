@@ -0,0 +1,11 @@
+"""Archive models for soft deleted events and patients."""
+
+from events.models.event_ocurrence_models import EventOcurrence
+from events.models.event_patient_models import EventPatient
+from utils.archive import archive_model
+
+ArchivedEventOcurrence = archive_model(EventOcurrence, __name__)
+"""Occurrences soft deleted long ago, moved out of `events_eventocurrence`."""
+
+ArchivedEventPatient = archive_model(EventPatient, __name__)
+"""Patients soft deleted long ago, moved out of `events_eventpatient`."""
@@ -0,0 +1,81 @@
+"""Models for response deadline rules"""
+from django.db import models
+
+from classifications.models import (
+    DamageClassification,
+    OcurrenceClassification,
+)
+from utils import mixins
+
+
+class DeadlineRule(mixins.TimestampModelMixin):
+    """
+    Model representing the response deadline of a pair of classifications.
+
+    Each rule sets how many days a response has for occurrences with the
+    given occurrence and damage classifications. Pairs without a rule,
+    such as those of classifications added later, get the legacy days of
+    their classification names, so a rule is only needed to override them.
+
+    The rules are compiled into an in-memory table by
+    `events.services.response_ocurrence_services.deadline_rules`, which
+    reloads when any rule or classification changes.
+
+    Inherits from:
+        TimestampModelMixin: Provides created_at and updated_at timestamps.
+
+    Attributes:
+        ocurrence_classification (ForeignKey): The classification of the occurrence.
+        damage_classification (ForeignKey): The classification of the damage.
+        days (PositiveSmallIntegerField): The number of days to respond.
+
+    Meta:
+        ordering (list): Default ordering by occurrence and damage classification.
+        verbose_name (str): Human-readable name for the model.
+        verbose_name_plural (str): Plural form of the human-readable name.
+        constraints (list): A single rule per pair of classifications.
+
+    Methods:
+        __str__():
+            Returns the pair of classifications and the number of days.
+    """
+
+    ocurrence_classification = models.ForeignKey(
+        OcurrenceClassification,
+        on_delete=models.CASCADE,
+        help_text='Classificação da Ocorrência',
+        related_name='deadline_rules',
+    )
+    damage_classification = models.ForeignKey(
+        DamageClassification,
+        on_delete=models.CASCADE,
+        help_text='Classificação do Dano',
+        related_name='deadline_rules',
+    )
+    days = models.PositiveSmallIntegerField(
+        help_text='Prazo da resposta, em dias'
+    )
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta options for DeadlineRule model"""
+        ordering = ['ocurrence_classification', 'damage_classification']
+        verbose_name = 'Regra de Prazo'
+        verbose_name_plural = 'Regras de Prazo'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['ocurrence_classification', 'damage_classification'],
+                name='unique_deadline_rule',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of the rule.
+
+        Returns:
+            str: The classifications of the rule and its number of days.
+        """
+        return (
+            f"{self.ocurrence_classification} / "
+            f"{self.damage_classification}: {self.days} dias"
+        )
@@ -7,6 +7,13 @@ from events.models.event_patient_models import EventPatient
 from utils import mixins
 
 
+class OcurrenceStatus(models.TextChoices):
+    """Response state of an occurrence, derived from its `ResponseOcurrence`."""
+    PENDING = 'pending', 'Pendente'
+    RESPONDED = 'responded', 'Respondida'
+    RESOLVED = 'resolved', 'Resolvida'
+
+
 class EventOcurrence(  # type: ignore[misc]
     mixins.TimestampModelMixin, mixins.SoftDeleteModelMixin
 ):
@@ -30,6 +37,8 @@ class EventOcurrence(  # type: ignore[misc]
         notified_department (ForeignKey): The department being notified about the event.
         description_ocurrence (TextField): A detailed description of the event.
         immediate_action (TextField): Immediate actions taken following the event.
+        status (CharField): Whether the event is pending, responded or resolved. 
+                            Kept in sync with its `ResponseOcurrence` by `events.signals`.
     
     Meta:
         ordering (list): Default ordering by `created_at`.
@@ -73,6 +82,13 @@ class EventOcurrence(  # type: ignore[misc]
     immediate_action = models.TextField(
         help_text='O que foi realizado após a ocorrência / Ação imediata'
     )
+    status = models.CharField(
+        max_length=10,
+        choices=OcurrenceStatus.choices,
+        default=OcurrenceStatus.PENDING,
+        editable=False,
+        help_text='Situação da tratativa da ocorrência',
+    )
 
     class Meta:  # pylint: disable=too-few-public-methods
         """Meta options for EventOcurrence model."""
@@ -84,6 +100,14 @@ class EventOcurrence(  # type: ignore[misc]
             models.Index(fields=['ocurrence_date']),
             models.Index(fields=['reporting_department']),
             models.Index(fields=['notified_department']),
+            models.Index(fields=['status']),
+            models.Index(
+                fields=['created_at', 'id'],
+                condition=models.Q(
+                    status=OcurrenceStatus.PENDING, is_deleted=False
+                ),
+                name='events_ocurrence_pending_idx',
+            ),
         ]
 
     def __str__(self) -> str:
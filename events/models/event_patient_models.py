@@ -5,6 +5,7 @@ from django.db import models
 from events.models.gender_models import Gender
 from events.models.race_models import Race
 from utils import mixins
+from utils.text import fold
 
 
 class EventPatient(  # type: ignore[misc]
@@ -31,14 +32,18 @@ class EventPatient(  # type: ignore[misc]
         internment_date (DateField): The date the patient was interned.
         genere (ForeignKey): A reference to the `Gender` model, nullable.
         race (ForeignKey): A reference to the `Race` model, nullable.
+        patient_name_search (CharField): The patient name lowercased and without 
+            diacritics, set on save and indexed for accent-insensitive searches.
 
     Meta:
         ordering (list): Default ordering by `created_at`.
         verbose_name (str): Human-readable name for the model in singular form.
         verbose_name_plural (str): Plural form of the human-readable name.
         indexes (list): Database indexes for optimizing queries on specified fields.
+        constraints (list): A single non-deleted patient per attendance and record.
     
     Methods:
+        save(): Refreshes `patient_name_search` before saving.
         __str__(): Returns a string representation of the patient, 
                    including the name and attendance number.
     """
@@ -69,6 +74,12 @@ class EventPatient(  # type: ignore[misc]
         null=True,
         blank=True
     )
+    patient_name_search = models.CharField(
+        max_length=225,
+        default='',
+        editable=False,
+        help_text='Nome do paciente normalizado para busca, sem acentos.',
+    )
 
     class Meta:  # pylint: disable=too-few-public-methods
         """Meta options for Event Patient model."""
@@ -83,8 +94,31 @@ class EventPatient(  # type: ignore[misc]
             models.Index(fields=['internment_date']),
             models.Index(fields=['genere']),
             models.Index(fields=['race']),
+            models.Index(fields=['patient_name_search']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['attendance', 'record'],
+                condition=models.Q(is_deleted=False),
+                name='unique_active_patient',
+            ),
         ]
 
+    def save(self, *args, **kwargs) -> None:
+        """
+        Override the save method to refresh `patient_name_search` from
+        `patient_name`.
+
+        Args:
+            *args: Additional positional arguments to be passed to the parent save method.
+            **kwargs: Additional keyword arguments to be passed to the parent save method.
+        """
+        self.patient_name_search = fold(self.patient_name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'patient_name' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'patient_name_search'}
+        super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         """
         Return a string representation of the event patient.
@@ -0,0 +1,64 @@
+"""Models for idempotent submission of occurrences"""
+from django.db import models
+
+from events.models.event_ocurrence_models import EventOcurrence
+
+
+class IdempotencyKey(models.Model):
+    """
+    Model recording the occurrence created by a submission token.
+
+    The intake form carries a random token, or clients send it in the
+    `Idempotency-Key` header. The key is stored in the same transaction as
+    the occurrence, so a replayed submission finds it and gets the original
+    occurrence instead of creating another one. Keys expire after
+    `IDEMPOTENCY_KEY_TTL_HOURS` and are pruned by the
+    `prune_idempotency_keys` command.
+
+    Attributes:
+        key (CharField): The token of the submission, unique.
+        ocurrence (ForeignKey): The occurrence created by the submission.
+        created_at (DateTimeField): When the submission was received.
+        expires_at (DateTimeField): When a replay stops being recognized.
+
+    Meta:
+        verbose_name (str): Human-readable name for the model.
+        verbose_name_plural (str): Plural form of the human-readable name.
+        indexes (list): An index on `expires_at`, used for pruning.
+
+    Methods:
+        __str__():
+            Returns the key.
+    """
+
+    key = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text='Chave da submissão'
+    )
+    ocurrence = models.ForeignKey(
+        EventOcurrence,
+        on_delete=models.CASCADE,
+        null=True,
+        help_text='Ocorrência criada pela submissão',
+        related_name='idempotency_keys',
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(help_text='Validade da chave')
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta options for IdempotencyKey model"""
+        verbose_name = 'Chave de Idempotência'
+        verbose_name_plural = 'Chaves de Idempotência'
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of the key.
+
+        Returns:
+            str: The key.
+        """
+        return self.key
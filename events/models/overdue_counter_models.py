@@ -0,0 +1,57 @@
+"""Models for the overdue responses of each department"""
+from django.db import models
+
+from departments.models import Department
+
+
+class DepartmentOverdueCounter(models.Model):
+    """
+    Model storing how many responses of a department are past their deadline.
+
+    The counters are refreshed by the `sweep_overdue_responses` command, so
+    pages showing them read a row per department instead of scanning the
+    responses. A response counts for the department notified by its
+    occurrence.
+
+    Attributes:
+        department (OneToOneField): The department being counted.
+        overdue (PositiveIntegerField): The number of overdue responses.
+        updated_at (DateTimeField): When the counter was last refreshed.
+
+    Meta:
+        ordering (list): Default ordering by department.
+        verbose_name (str): Human-readable name for the model.
+        verbose_name_plural (str): Plural form of the human-readable name.
+
+    Methods:
+        __str__():
+            Returns the department and its number of overdue responses.
+    """
+
+    department = models.OneToOneField(
+        Department,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        help_text='Setor',
+        related_name='overdue_counter',
+    )
+    overdue = models.PositiveIntegerField(
+        default=0,
+        help_text='Tratativas com prazo vencido'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta options for DepartmentOverdueCounter model"""
+        ordering = ['department']
+        verbose_name = 'Tratativas Vencidas do Setor'
+        verbose_name_plural = 'Tratativas Vencidas dos Setores'
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of the counter.
+
+        Returns:
+            str: The department and its number of overdue responses.
+        """
+        return f"{self.department}: {self.overdue} tratativas vencidas"
@@ -50,6 +50,11 @@ class ResponseOcurrence(
         default=False,
         help_text='Resolvido ?'
     )
+    is_overdue = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text='Prazo vencido ?'
+    )
     send_manager = models.BooleanField(
         default=False,
         help_text='Enviado para o gestor ?'
@@ -90,6 +95,16 @@ class ResponseOcurrence(
             models.Index(fields=['incident_classification']),
             models.Index(fields=['ocurrence_classification']),
             models.Index(fields=['damage_classification']),
+            models.Index(
+                fields=['deadline_response'],
+                condition=models.Q(resolved=False),
+                name='events_response_open_idx',
+            ),
+            models.Index(
+                fields=['deadline_response'],
+                condition=models.Q(is_overdue=True),
+                name='events_response_overdue_idx',
+            ),
         ]
 
     def __str__(self) -> str:
@@ -113,26 +128,20 @@ class ResponseOcurrence(
         Override the save method to calculate the deadline automatically 
         if the 'deadline_response' field is not set.
 
-        This method calculates the response deadline based on predefined 
-        business logic and assigns it to the 'deadline_response' field before 
-        saving the model instance.
+        This method calculates the response deadline from the `DeadlineRule` 
+        of the classifications, without loading them, and assigns it to the 
+        'deadline_response' field before saving the model instance.
 
         Args:
             *args: Additional positional arguments to be passed to the parent save method.
             **kwargs: Additional keyword arguments to be passed to the parent save method.
         """
-        ocurrence_classification = self.ocurrence.classification
-        damage_classification = self.damage.classification
-
-        # Use as instâncias para calcular o prazo
-        calculate_deadline = CalculateDeadline(
-            ocurrence=ocurrence_classification,
-            damage=damage_classification
-        )
-    
-        days_of_response = calculate_deadline.calculate()
         if not self.deadline_response:
-            days_of_response = self.calculate_deadline.calculate()
+            calculate_deadline = CalculateDeadline(
+                self.ocurrence_classification_id,
+                self.damage_classification_id,
+            )
+            days_of_response = calculate_deadline.calculate()
             if days_of_response > 0:
                 self.deadline_response = timezone.now().date() + timedelta(days=days_of_response)
         super().save(*args, **kwargs)
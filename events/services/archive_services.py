@@ -0,0 +1,127 @@
+"""Service to archive and restore soft deleted rows"""
+from datetime import timedelta
+
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from departments.models import ArchivedDepartment, Department
+from events.models.archive_models import (
+    ArchivedEventOcurrence,
+    ArchivedEventPatient,
+)
+from events.models.event_ocurrence_models import EventOcurrence
+from events.models.event_patient_models import EventPatient
+from utils import archive
+
+
+def archivable_ocurrences(cutoff):
+    """
+    Occurrences soft deleted before `cutoff` without a response.
+
+    Occurrences with a `ResponseOcurrence` stay in place, since the
+    response protects them.
+    """
+    return EventOcurrence.all_objects.filter(
+        is_deleted=True,
+        updated_at__lt=cutoff,
+        response_ocurrence__isnull=True,
+    )
+
+
+def archivable_patients(cutoff):
+    """Patients soft deleted before `cutoff` no longer referenced by an occurrence."""
+    return EventPatient.all_objects.filter(
+        is_deleted=True, updated_at__lt=cutoff
+    ).exclude(
+        Exists(EventOcurrence.all_objects.filter(patient=OuterRef("pk")))
+    )
+
+
+def archivable_departments(cutoff):
+    """
+    Departments soft deleted before `cutoff` no longer referenced by an
+    occurrence.
+
+    Archiving a department deletes its user memberships and visibility
+    entries by cascade. A soft deleted department is already hidden from
+    its users and from the visibility filters, so they are dropped rather
+    than archived, and a restored department starts without members. The
+    cached memberships are invalidated by the `post_delete` receiver of
+    `accounts.signals`. Its overdue counter is recomputed by
+    `refresh_counters` and needs no archive either.
+    """
+    return Department.all_objects.filter(
+        is_deleted=True, updated_at__lt=cutoff
+    ).exclude(
+        Exists(
+            EventOcurrence.all_objects.filter(
+                reporting_department=OuterRef("pk")
+            )
+        )
+    ).exclude(
+        Exists(
+            EventOcurrence.all_objects.filter(
+                notified_department=OuterRef("pk")
+            )
+        )
+    )
+
+
+ARCHIVES = {
+    "events.EventOcurrence": (
+        EventOcurrence, ArchivedEventOcurrence, archivable_ocurrences
+    ),
+    "events.EventPatient": (
+        EventPatient, ArchivedEventPatient, archivable_patients
+    ),
+    "departments.Department": (
+        Department, ArchivedDepartment, archivable_departments
+    ),
+}
+"""
+Archivable models, in the order they are archived.
+
+Occurrences go first, so the patients and departments they referenced
+become archivable in the same run.
+"""
+
+
+def archive_soft_deleted(label, days, batch_size, max_batches=None):
+    """
+    Move rows of a model soft deleted more than `days` ago to its archive.
+
+    Args:
+        label (str): The model label, one of `ARCHIVES`.
+        days (int): Minimum age, in days, of the soft delete.
+        batch_size (int): Rows moved per transaction.
+        max_batches (int, optional): Stop after this many batches. Defaults to no limit.
+
+    Yields:
+        int: The number of rows moved by each batch.
+    """
+    model, archived_model, archivable = ARCHIVES[label]
+    cutoff = timezone.now() - timedelta(days=days)
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        moved = archive.archive_batch(
+            model, archived_model, archivable(cutoff), batch_size
+        )
+        if not moved:
+            return
+        batches += 1
+        yield moved
+
+
+def restore_archived(label, pks) -> int:
+    """
+    Move archived rows of a model back to its table.
+
+    Args:
+        label (str): The model label, one of `ARCHIVES`.
+        pks (Iterable[int]): The primary keys of the archived rows.
+
+    Returns:
+        int: The number of rows restored.
+    """
+    model, archived_model, _ = ARCHIVES[label]
+    return archive.restore_rows(model, archived_model, pks)
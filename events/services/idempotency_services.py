@@ -0,0 +1,105 @@
+"""Service for idempotent submission of occurrences"""
+import re
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from events.models.idempotency_key_models import IdempotencyKey
+
+KEY_RE = re.compile(r"^[A-Za-z0-9_.:-]{8,64}$")
+HEADER = "Idempotency-Key"
+FIELD = "idempotency_key"
+
+
+def new_key() -> str:
+    """Return a random key for a new submission."""
+    return uuid.uuid4().hex
+
+
+def key_of(request):
+    """
+    Return the idempotency key of a request.
+
+    Taken from the `Idempotency-Key` header, or from the hidden
+    `idempotency_key` field of the form.
+
+    Returns:
+        str | None: The key, None when the request has none.
+
+    Raises:
+        ValueError: If the key is malformed.
+    """
+    key = request.headers.get(HEADER) or request.POST.get(FIELD)
+    if not key:
+        return None
+    if not KEY_RE.match(key):
+        raise ValueError(key)
+    return key
+
+
+def replayed(key: str):
+    """
+    Return the occurrence ID already created with a key, if it is still valid.
+
+    Args:
+        key (str): The idempotency key.
+
+    Returns:
+        int | None: The ID of the occurrence, None if the key is new or expired.
+    """
+    return (
+        IdempotencyKey.objects.filter(
+            key=key, expires_at__gt=timezone.now(), ocurrence__isnull=False
+        )
+        .values_list("ocurrence_id", flat=True)
+        .first()
+    )
+
+
+def claim(key: str) -> IdempotencyKey:
+    """
+    Store a key, to be called in the transaction creating its occurrence.
+
+    An expired key is replaced. A key stored concurrently by another
+    submission makes the `INSERT` fail with `IntegrityError` once that
+    submission commits, so the caller can return its occurrence instead.
+
+    Args:
+        key (str): The idempotency key.
+
+    Returns:
+        IdempotencyKey: The stored key, to be linked to the occurrence.
+    """
+    now = timezone.now()
+    IdempotencyKey.objects.filter(key=key, expires_at__lte=now).delete()
+    return IdempotencyKey.objects.create(
+        key=key,
+        expires_at=now + timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS),
+    )
+
+
+def prune(batch_size=1000, max_batches=None):
+    """
+    Delete the expired keys, in batches scanning the index on `expires_at`.
+
+    Args:
+        batch_size (int): The number of keys per batch.
+        max_batches (int, optional): Stop after this many batches. Defaults to no limit.
+
+    Yields:
+        int: The number of keys deleted by each batch.
+    """
+    now = timezone.now()
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        pks = list(
+            IdempotencyKey.objects.filter(expires_at__lte=now)
+            .order_by("expires_at")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            return
+        batches += 1
+        yield IdempotencyKey.objects.filter(pk__in=pks).delete()[0]
@@ -0,0 +1,215 @@
+"""Service for batch ingestion of occurrences from external systems"""
+import json
+from functools import partial
+from itertools import islice
+
+from django.db import DatabaseError, transaction
+
+from departments.models import Department
+from departments.services import visibility_services
+from events.forms.ingestion_forms import OcurrenceRecordForm, PatientRecordForm
+from events.models.event_ocurrence_models import EventOcurrence
+from events.models.gender_models import Gender
+from events.models.race_models import Race
+from events.services import patient_services
+from utils.cache import invalidate_tags
+from utils.text import fold
+
+
+class ReferenceLookup:
+    """
+    Preloaded table of the departments, genders and races ingested
+    records may refer to.
+
+    Each kind is loaded with a single query and indexed by primary key and
+    by accent-folded name, so records can refer to them either way
+    without a query per record.
+
+    Methods:
+        resolve(kind, value): Returns the primary key a record refers to.
+    """
+
+    SOURCES = {
+        "department": (Department.objects, "name"),
+        "gender": (Gender.objects, "name"),
+        "race": (Race.objects, "name"),
+    }
+
+    def __init__(self):
+        self.tables = {}
+        for kind, (manager, field) in self.SOURCES.items():
+            table = {}
+            for pk, name in manager.values_list("pk", field):
+                table[pk] = pk
+                table[fold(name)] = pk
+            self.tables[kind] = table
+
+    def resolve(self, kind: str, value):
+        """
+        Return the primary key a record refers to.
+
+        Args:
+            kind (str): One of "department", "gender" or "race".
+            value (int | str): A primary key, possibly as a string, or a name,
+                case and accents ignored.
+
+        Returns:
+            int: The primary key.
+
+        Raises:
+            KeyError: If nothing matches the value.
+        """
+        key = fold(str(value)).strip()
+        if key.isdigit():
+            key = int(key)
+        return self.tables[kind][key]
+
+
+def _errors(form, prefix=""):
+    return {f"{prefix}{field}": list(errors) for field, errors in form.errors.items()}
+
+
+def _resolve(lookup, errors, field, kind, value, required=True):
+    if value in (None, ""):
+        if required:
+            errors[field] = ["Este campo é obrigatório."]
+        return None
+    try:
+        return lookup.resolve(kind, value)
+    except KeyError:
+        errors[field] = [f"Registro não encontrado: {value}."]
+        return None
+
+
+def parse_record(line: str, lookup: ReferenceLookup):
+    """
+    Validate a line of NDJSON and build its unsaved objects.
+
+    Args:
+        line (str): A JSON object describing an occurrence, with its patient
+            in an optional `patient` object.
+        lookup (ReferenceLookup): The table resolving departments, genders and races.
+
+    Returns:
+        tuple[EventOcurrence | None, EventPatient | None, dict]: The occurrence
+        and patient to be inserted, and the errors by field (empty when valid).
+    """
+    try:
+        data = json.loads(line)
+    except ValueError:
+        return None, None, {"__all__": ["JSON inválido."]}
+    if not isinstance(data, dict):
+        return None, None, {"__all__": ["Cada linha deve ser um objeto JSON."]}
+
+    patient_data = data.get("patient")
+    if patient_data is not None and not isinstance(patient_data, dict):
+        return None, None, {"patient": ["Deve ser um objeto JSON."]}
+    data.setdefault("patient_involved", patient_data is not None)
+
+    form = OcurrenceRecordForm(data)
+    errors = {} if form.is_valid() else _errors(form)
+    ocurrence = form.instance
+    ocurrence.reporting_department_id = _resolve(
+        lookup, errors, "reporting_department", "department",
+        data.get("reporting_department"),
+    )
+    ocurrence.notified_department_id = _resolve(
+        lookup, errors, "notified_department", "department",
+        data.get("notified_department"),
+    )
+
+    patient = None
+    if form.cleaned_data.get("patient_involved"):
+        if patient_data is None:
+            errors["patient"] = ["Informe o paciente envolvido."]
+        else:
+            patient_form = PatientRecordForm(patient_data)
+            if not patient_form.is_valid():
+                errors.update(_errors(patient_form, prefix="patient."))
+            patient = patient_form.instance
+            patient.patient_name_search = fold(patient.patient_name)
+            patient.genere_id = _resolve(
+                lookup, errors, "patient.genere", "gender",
+                patient_data.get("genere"), required=False,
+            )
+            patient.race_id = _resolve(
+                lookup, errors, "patient.race", "race",
+                patient_data.get("race"), required=False,
+            )
+    return ocurrence, patient, errors
+
+
+def _insert(records) -> None:
+    """
+    Upsert the patients, then insert the occurrences of a chunk of records.
+    """
+    patients = iter(
+        patient_services.upsert_patients(
+            [patient for _, _, patient in records if patient]
+        )
+    )
+    ocurrences = []
+    for _, ocurrence, patient in records:
+        if patient:
+            ocurrence.patient = next(patients)
+        ocurrences.append(ocurrence)
+    EventOcurrence.objects.bulk_create(ocurrences)
+    transaction.on_commit(partial(invalidate_tags, "events"))
+    if visibility_services.is_indexed(EventOcurrence):
+        visibility_services.index_objects(
+            EventOcurrence, [ocurrence.pk for ocurrence in ocurrences]
+        )
+
+
+def ingest(lines, chunk_size=500, lookup=None):
+    """
+    Validate and insert occurrences from NDJSON lines.
+
+    Lines are read `chunk_size` at a time. The valid records of a chunk
+    are inserted with `bulk_create` in a transaction of their own, so an
+    error in the database rolls back that chunk only. Blank lines are
+    skipped. Patients are matched by attendance and record, reusing
+    existing rows. `save()` and `post_save` are bypassed: the search index is
+    kept by database triggers, the status starts as pending and
+    `patient_name_search` is filled here.
+
+    Args:
+        lines (Iterable[str | bytes]): The NDJSON lines, e.g. an open file or request.
+        chunk_size (int): The number of lines per transaction.
+        lookup (ReferenceLookup, optional): The reference table. Defaults to a fresh one.
+
+    Yields:
+        dict: The result of each non-blank line, in order: `line` (1-based)
+        and either `id` of the created occurrence or `errors` by field.
+    """
+    lookup = lookup or ReferenceLookup()
+    numbered = (
+        (number, line.decode() if isinstance(line, bytes) else line)
+        for number, line in enumerate(lines, start=1)
+    )
+    numbered = ((number, line) for number, line in numbered if line.strip())
+    while True:
+        chunk = list(islice(numbered, chunk_size))
+        if not chunk:
+            return
+        results, valid = {}, []
+        for number, line in chunk:
+            ocurrence, patient, errors = parse_record(line, lookup)
+            if errors:
+                results[number] = {"line": number, "errors": errors}
+            else:
+                valid.append((number, ocurrence, patient))
+        try:
+            with transaction.atomic():
+                _insert(valid)
+        except DatabaseError as error:
+            for number, _, _ in valid:
+                results[number] = {
+                    "line": number,
+                    "errors": {"__all__": [f"Lote não gravado: {error}"]},
+                }
+        else:
+            for number, ocurrence, _ in valid:
+                results[number] = {"line": number, "id": ocurrence.pk}
+        for number, _ in chunk:
+            yield results[number]
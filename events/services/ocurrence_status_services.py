@@ -0,0 +1,96 @@
+"""Service to keep the response status of occurrences in sync"""
+from django.db.models import Case, Exists, OuterRef, Value, When
+
+from events.models.event_ocurrence_models import OcurrenceStatus
+
+
+def status_of(response) -> str:
+    """
+    Return the status an occurrence gets from its response.
+
+    Args:
+        response (ResponseOcurrence | None): The response of the occurrence, if any.
+
+    Returns:
+        str: One of `OcurrenceStatus`.
+    """
+    if response is None:
+        return OcurrenceStatus.PENDING
+    if response.resolved:
+        return OcurrenceStatus.RESOLVED
+    return OcurrenceStatus.RESPONDED
+
+
+def sync_status(ocurrence_model, ocurrence_id, response=None) -> int:
+    """
+    Store the status of an occurrence with a single `UPDATE`.
+
+    Args:
+        ocurrence_model (type[EventOcurrence]): The occurrence model.
+        ocurrence_id (int): The primary key of the occurrence.
+        response (ResponseOcurrence, optional): Its response. Defaults to None, for no response.
+
+    Returns:
+        int: The number of rows changed, 0 if the status was already right.
+    """
+    status = status_of(response)
+    return (
+        ocurrence_model._base_manager.filter(pk=ocurrence_id)
+        .exclude(status=status)
+        .update(status=status)
+    )
+
+
+def status_expression(response_model):
+    """
+    Build the expression computing the status of occurrences from their
+    responses, to be used in `QuerySet.update`.
+
+    Args:
+        response_model (type[ResponseOcurrence]): The response model.
+
+    Returns:
+        Case: The status of the occurrence of each row.
+    """
+    responses = response_model._base_manager.filter(ocurrence=OuterRef("pk"))
+    return Case(
+        When(
+            Exists(responses.filter(resolved=True)),
+            then=Value(OcurrenceStatus.RESOLVED),
+        ),
+        When(Exists(responses), then=Value(OcurrenceStatus.RESPONDED)),
+        default=Value(OcurrenceStatus.PENDING),
+    )
+
+
+def backfill_status(ocurrence_model, response_model, batch_size=1000):
+    """
+    Recompute the status of every occurrence, in batches of primary keys.
+
+    Each batch is a single `UPDATE` over a primary key range, committed
+    on its own, so rows are never locked for long. Accepts historical
+    models, so it can run from migrations.
+
+    Args:
+        ocurrence_model (type[EventOcurrence]): The occurrence model.
+        response_model (type[ResponseOcurrence]): The response model.
+        batch_size (int): The number of occurrences per batch.
+
+    Yields:
+        int: The number of occurrences updated by each batch.
+    """
+    expression = status_expression(response_model)
+    queryset = ocurrence_model._base_manager.order_by("pk")
+    last_pk = 0
+    while True:
+        pks = list(
+            queryset.filter(pk__gt=last_pk).values_list("pk", flat=True)[
+                :batch_size
+            ]
+        )
+        if not pks:
+            return
+        last_pk = pks[-1]
+        yield queryset.filter(pk__gte=pks[0], pk__lte=last_pk).update(
+            status=expression
+        )
@@ -0,0 +1,112 @@
+"""Service to flag overdue responses and count them by department"""
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from events.models.overdue_counter_models import DepartmentOverdueCounter
+from events.models.response_ocurrence_models import ResponseOcurrence
+
+
+def _update_in_batches(queryset, batch_size, max_batches, **values):
+    """
+    Update the rows of a queryset in batches of primary keys.
+
+    Each batch selects its keys through the queryset ordering, so the scan
+    follows the index backing it, and is committed on its own.
+
+    Yields:
+        int: The number of rows updated by each batch.
+    """
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return
+        batches += 1
+        yield ResponseOcurrence.objects.filter(pk__in=pks).update(**values)
+
+
+def flag_overdue(today=None, batch_size=1000, max_batches=None):
+    """
+    Flag the open responses whose deadline has passed.
+
+    Scans `events_response_open_idx`, the partial index of the deadlines
+    of unresolved responses, from the oldest deadline up to yesterday.
+
+    Args:
+        today (date, optional): The reference date. Defaults to the local date.
+        batch_size (int): The number of responses per batch.
+        max_batches (int, optional): Stop after this many batches. Defaults to no limit.
+
+    Yields:
+        int: The number of responses flagged by each batch.
+    """
+    today = today or timezone.localdate()
+    queryset = ResponseOcurrence.objects.filter(
+        resolved=False, deadline_response__lt=today, is_overdue=False
+    ).order_by("deadline_response")
+    yield from _update_in_batches(
+        queryset, batch_size, max_batches, is_overdue=True
+    )
+
+
+def clear_overdue(today=None, batch_size=1000, max_batches=None):
+    """
+    Unflag the responses that were resolved or got a later deadline.
+
+    Scans `events_response_overdue_idx`, which only holds flagged responses.
+
+    Args:
+        today (date, optional): The reference date. Defaults to the local date.
+        batch_size (int): The number of responses per batch.
+        max_batches (int, optional): Stop after this many batches. Defaults to no limit.
+
+    Yields:
+        int: The number of responses unflagged by each batch.
+    """
+    today = today or timezone.localdate()
+    queryset = (
+        ResponseOcurrence.objects.filter(is_overdue=True)
+        .filter(
+            Q(resolved=True)
+            | Q(deadline_response__isnull=True)
+            | Q(deadline_response__gte=today)
+        )
+        .order_by("deadline_response")
+    )
+    yield from _update_in_batches(
+        queryset, batch_size, max_batches, is_overdue=False
+    )
+
+
+def refresh_counters() -> int:
+    """
+    Recount the overdue responses of every department.
+
+    Counts the flagged responses of occurrences that are not soft deleted
+    with a single aggregate query, then upserts the counters. Departments
+    left without overdue responses are reset to 0.
+
+    Returns:
+        int: The number of departments with overdue responses.
+    """
+    counts = dict(
+        ResponseOcurrence.objects.filter(
+            is_overdue=True, ocurrence__is_deleted=False
+        )
+        .values_list("ocurrence__notified_department")
+        .annotate(overdue=Count("pk"))
+        .order_by()
+    )
+    DepartmentOverdueCounter.objects.bulk_create(
+        [
+            DepartmentOverdueCounter(department_id=department, overdue=overdue)
+            for department, overdue in counts.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["department"],
+        update_fields=["overdue", "updated_at"],
+    )
+    DepartmentOverdueCounter.objects.exclude(department__in=counts).exclude(
+        overdue=0
+    ).update(overdue=0, updated_at=timezone.now())
+    return len(counts)
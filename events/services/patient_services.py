@@ -0,0 +1,139 @@
+"""Service to keep a single row per patient"""
+from django.db import transaction
+from django.db.models import Case, Count, Min, Q, Value, When
+from django.utils import timezone
+
+from events.models.event_patient_models import EventPatient
+
+UPDATED_FIELDS = ['patient_name', 'birth_date', 'internment_date', 'genere', 'race']
+
+
+def upsert_patient(data: dict):
+    """
+    Return the patient of an attendance and record, creating or updating it.
+
+    The non-deleted patient with the same `attendance` and `record` is
+    reused and updated with the other values, so reporting a new event
+    for a patient does not create another row.
+
+    Args:
+        data (dict): The patient fields, e.g. the `cleaned_data` of `EventPatientForm`.
+
+    Returns:
+        tuple[EventPatient, bool]: The patient and whether it was created.
+    """
+    values = dict(data)
+    return EventPatient.objects.update_or_create(
+        attendance=values.pop('attendance'),
+        record=values.pop('record'),
+        defaults=values,
+    )
+
+
+def upsert_patients(patients: list) -> list:
+    """
+    Save unsaved patients in bulk, reusing the existing rows.
+
+    The existing patients are fetched with a single query and updated with
+    `bulk_update`; the others are inserted with `bulk_create`. Patients
+    repeated in the list are saved once, with the values of the last one.
+    Conflicts on `unique_active_patient` cannot be resolved with
+    `ON CONFLICT`, as the constraint is partial, so a patient inserted
+    concurrently makes the caller's transaction fail instead.
+
+    Args:
+        patients (list[EventPatient]): Unsaved patients, with `patient_name_search` filled.
+
+    Returns:
+        list[EventPatient]: The saved patient of each item of `patients`, in order.
+    """
+    if not patients:
+        return []
+    keys = [(patient.attendance, patient.record) for patient in patients]
+    latest = dict(zip(keys, patients))
+    existing = {
+        (patient.attendance, patient.record): patient
+        for patient in EventPatient.objects.filter(
+            attendance__in={attendance for attendance, _ in latest},
+            record__in={record for _, record in latest},
+        )
+        if (patient.attendance, patient.record) in latest
+    }
+
+    now = timezone.now()
+    for key, patient in existing.items():
+        for field in UPDATED_FIELDS + ['patient_name_search']:
+            attname = EventPatient._meta.get_field(field).attname
+            setattr(patient, attname, getattr(latest[key], attname))
+        patient.updated_at = now
+    if existing:
+        EventPatient.objects.bulk_update(
+            existing.values(), UPDATED_FIELDS + ['patient_name_search', 'updated_at']
+        )
+    created = [patient for key, patient in latest.items() if key not in existing]
+    EventPatient.objects.bulk_create(created)
+
+    saved = {**latest, **existing}
+    return [saved[key] for key in keys]
+
+
+def duplicate_groups(patient_model):
+    """
+    Return the `(attendance, record)` pairs of more than one non-deleted
+    patient, with the primary key of the first patient of each pair.
+    """
+    return (
+        patient_model._base_manager.filter(is_deleted=False)
+        .values('attendance', 'record')
+        .annotate(keep=Min('pk'), patients=Count('pk'))
+        .filter(patients__gt=1)
+        .order_by('attendance', 'record')
+    )
+
+
+def merge_duplicates(patient_model, ocurrence_model, batch_size=500):
+    """
+    Merge the non-deleted patients sharing an attendance and record.
+
+    The first patient of each pair is kept. The occurrences of the others
+    are re-pointed to it with a single `UPDATE` per batch, and the others
+    are soft deleted, leaving them to the archive. Each batch is committed
+    on its own. Accepts historical models, so it can run from migrations.
+
+    Args:
+        patient_model (type[EventPatient]): The patient model.
+        ocurrence_model (type[EventOcurrence]): The occurrence model.
+        batch_size (int): The number of pairs per batch.
+
+    Yields:
+        list[int]: The primary keys of the patients merged by each batch.
+    """
+    while True:
+        groups = list(duplicate_groups(patient_model)[:batch_size])
+        if not groups:
+            return
+        keep = {(group['attendance'], group['record']): group['keep'] for group in groups}
+        condition = Q()
+        for attendance, record in keep:
+            condition |= Q(attendance=attendance, record=record)
+        duplicates = {
+            pk: keep[(attendance, record)]
+            for pk, attendance, record in patient_model._base_manager.filter(
+                condition, is_deleted=False
+            )
+            .exclude(pk__in=keep.values())
+            .values_list('pk', 'attendance', 'record')
+        }
+        with transaction.atomic():
+            ocurrence_model._base_manager.filter(patient_id__in=duplicates).update(
+                patient_id=Case(
+                    *[
+                        When(patient_id=duplicate, then=Value(kept))
+                        for duplicate, kept in duplicates.items()
+                    ]
+                )
+            )
+            patient_model._base_manager.filter(pk__in=duplicates).update(
+                is_deleted=True, updated_at=timezone.now()
+            )
+        yield list(duplicates)
@@ -0,0 +1,42 @@
+"""Service holding the reference tables of the events in memory"""
+from classifications.models import (
+    DamageClassification,
+    IncidentClassification,
+    OcurrenceClassification,
+)
+from events.models.event_patient_models import EventPatient
+from events.models.gender_models import Gender
+from events.models.metas_models import Metas
+from events.models.ocurrence_description_models import OcurrenceDescription
+from events.models.race_models import Race
+from events.models.response_ocurrence_models import ResponseOcurrence
+from utils.registry import ReferenceRegistry
+
+reference_data = ReferenceRegistry("events:reference")
+reference_data.register(
+    Gender,
+    Race,
+    Metas,
+    OcurrenceDescription,
+    IncidentClassification,
+    OcurrenceClassification,
+    DamageClassification,
+)
+
+# Foreign keys loaded from `reference_data` instead of a query.
+RESOLVED_FOREIGN_KEYS = {
+    EventPatient: ('genere', 'race'),
+    ResponseOcurrence: (
+        'meta',
+        'ocurrence_description',
+        'incident_classification',
+        'ocurrence_classification',
+        'damage_classification',
+    ),
+}
+
+
+def install() -> None:
+    """Make the foreign keys of `RESOLVED_FOREIGN_KEYS` resolve through the registry."""
+    for model, names in RESOLVED_FOREIGN_KEYS.items():
+        reference_data.resolve_foreign_keys(model, *names)
@@ -1,91 +1,312 @@
 """Service for calculate deadline in model response_ocurrence_models"""
-from classifications.models import (
-    DamageClassification,
-    OcurrenceClassification,
+from datetime import timedelta, timezone
+
+from django.apps import apps
+from django.db.models import (
+    Case,
+    Count,
+    DateField,
+    F,
+    IntegerField,
+    Q,
+    Sum,
+    Value,
+    When,
 )
+from django.db.models.functions import Cast, TruncDate
+
+from utils.cache import bump_version, get_version
+
+DEADLINE_RULES_NAMESPACE = "events:deadline_rules"
+
+# Days formerly hard-coded in CalculateDeadline.calculate, by classification
+# name. Pairs without a `DeadlineRule` get the sum of both, so classifications
+# added later still get a deadline. Pairs adding up to 0 get none.
+LEGACY_OCURRENCE_DAYS = {
+    "Improcedente": 1,
+    "Não conformidade": 15,
+    "Circustância de Risco": 15,
+    "Quebra de contratualização": 15,
+    "Desvio da Qualidade": 15,
+    "Incidente sem dano": 10,
+}
+LEGACY_DAMAGE_DAYS = {
+    "Nenhum": 15,
+    "Dano Leve": 7,
+    "Dano Moderado": 5,
+    "Dano Grave": 3,
+    "Dano Óbito": 15,
+}
+
+
+class DeadlineRuleTable:
+    """
+    In-memory table of the `DeadlineRule` rows of the database.
+
+    The rules are compiled into a dict keyed by
+    `(ocurrence_classification_id, damage_classification_id)` the first
+    time they are needed in a worker, so a deadline is a single dict
+    lookup. Rules whose classifications are soft deleted are left out.
+    Pairs without a rule fall back to the legacy days of their names
+    (`LEGACY_OCURRENCE_DAYS` plus `LEGACY_DAMAGE_DAYS`).
+
+    Every worker keeps its own copy, tagged with the version of the
+    `events:deadline_rules` cache namespace. Changes to rules or
+    classifications bump that version (see `events.signals`), and each
+    worker recompiles its table on the next lookup.
+
+    Methods:
+        rules(): Returns the compiled rules, reloading them if they changed.
+        days_for(ocurrence_classification_id, damage_classification_id):
+            Returns the number of days of a pair of classifications.
+    """
+
+    def __init__(self):
+        self._rules = {}
+        self._version = None
+
+    def load(self) -> dict:
+        """
+        Compile the rules of the database, completed with the legacy days
+        of the pairs without a rule, with three queries.
+        """
+        DeadlineRule = apps.get_model("events", "DeadlineRule")
+        rows = DeadlineRule.objects.filter(
+            ocurrence_classification__is_deleted=False,
+            damage_classification__is_deleted=False,
+        ).values_list(
+            "ocurrence_classification_id", "damage_classification_id", "days"
+        )
+        rules = {(ocurrence, damage): days for ocurrence, damage, days in rows}
+
+        ocurrences = apps.get_model(
+            "classifications", "OcurrenceClassification"
+        ).objects.values_list("id", "classification")
+        damages = list(
+            apps.get_model(
+                "classifications", "DamageClassification"
+            ).objects.values_list("id", "classification")
+        )
+        for ocurrence_id, ocurrence in ocurrences:
+            for damage_id, damage in damages:
+                days = LEGACY_OCURRENCE_DAYS.get(
+                    ocurrence, 0
+                ) + LEGACY_DAMAGE_DAYS.get(damage, 0)
+                if days > 0:
+                    rules.setdefault((ocurrence_id, damage_id), days)
+        return rules
+
+    def rules(self) -> dict:
+        """
+        Return the compiled rules, reloading them if they changed.
+
+        The version is read before loading, so a change committed while
+        loading leaves the table outdated only until the next lookup.
+        """
+        version = get_version(DEADLINE_RULES_NAMESPACE)
+        if version != self._version:
+            self._rules = self.load()
+            self._version = version
+        return self._rules
+
+    def days_for(self, ocurrence_classification_id, damage_classification_id) -> int:
+        """
+        Return the number of days to respond for a pair of classifications.
+
+        Args:
+            ocurrence_classification_id (int): The ID of the occurrence classification.
+            damage_classification_id (int): The ID of the damage classification.
+
+        Returns:
+            int: The number of days, 0 when the pair has no rule.
+        """
+        return self.rules().get(
+            (ocurrence_classification_id, damage_classification_id), 0
+        )
+
+
+deadline_rules = DeadlineRuleTable()
+
+
+def invalidate_deadline_rules() -> None:
+    """Make every worker recompile its deadline rules on the next lookup."""
+    bump_version(DEADLINE_RULES_NAMESPACE)
 
 
 class CalculateDeadline:
     """
     Service class to calculate the deadline for response to an occurrence.
 
-    This class calculates the response deadline based on the classifications of
-    the occurrence and the damage. The deadline is determined by summing a number
-    of days based on these classifications.
+    The number of days comes from the `DeadlineRule` of the pair of
+    classifications, looked up in the compiled `deadline_rules` table,
+    so no classification row has to be loaded.
 
     Attributes:
-        ocurrence_classification (OcurrenceClassification): The classification of the occurrence.
-        damage_classification (DamageClassification): The classification of the damage.
+        ocurrence_classification_id (int): The ID of the classification of the occurrence.
+        damage_classification_id (int): The ID of the classification of the damage.
 
     Methods:
-        __init__(ocurrence, damage):
-            Initializes the CalculateDeadline instance with the given occurrence and damage classifications.
+        __init__(ocurrence_classification_id, damage_classification_id):
+            Initializes the CalculateDeadline instance with the given classification IDs.
 
         calculate():
-            Calculates and returns the deadline for response based on the occurrence and damage classifications.
+            Calculates and returns the number of days to respond.
     """
 
     def __init__(
             self,
-            ocurrence: OcurrenceClassification,
-            damage: DamageClassification
+            ocurrence_classification_id: int,
+            damage_classification_id: int,
     ) -> None:
         """
-        Initializes the CalculateDeadline instance with the provided occurrence and damage classifications.
+        Initializes the CalculateDeadline instance with the provided classification IDs.
 
         Args:
-            ocurrence (OcurrenceClassification): The occurrence classification object.
-            damage (DamageClassification): The damage classification object.
+            ocurrence_classification_id (int): The ID of the occurrence classification.
+            damage_classification_id (int): The ID of the damage classification.
+        """
+        self.ocurrence_classification_id = ocurrence_classification_id
+        self.damage_classification_id = damage_classification_id
+
+    def calculate(self) -> int:
         """
-        self.ocurrence_classification = ocurrence
-        self.damage_classification = damage
+        Calculates the number of days to respond to the occurrence.
 
-    def calculate(self):
+        Returns:
+            days_of_response(int): The number of days of the matching rule, 0 if there is none.
         """
-        Calculates the deadline for response based on the occurrence and damage classifications.
+        return deadline_rules.days_for(
+            self.ocurrence_classification_id, self.damage_classification_id
+        )
 
-        The deadline is defined by adding a certain number of days according to the 
-        classifications of the occurrence and the damage.
 
-        Occurrence Classification:
-            - "Improcedente": 1 day
-            - "Não conformidade", "Circustância de Risco", "Quebra de contratualização", 
-              "Desvio da Qualidade": 15 days
-            - "Incidente sem dano": 10 days
+def deadline_expression(rules: dict):
+    """
+    Build the expression computing the deadline of responses in the
+    database, to be used in `QuerySet.update` and `QuerySet.alias`.
 
-        Damage Classification:
-            - "Nenhum": 15 days
-            - "Dano Leve": 7 days
-            - "Dano Moderado": 5 days
-            - "Dano Grave": 3 days
-            - "Dano Óbito": 15 days
+    The deadline is the creation date of the response, in UTC like
+    `ResponseOcurrence.save`, plus the days of the rule of its pair of
+    classifications. Pairs without a rule get no deadline.
 
-        Returns:
-            days_of_response(int): The total number of days for the response deadline.
-        """
-        days_of_response: int = 0
-
-        # Classificação da ocorrência
-        if self.ocurrence_classification.classification == "Improcedente":
-            days_of_response += 1
-        elif self.ocurrence_classification.classification in [
-            "Não conformidade", "Circustância de Risco", 
-            "Quebra de contratualização", "Desvio da Qualidade"
-        ]:
-            days_of_response += 15
-        elif self.ocurrence_classification.classification == "Incidente sem dano":
-            days_of_response += 10
-
-        # Classificação do dano
-        if self.damage_classification.classification == "Nenhum":
-            days_of_response += 15
-        elif self.damage_classification.classification == "Dano Leve":
-            days_of_response += 7
-        elif self.damage_classification.classification == "Dano Moderado":
-            days_of_response += 5
-        elif self.damage_classification.classification == "Dano Grave":
-            days_of_response += 3
-        elif self.damage_classification.classification == "Dano Óbito":
-            days_of_response += 15
-
-        return days_of_response
+    Args:
+        rules (dict): Days keyed by `(ocurrence_classification_id, damage_classification_id)`.
+
+    Returns:
+        Case: The deadline of each row.
+    """
+    created = TruncDate("created_at", tzinfo=timezone.utc)
+    return Case(
+        *[
+            When(
+                ocurrence_classification_id=ocurrence,
+                damage_classification_id=damage,
+                then=Cast(created + Value(timedelta(days=days)), DateField()),
+            )
+            for (ocurrence, damage), days in rules.items()
+        ],
+        default=Value(None, output_field=DateField()),
+        output_field=DateField(),
+    )
+
+
+def stale_deadlines(queryset, rules: dict):
+    """
+    Narrow responses to the ones whose deadline differs from the rules.
+
+    Args:
+        queryset (QuerySet): The responses to be checked.
+        rules (dict): Days keyed by `(ocurrence_classification_id, damage_classification_id)`.
+
+    Returns:
+        QuerySet: The responses with the `new_deadline` alias and `stale` annotation
+        (1 when the deadline changes, 0 otherwise).
+    """
+    return queryset.alias(new_deadline=deadline_expression(rules)).annotate(
+        stale=Case(
+            When(
+                Q(deadline_response__isnull=True, new_deadline__isnull=True)
+                | Q(deadline_response=F("new_deadline")),
+                then=Value(0),
+            ),
+            default=Value(1),
+            output_field=IntegerField(),
+        )
+    )
+
+
+def open_responses():
+    """Return the responses whose deadline is still running."""
+    ResponseOcurrence = apps.get_model("events", "ResponseOcurrence")
+    return ResponseOcurrence.objects.filter(resolved=False).order_by()
+
+
+def deadline_diff(rules: dict = None) -> list:
+    """
+    Report how recomputing the deadlines would change the open responses,
+    with a single aggregate query.
+
+    Args:
+        rules (dict, optional): Days keyed by pair of classification IDs.
+            Defaults to the current `DeadlineRule` rows.
+
+    Returns:
+        list[dict]: One entry per pair of classifications with open responses:
+        `ocurrence_classification_id`, `damage_classification_id`, `days`
+        (None without a rule), `open` and `changed` counts.
+    """
+    if rules is None:
+        rules = deadline_rules.rules()
+    rows = (
+        stale_deadlines(open_responses(), rules)
+        .values("ocurrence_classification_id", "damage_classification_id")
+        .annotate(open=Count("pk"), changed=Sum("stale"))
+        .order_by("ocurrence_classification_id", "damage_classification_id")
+    )
+    return [
+        {
+            **row,
+            "days": rules.get(
+                (row["ocurrence_classification_id"], row["damage_classification_id"])
+            ),
+        }
+        for row in rows
+    ]
+
+
+def recompute_deadlines(rules: dict = None):
+    """
+    Recompute the deadline of the open responses set-wise.
+
+    Responses are grouped by occurrence classification, and each group is
+    updated with a single `UPDATE` whose `CASE` picks the days of the
+    damage classification. Only rows whose deadline changes are written.
+    `save()` and its signals are bypassed; the status of the occurrences
+    does not depend on the deadline.
+
+    Args:
+        rules (dict, optional): Days keyed by pair of classification IDs.
+            Defaults to the current `DeadlineRule` rows.
+
+    Yields:
+        tuple[int, int]: The occurrence classification ID of each group and
+        the number of responses updated in it.
+    """
+    if rules is None:
+        rules = deadline_rules.rules()
+    responses = open_responses()
+    groups = (
+        responses.values_list("ocurrence_classification_id", flat=True)
+        .distinct()
+        .order_by("ocurrence_classification_id")
+    )
+    for ocurrence in list(groups):
+        group_rules = {
+            pair: days for pair, days in rules.items() if pair[0] == ocurrence
+        }
+        group = stale_deadlines(
+            responses.filter(ocurrence_classification_id=ocurrence), group_rules
+        ).filter(stale=1)
+        yield ocurrence, group.update(
+            deadline_response=deadline_expression(group_rules)
+        )
@@ -0,0 +1,292 @@
+"""Service for full-text search over occurrence narratives"""
+from django.db import connection
+
+from utils.text import STOPWORDS, stem, words
+
+SEARCH_TABLE = "events_ocurrence_search"
+"""
+The full-text index of occurrences, one row per occurrence, covering
+`description_ocurrence`, `immediate_action` and the `description` of its
+response. Kept in sync by database triggers.
+"""
+
+SQLITE_INSTALL = [
+    f"""
+    CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5(
+        description_ocurrence,
+        immediate_action,
+        response_description,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_ocurrence_insert
+    AFTER INSERT ON events_eventocurrence BEGIN
+        INSERT INTO {SEARCH_TABLE} (
+            rowid, description_ocurrence, immediate_action, response_description
+        )
+        VALUES (new.id, new.description_ocurrence, new.immediate_action, '');
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_ocurrence_update
+    AFTER UPDATE OF description_ocurrence, immediate_action
+    ON events_eventocurrence BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET description_ocurrence = new.description_ocurrence,
+            immediate_action = new.immediate_action
+        WHERE rowid = new.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_ocurrence_delete
+    AFTER DELETE ON events_eventocurrence BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_response_insert
+    AFTER INSERT ON events_responseocurrence BEGIN
+        UPDATE {SEARCH_TABLE} SET response_description = new.description
+        WHERE rowid = new.ocurrence_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_response_update
+    AFTER UPDATE OF description, ocurrence_id ON events_responseocurrence BEGIN
+        UPDATE {SEARCH_TABLE} SET response_description = ''
+        WHERE rowid = old.ocurrence_id;
+        UPDATE {SEARCH_TABLE} SET response_description = new.description
+        WHERE rowid = new.ocurrence_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_response_delete
+    AFTER DELETE ON events_responseocurrence BEGIN
+        UPDATE {SEARCH_TABLE} SET response_description = ''
+        WHERE rowid = old.ocurrence_id;
+    END
+    """,
+]
+
+SQLITE_UNINSTALL = [
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_{name}"
+    for name in (
+        "ocurrence_insert",
+        "ocurrence_update",
+        "ocurrence_delete",
+        "response_insert",
+        "response_update",
+        "response_delete",
+    )
+] + [f"DROP TABLE IF EXISTS {SEARCH_TABLE}"]
+
+SQLITE_REBUILD = [
+    f"DELETE FROM {SEARCH_TABLE}",
+    f"""
+    INSERT INTO {SEARCH_TABLE} (
+        rowid, description_ocurrence, immediate_action, response_description
+    )
+    SELECT o.id, o.description_ocurrence, o.immediate_action,
+           COALESCE(r.description, '')
+    FROM events_eventocurrence o
+    LEFT JOIN events_responseocurrence r ON r.ocurrence_id = o.id
+    """,
+]
+
+SQLITE_SEARCH = f"""
+    SELECT s.rowid, bm25({SEARCH_TABLE}, 2.0, 1.0, 1.0) AS rank
+    FROM {SEARCH_TABLE} s
+    JOIN events_eventocurrence o ON o.id = s.rowid
+    WHERE {SEARCH_TABLE} MATCH %s AND NOT o.is_deleted
+    ORDER BY rank
+    LIMIT %s
+"""
+
+# Portuguese stemming with accent folding: the `portuguese` configuration
+# with `unaccent` applied before the stemmer.
+POSTGRESQL_DOCUMENT = """
+    setweight(to_tsvector('pt_unaccent', coalesce({ocurrence}.description_ocurrence, '')), 'A')
+    || setweight(to_tsvector('pt_unaccent', coalesce({ocurrence}.immediate_action, '')), 'B')
+    || setweight(to_tsvector('pt_unaccent', coalesce({response}, '')), 'B')
+"""
+
+POSTGRESQL_INSTALL = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    """
+    DO $$ BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'pt_unaccent') THEN
+            CREATE TEXT SEARCH CONFIGURATION pt_unaccent (COPY = portuguese);
+            ALTER TEXT SEARCH CONFIGURATION pt_unaccent
+                ALTER MAPPING FOR hword, hword_part, word
+                WITH unaccent, portuguese_stem;
+        END IF;
+    END $$
+    """,
+    f"""
+    CREATE TABLE {SEARCH_TABLE} (
+        ocurrence_id bigint PRIMARY KEY
+            REFERENCES events_eventocurrence (id) ON DELETE CASCADE,
+        response_description text NOT NULL DEFAULT '',
+        document tsvector NOT NULL
+    )
+    """,
+    f"CREATE INDEX {SEARCH_TABLE}_document_idx ON {SEARCH_TABLE} USING GIN (document)",
+    f"""
+    CREATE FUNCTION {SEARCH_TABLE}_ocurrence_sync() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO {SEARCH_TABLE} (ocurrence_id, document)
+        VALUES (new.id, {POSTGRESQL_DOCUMENT.format(ocurrence="new", response="''")})
+        ON CONFLICT (ocurrence_id) DO UPDATE SET document =
+            {POSTGRESQL_DOCUMENT.format(ocurrence="new", response=f"{SEARCH_TABLE}.response_description")};
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_ocurrence_sync
+    AFTER INSERT OR UPDATE OF description_ocurrence, immediate_action
+    ON events_eventocurrence
+    FOR EACH ROW EXECUTE FUNCTION {SEARCH_TABLE}_ocurrence_sync()
+    """,
+    f"""
+    CREATE FUNCTION {SEARCH_TABLE}_response_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE {SEARCH_TABLE} s SET response_description = '', document =
+                {POSTGRESQL_DOCUMENT.format(ocurrence="o", response="''")}
+            FROM events_eventocurrence o
+            WHERE s.ocurrence_id = old.ocurrence_id AND o.id = old.ocurrence_id;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE {SEARCH_TABLE} s SET response_description = new.description, document =
+                {POSTGRESQL_DOCUMENT.format(ocurrence="o", response="new.description")}
+            FROM events_eventocurrence o
+            WHERE s.ocurrence_id = new.ocurrence_id AND o.id = new.ocurrence_id;
+        END IF;
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE TRIGGER {SEARCH_TABLE}_response_sync
+    AFTER INSERT OR DELETE OR UPDATE OF description, ocurrence_id
+    ON events_responseocurrence
+    FOR EACH ROW EXECUTE FUNCTION {SEARCH_TABLE}_response_sync()
+    """,
+]
+
+POSTGRESQL_UNINSTALL = [
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_response_sync ON events_responseocurrence",
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ocurrence_sync ON events_eventocurrence",
+    f"DROP FUNCTION IF EXISTS {SEARCH_TABLE}_response_sync()",
+    f"DROP FUNCTION IF EXISTS {SEARCH_TABLE}_ocurrence_sync()",
+    f"DROP TABLE IF EXISTS {SEARCH_TABLE}",
+]
+
+POSTGRESQL_REBUILD = [
+    f"DELETE FROM {SEARCH_TABLE}",
+    f"""
+    INSERT INTO {SEARCH_TABLE} (ocurrence_id, response_description, document)
+    SELECT o.id, coalesce(r.description, ''),
+           {POSTGRESQL_DOCUMENT.format(ocurrence="o", response="r.description")}
+    FROM events_eventocurrence o
+    LEFT JOIN events_responseocurrence r ON r.ocurrence_id = o.id
+    """,
+]
+
+POSTGRESQL_SEARCH = f"""
+    SELECT s.ocurrence_id, ts_rank_cd(s.document, query) AS rank
+    FROM {SEARCH_TABLE} s
+    JOIN events_eventocurrence o ON o.id = s.ocurrence_id,
+         websearch_to_tsquery('pt_unaccent', %s) query
+    WHERE s.document @@ query AND NOT o.is_deleted
+    ORDER BY rank DESC
+    LIMIT %s
+"""
+
+STATEMENTS = {
+    "sqlite": (SQLITE_INSTALL, SQLITE_UNINSTALL, SQLITE_REBUILD),
+    "postgresql": (POSTGRESQL_INSTALL, POSTGRESQL_UNINSTALL, POSTGRESQL_REBUILD),
+}
+
+
+def is_supported(db_connection=connection) -> bool:
+    """Check if full-text search is available on a database connection."""
+    return db_connection.vendor in STATEMENTS
+
+
+def _execute(db_connection, statements) -> None:
+    with db_connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def install(db_connection=connection) -> None:
+    """
+    Create the full-text index, its triggers and its initial content.
+
+    Does nothing on databases without full-text support.
+    """
+    if is_supported(db_connection):
+        install_sql, _, rebuild_sql = STATEMENTS[db_connection.vendor]
+        _execute(db_connection, install_sql + rebuild_sql)
+
+
+def uninstall(db_connection=connection) -> None:
+    """Drop the full-text index and its triggers."""
+    if is_supported(db_connection):
+        _execute(db_connection, STATEMENTS[db_connection.vendor][1])
+
+
+def rebuild(db_connection=connection) -> None:
+    """Refill the full-text index from the occurrence and response tables."""
+    if is_supported(db_connection):
+        _execute(db_connection, STATEMENTS[db_connection.vendor][2])
+
+
+def sqlite_match_query(query: str) -> str:
+    """
+    Translate a search into an FTS5 query.
+
+    SQLite has no Portuguese stemmer, so every word is stemmed in Python
+    and matched as a prefix, e.g. "quedas de medicação" becomes
+    `"qued"* "medic"*`. Stop words, punctuation and underscores are left
+    out, so no empty phrase reaches FTS5. Words are quoted, so the FTS5
+    syntax cannot be injected.
+
+    Args:
+        query (str): The search typed by the user.
+
+    Returns:
+        str: The FTS5 query, empty when the search has no words.
+    """
+    return " ".join(
+        f'"{stem(word)}"*' for word in words(query) if word not in STOPWORDS
+    )
+
+
+def search_ocurrences(query: str, limit: int = 50) -> list:
+    """
+    Return the occurrences best matching a search, best first.
+
+    Matches the occurrence description, immediate action and response
+    description, with Portuguese stemming and accent folding. Soft
+    deleted occurrences are left out.
+
+    Args:
+        query (str): The search typed by the user.
+        limit (int): The maximum number of results.
+
+    Returns:
+        list[tuple[int, float]]: `(occurrence id, rank)` pairs.
+    """
+    if not is_supported() or not query.strip():
+        return []
+    if connection.vendor == "sqlite":
+        sql, query = SQLITE_SEARCH, sqlite_match_query(query)
+    else:
+        sql, query = POSTGRESQL_SEARCH, query.strip()
+    if not query:
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [query, limit])
+        return cursor.fetchall()
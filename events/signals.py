@@ -0,0 +1,112 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from classifications.models import (
+    DamageClassification,
+    IncidentClassification,
+    OcurrenceClassification,
+)
+from departments.models import Department
+from events.models.deadline_rule_models import DeadlineRule
+from events.models.event_ocurrence_models import EventOcurrence
+from events.models.gender_models import Gender
+from events.models.metas_models import Metas
+from events.models.race_models import Race
+from events.models.response_ocurrence_models import ResponseOcurrence
+from events.services import (
+    ocurrence_status_services,
+    reference_services,
+    response_ocurrence_services,
+)
+from utils import forms, signals
+from utils.cache import invalidate_tags
+
+DEADLINE_RULE_SENDERS = (DeadlineRule, OcurrenceClassification, DamageClassification)
+
+# Models offered in the cached selects of the intake and response forms.
+CHOICE_SENDERS = (
+    Department,
+    Gender,
+    Race,
+    Metas,
+    IncidentClassification,
+    OcurrenceClassification,
+    DamageClassification,
+)
+
+# Cache tags of the pages showing each model (utils.mixins.CachePolicyMixin).
+PAGE_CACHE_TAGS = {
+    EventOcurrence: "events",
+    ResponseOcurrence: "responses",
+}
+
+
+@receiver(post_save, sender=ResponseOcurrence)
+def sync_status_on_response_save(sender, instance, **kwargs):
+    """Mark the occurrence as responded, or resolved, when its response is saved."""
+    ocurrence_status_services.sync_status(
+        EventOcurrence, instance.ocurrence_id, instance
+    )
+
+
+@receiver(post_delete, sender=ResponseOcurrence)
+def sync_status_on_response_delete(sender, instance, **kwargs):
+    """Mark the occurrence as pending again when its response is deleted."""
+    ocurrence_status_services.sync_status(EventOcurrence, instance.ocurrence_id)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+@receiver(signals.soft_deleted)
+@receiver(signals.restored)
+def invalidate_deadline_rules(sender, **kwargs):
+    """
+    Reload the compiled deadline rules when a rule or a classification
+    changes, once the change is committed.
+    """
+    if sender in DEADLINE_RULE_SENDERS:
+        transaction.on_commit(response_ocurrence_services.invalidate_deadline_rules)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+@receiver(signals.soft_deleted)
+@receiver(signals.restored)
+def invalidate_choices(sender, **kwargs):
+    """
+    Drop the cached select options of a reference model when one of its
+    rows changes, once the change is committed.
+    """
+    if sender in CHOICE_SENDERS:
+        transaction.on_commit(partial(forms.invalidate_choices, sender))
+
+
+@receiver(post_save)
+@receiver(post_delete)
+@receiver(signals.soft_deleted)
+@receiver(signals.restored)
+def invalidate_reference_data(sender, **kwargs):
+    """
+    Reload the in-memory table of a reference model when one of its rows
+    changes, once the change is committed.
+    """
+    if reference_services.reference_data.is_registered(sender):
+        transaction.on_commit(
+            partial(reference_services.reference_data.invalidate, sender)
+        )
+
+
+@receiver(post_save)
+@receiver(post_delete)
+@receiver(signals.soft_deleted)
+@receiver(signals.restored)
+def invalidate_pages(sender, **kwargs):
+    """
+    Drop the cached pages showing occurrences or responses when one of
+    them changes, once the change is committed.
+    """
+    if sender in PAGE_CACHE_TAGS:
+        transaction.on_commit(partial(invalidate_tags, PAGE_CACHE_TAGS[sender]))
@@ -0,0 +1,142 @@
+from datetime import timedelta
+
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from departments.models import ArchivedDepartment, Department
+from events.models.archive_models import (
+    ArchivedEventOcurrence,
+    ArchivedEventPatient,
+)
+from events.models.event_ocurrence_models import EventOcurrence
+from events.models.event_patient_models import EventPatient
+from utils.test import SetUpInitial
+
+
+class ArchiveSoftDeletedTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.old = timezone.now() - timedelta(days=120)
+        self.department = Department.objects.create(
+            name="Setor Antigo", owner=self.user
+        )
+        self.patient = EventPatient.objects.create(
+            patient_name="Maria",
+            attendance=111,
+            record=222,
+            birth_date="1980-01-01",
+            internment_date="2024-01-01",
+        )
+        self.ocurrence = EventOcurrence.objects.create(
+            patient_involved=True,
+            ocurrence_date=timezone.now().date(),
+            ocurrence_time=timezone.now().time(),
+            patient=self.patient,
+            reporting_department=self.department,
+            notified_department=Department.objects.get(id=2),
+            description_ocurrence="Descrição",
+            immediate_action="Ação",
+        )
+
+    def soft_delete_long_ago(self, *objects):
+        for obj in objects:
+            type(obj).all_objects.filter(pk=obj.pk).update(
+                is_deleted=True, updated_at=self.old
+            )
+
+    def test_archives_old_rows_in_order(self):
+        """Testa se ocorrências, pacientes e setores antigos são arquivados."""
+        self.soft_delete_long_ago(self.ocurrence, self.patient, self.department)
+
+        call_command("archive_soft_deleted", batch_size=1, stdout=None)
+
+        self.assertFalse(EventOcurrence.all_objects.filter(pk=self.ocurrence.pk).exists())
+        self.assertFalse(EventPatient.all_objects.filter(pk=self.patient.pk).exists())
+        self.assertFalse(Department.all_objects.filter(pk=self.department.pk).exists())
+        archived = ArchivedEventOcurrence.objects.get(pk=self.ocurrence.pk)
+        self.assertEqual(archived.patient_id, self.patient.pk)
+        self.assertEqual(archived.reporting_department_id, self.department.pk)
+        self.assertEqual(archived.updated_at, self.old)
+        self.assertTrue(ArchivedEventPatient.objects.filter(pk=self.patient.pk).exists())
+        self.assertTrue(ArchivedDepartment.objects.filter(pk=self.department.pk).exists())
+
+    def test_keeps_recent_and_referenced_rows(self):
+        """Testa se registros recentes ou ainda referenciados não são arquivados."""
+        self.soft_delete_long_ago(self.patient, self.department)
+        EventOcurrence.objects.filter(pk=self.ocurrence.pk).soft_delete()
+
+        call_command("archive_soft_deleted", stdout=None)
+
+        self.assertTrue(EventOcurrence.all_objects.filter(pk=self.ocurrence.pk).exists())
+        self.assertTrue(EventPatient.all_objects.filter(pk=self.patient.pk).exists())
+        self.assertTrue(Department.all_objects.filter(pk=self.department.pk).exists())
+        self.assertFalse(ArchivedEventOcurrence.objects.exists())
+
+    def test_max_batches_bounds_the_run(self):
+        """Testa se --max-batches limita a quantidade de lotes."""
+        patients = [
+            EventPatient.objects.create(
+                patient_name=f"Paciente {index}",
+                attendance=index,
+                record=index,
+                birth_date="1980-01-01",
+                internment_date="2024-01-01",
+            )
+            for index in range(3)
+        ]
+        self.soft_delete_long_ago(*patients)
+
+        call_command(
+            "archive_soft_deleted",
+            model=["events.EventPatient"],
+            batch_size=1,
+            max_batches=2,
+            stdout=None,
+        )
+        self.assertEqual(ArchivedEventPatient.objects.count(), 2)
+
+        call_command("archive_soft_deleted", model=["events.EventPatient"], stdout=None)
+        self.assertEqual(ArchivedEventPatient.objects.count(), 3)
+
+    def test_restore_archived(self):
+        """Testa se um registro arquivado volta para a tabela original."""
+        self.soft_delete_long_ago(self.ocurrence)
+        call_command("archive_soft_deleted", stdout=None)
+
+        call_command("restore_archived", "events.EventOcurrence", self.ocurrence.pk, stdout=None)
+
+        restored = EventOcurrence.objects.get(pk=self.ocurrence.pk)
+        self.assertFalse(restored.is_deleted)
+        self.assertEqual(restored.patient, self.patient)
+        self.assertFalse(ArchivedEventOcurrence.objects.exists())
+
+    def test_restore_requires_referenced_rows(self):
+        """Testa se a restauração falha quando o paciente também foi arquivado."""
+        self.soft_delete_long_ago(self.ocurrence, self.patient)
+        call_command("archive_soft_deleted", stdout=None)
+
+        with self.assertRaises(CommandError):
+            call_command("restore_archived", "events.EventOcurrence", self.ocurrence.pk)
+        self.assertTrue(ArchivedEventOcurrence.objects.filter(pk=self.ocurrence.pk).exists())
+
+        call_command("restore_archived", "events.EventPatient", self.patient.pk, stdout=None)
+        call_command("restore_archived", "events.EventOcurrence", self.ocurrence.pk, stdout=None)
+        self.assertTrue(EventOcurrence.objects.filter(pk=self.ocurrence.pk).exists())
+
+    def test_department_with_members_archived(self):
+        """Testa se setores excluídos com usuários são arquivados sem os membros."""
+        department = Department.objects.create(name="Setor Membro", owner=self.user)
+        self.user.departments.add(department)
+        self.soft_delete_long_ago(department)
+        members = Department.users.through.objects.filter(department=department)
+
+        call_command("archive_soft_deleted", stdout=None)
+        self.assertFalse(Department.all_objects.filter(pk=department.pk).exists())
+        self.assertTrue(ArchivedDepartment.objects.filter(pk=department.pk).exists())
+        self.assertFalse(members.exists())
+
+        call_command(
+            "restore_archived", "departments.Department", department.pk, stdout=None
+        )
+        self.assertFalse(Department.objects.get(pk=department.pk).is_deleted)
+        self.assertFalse(members.exists())
@@ -0,0 +1,73 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from departments.models import Department
+from events.models.event_ocurrence_models import EventOcurrence
+from utils.test import SetUpInitial
+
+
+class ConditionalGetTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("events:event_no_response")
+        self.ocurrence = self.create_ocurrence()
+
+    def create_ocurrence(self):
+        now = timezone.now()
+        return EventOcurrence.objects.create(
+            ocurrence_date=now.date(),
+            ocurrence_time=now.time(),
+            reporting_department=Department.objects.get(id=1),
+            notified_department=Department.objects.get(id=2),
+            description_ocurrence="Descrição",
+            immediate_action="Ação",
+        )
+
+    def test_list_not_modified(self):
+        """Testa se a lista inalterada responde 304 sem renderizar."""
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertNotIn("Last-Modified", response)
+        self.assertIn("Cookie", response["Vary"])
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertIsNone(response.context)
+        self.assertEqual(response.content, b"")
+
+    def test_list_modified(self):
+        """Testa se a lista muda de ETag quando as ocorrências mudam."""
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ocurrence.immediate_action = "Outra ação"
+            self.ocurrence.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ocurrence.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["events"]), [])
+
+    def test_list_summary_cached(self):
+        """Testa se o resumo da lista não é recalculado a cada requisição."""
+        etag = self.client.get(self.url)["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(
+            [query for query in queries if "MAX(" in query["sql"].upper()]
+        )
+
+    def test_etag_varies_on_user(self):
+        """Testa se o ETag depende do usuário."""
+        etag = self.client.get(self.url)["ETag"]
+        self.client.logout()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
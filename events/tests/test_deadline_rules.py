@@ -0,0 +1,158 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from classifications.models import (
+    DamageClassification,
+    IncidentClassification,
+    OcurrenceClassification,
+)
+from departments.models import Department
+from events.models import DeadlineRule, EventOcurrence, ResponseOcurrence
+from events.models.metas_models import Metas
+from events.models.ocurrence_description_models import OcurrenceDescription
+from events.services.response_ocurrence_services import (
+    CalculateDeadline,
+    deadline_rules,
+    recompute_deadlines,
+)
+from utils.test import SetUpInitial
+
+
+class DeadlineRuleTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.improcedente = OcurrenceClassification.objects.create(
+            classification="Improcedente"
+        )
+        self.leve = DamageClassification.objects.create(classification="Dano Leve")
+        self.grave = DamageClassification.objects.create(classification="Dano Grave")
+        self.incident = IncidentClassification.objects.create(
+            classification="Incidente sem dano"
+        )
+        self.description = OcurrenceDescription.objects.create(
+            name="Não se Aplica", owner=self.user
+        )
+        self.meta = Metas.objects.create(name="Meta 1", owner=self.user)
+        self.today = timezone.now().date()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.rule = DeadlineRule.objects.create(
+                ocurrence_classification=self.improcedente,
+                damage_classification=self.leve,
+                days=8,
+            )
+
+    def days(self, damage):
+        return CalculateDeadline(self.improcedente.pk, damage.pk).calculate()
+
+    def test_lookup_without_queries(self):
+        """Testa se o prazo é calculado sem consultas depois de compilado."""
+        self.assertEqual(self.days(self.leve), 8)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.days(self.leve), 8)
+            self.assertEqual(self.days(self.grave), 4)
+
+    def test_reload_on_rule_change(self):
+        """Testa se a tabela é recompilada quando uma regra muda."""
+        self.assertEqual(self.days(self.grave), 4)
+        with self.captureOnCommitCallbacks(execute=True):
+            DeadlineRule.objects.create(
+                ocurrence_classification=self.improcedente,
+                damage_classification=self.grave,
+                days=6,
+            )
+            self.rule.days = 9
+            self.rule.save()
+        self.assertEqual(self.days(self.grave), 6)
+        self.assertEqual(self.days(self.leve), 9)
+
+    def test_soft_deleted_classification_has_no_rule(self):
+        """Testa se classificações excluídas deixam de ter prazo."""
+        self.assertEqual(self.days(self.leve), 8)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.leve.soft_delete()
+        self.assertEqual(self.days(self.leve), 0)
+
+    def test_new_classification_falls_back_to_legacy_days(self):
+        """Testa se uma classificação criada sem regra recebe os dias antigos."""
+        deadline_rules.rules()
+        with self.captureOnCommitCallbacks(execute=True):
+            moderado = DamageClassification.objects.create(
+                classification="Dano Moderado"
+            )
+            sem_prazo = DamageClassification.objects.create(
+                classification="Dano Indefinido"
+            )
+        self.assertEqual(self.days(moderado), 6)
+        self.assertEqual(self.days(sem_prazo), 1)
+
+        response = self.build_response(moderado)
+        response.save()
+        self.assertEqual(response.deadline_response, self.today + timedelta(days=6))
+
+    def build_response(self, damage, **kwargs):
+        now = timezone.now()
+        ocurrence = EventOcurrence.objects.create(
+            ocurrence_date=now.date(),
+            ocurrence_time=now.time(),
+            reporting_department=Department.objects.get(id=1),
+            notified_department=Department.objects.get(id=2),
+            description_ocurrence="Descrição",
+            immediate_action="Ação",
+        )
+        return ResponseOcurrence(
+            ocurrence=ocurrence,
+            owner=self.user,
+            ocurrence_description=self.description,
+            meta=self.meta,
+            description="Tratativa",
+            incident_classification=self.incident,
+            ocurrence_classification_id=self.improcedente.pk,
+            damage_classification_id=damage.pk,
+            **kwargs,
+        )
+
+    def test_response_save_sets_deadline(self):
+        """Testa se a tratativa recebe o prazo da regra sem carregar as classificações."""
+        response = self.build_response(self.leve)
+        deadline_rules.rules()
+        # INSERT da tratativa e UPDATE do status da ocorrência
+        with self.assertNumQueries(2):
+            response.save()
+        self.assertEqual(response.deadline_response, self.today + timedelta(days=8))
+
+    def test_recompute_deadlines(self):
+        """Testa se o comando recalcula apenas os prazos das tratativas abertas."""
+        stale = self.build_response(self.leve)
+        stale.save()
+        grave = self.build_response(self.grave)
+        grave.save()
+        resolved = self.build_response(self.leve, resolved=True)
+        resolved.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.rule.days = 20
+            self.rule.save()
+            DeadlineRule.objects.create(
+                ocurrence_classification=self.improcedente,
+                damage_classification=self.grave,
+                days=3,
+            )
+
+        out = StringIO()
+        call_command("recompute_deadlines", dry_run=True, stdout=out)
+        self.assertIn("2 deadlines would change", out.getvalue())
+        stale.refresh_from_db()
+        self.assertEqual(stale.deadline_response, self.today + timedelta(days=8))
+
+        # Os grupos de classificação e um UPDATE por grupo
+        with self.assertNumQueries(2):
+            call_command("recompute_deadlines", stdout=StringIO())
+        deadlines = dict(
+            ResponseOcurrence.objects.values_list("pk", "deadline_response")
+        )
+        self.assertEqual(deadlines[stale.pk], self.today + timedelta(days=20))
+        self.assertEqual(deadlines[grave.pk], self.today + timedelta(days=3))
+        self.assertEqual(deadlines[resolved.pk], self.today + timedelta(days=8))
+        self.assertEqual(sum(count for _, count in recompute_deadlines()), 0)
@@ -0,0 +1,80 @@
+from django.utils import timezone
+
+from classifications.models import (
+    DamageClassification,
+    IncidentClassification,
+    OcurrenceClassification,
+)
+from departments.models import Department
+from events.forms import (
+    EventOcurrenceForm,
+    EventPatientForm,
+    ResponseOcurrenceForm,
+)
+from events.models.gender_models import Gender
+from events.models.metas_models import Metas
+from events.models.race_models import Race
+from utils.test import SetUpInitial
+
+
+class CachedChoicesTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        Gender.objects.create(name="Feminino")
+        Race.objects.create(name="Parda")
+        Metas.objects.create(name="Meta 1", owner=self.user)
+        IncidentClassification.objects.create(classification="Incidente sem dano")
+        OcurrenceClassification.objects.create(classification="Improcedente")
+        DamageClassification.objects.create(classification="Dano Leve")
+
+    def render(self, data=None):
+        return "".join(
+            str(form_class(data))
+            for form_class in (EventOcurrenceForm, EventPatientForm, ResponseOcurrenceForm)
+        )
+
+    def test_render_without_queries(self):
+        """Testa se os formulários são renderizados sem consultas depois do primeiro."""
+        first = self.render()
+        with self.assertNumQueries(0):
+            second = self.render()
+        self.assertEqual(first, second)
+        self.assertIn('<option value="1">Administração</option>', second)
+        self.assertIn('<option value="" selected>---------</option>', second)
+
+    def test_selected_option(self):
+        """Testa se a opção escolhida é marcada."""
+        self.render()
+        html = str(EventOcurrenceForm({"notified_department": 2})["notified_department"])
+        self.assertIn('<option value="2" selected>TI</option>', html)
+        self.assertIn('<option value="1">Administração</option>', html)
+        self.assertIn('class="form-select"', html)
+
+    def test_invalidated_on_change(self):
+        """Testa se as opções são atualizadas quando um setor muda."""
+        self.render()
+        with self.captureOnCommitCallbacks(execute=True):
+            department = Department.objects.create(
+                name="UTI", description="Unidade de Terapia Intensiva", owner=self.user
+            )
+        self.assertIn(f'<option value="{department.pk}">UTI</option>', self.render())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Department.objects.filter(pk=department.pk).soft_delete()
+        self.assertNotIn("UTI", self.render())
+
+    def test_validation(self):
+        """Testa se os valores enviados continuam validados contra o banco."""
+        now = timezone.now()
+        data = {
+            "ocurrence_date": now.date(),
+            "ocurrence_time": now.time(),
+            "reporting_department": 1,
+            "notified_department": 99,
+            "description_ocurrence": "Descrição",
+            "immediate_action": "Ação",
+        }
+        form = EventOcurrenceForm(data)
+        self.assertFalse(form.is_valid())
+        self.assertEqual(list(form.errors), ["notified_department"])
+        self.assertEqual(form.cleaned_data["reporting_department"].name, "Administração")
@@ -0,0 +1,75 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from events.models import EventOcurrence, IdempotencyKey
+from utils.test import SetUpInitial
+
+
+class IdempotentSubmissionTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("events:home")
+        self.data = {
+            "patient_involved": False,
+            "ocurrence_date": "2026-10-01",
+            "ocurrence_time": "10:30",
+            "reporting_department": 1,
+            "notified_department": 2,
+            "description_ocurrence": "Queda do leito",
+            "immediate_action": "Paciente avaliado",
+        }
+
+    def post(self, key=None, **kwargs):
+        data = dict(self.data, idempotency_key=key) if key else self.data
+        return self.client.post(self.url, data, **kwargs)
+
+    def success_url(self, ocurrence):
+        return reverse("events:event_success", args=[ocurrence.pk])
+
+    def test_form_carries_key(self):
+        """Testa se o formulário traz uma chave nova a cada exibição."""
+        first = self.client.get(self.url).context["idempotency_key"]
+        second = self.client.get(self.url).context["idempotency_key"]
+        self.assertEqual(len(first), 32)
+        self.assertNotEqual(first, second)
+
+    def test_replay_returns_original(self):
+        """Testa se o reenvio da mesma chave não cria outra ocorrência."""
+        first = self.post("a1b2c3d4e5f6")
+        ocurrence = EventOcurrence.objects.get()
+        self.assertRedirects(first, self.success_url(ocurrence))
+
+        with self.assertNumQueries(1):
+            second = self.post("a1b2c3d4e5f6")
+        self.assertRedirects(second, self.success_url(ocurrence))
+        self.assertEqual(EventOcurrence.objects.count(), 1)
+
+        self.post("f6e5d4c3b2a1")
+        self.assertEqual(EventOcurrence.objects.count(), 2)
+
+    def test_header_key(self):
+        """Testa se a chave também é aceita no cabeçalho Idempotency-Key."""
+        headers = {"headers": {"Idempotency-Key": "cliente-123:envio-1"}}
+        self.post(**headers)
+        self.post(**headers)
+        self.assertEqual(EventOcurrence.objects.count(), 1)
+        self.assertEqual(
+            self.post(**{"headers": {"Idempotency-Key": "<x>"}}).status_code, 400
+        )
+
+    def test_expired_key(self):
+        """Testa se uma chave expirada é substituída e removida pela limpeza."""
+        self.post("a1b2c3d4e5f6")
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(hours=1))
+        self.post("a1b2c3d4e5f6")
+        self.assertEqual(EventOcurrence.objects.count(), 2)
+        self.assertEqual(IdempotencyKey.objects.count(), 1)
+
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(hours=1))
+        call_command("prune_idempotency_keys", batch_size=1, stdout=StringIO())
+        self.assertFalse(IdempotencyKey.objects.exists())
+        self.assertEqual(EventOcurrence.objects.count(), 2)
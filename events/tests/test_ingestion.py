@@ -0,0 +1,119 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+
+from events.models import EventOcurrence, EventPatient
+from events.models.gender_models import Gender
+from events.models.race_models import Race
+from events.services import ingestion_services
+from utils.test import SetUpInitial
+
+
+def record(**kwargs):
+    data = {
+        "ocurrence_date": "2026-10-01",
+        "ocurrence_time": "10:30",
+        "reporting_department": "Administracao",
+        "notified_department": 2,
+        "description_ocurrence": "Queda do leito",
+        "immediate_action": "Paciente avaliado",
+    }
+    data.update(kwargs)
+    return json.dumps(data)
+
+
+PATIENT = {
+    "patient_name": "José da Silva",
+    "attendance": 123,
+    "record": 456,
+    "birth_date": "1950-01-01",
+    "internment_date": "2026-09-30",
+    "genere": "masculino",
+    "race": "Parda",
+}
+
+
+class IngestionTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        Gender.objects.create(name="Masculino")
+        Race.objects.create(name="Parda")
+
+    def ingest(self, lines, **kwargs):
+        return list(ingestion_services.ingest(lines, **kwargs))
+
+    def test_lookups_are_preloaded(self):
+        """Testa se setores, gêneros e raças são resolvidos sem consulta por linha."""
+        lines = [record(patient=PATIENT) for _ in range(50)]
+        lookup = ingestion_services.ReferenceLookup()
+        # SAVEPOINT, pacientes existentes, dois INSERT e RELEASE, qualquer que
+        # seja o número de linhas
+        with self.assertNumQueries(5):
+            results = self.ingest(lines, lookup=lookup)
+        self.assertTrue(all("id" in result for result in results))
+
+        patient = EventPatient.objects.get()
+        self.assertEqual(patient.patient_name_search, "jose da silva")
+        self.assertEqual(patient.genere.name, "Masculino")
+        self.assertEqual(patient.race.name, "Parda")
+        self.assertEqual(EventOcurrence.objects.filter(patient_involved=True).count(), 50)
+
+    def test_results_per_line(self):
+        """Testa se cada linha recebe o seu resultado e as válidas são gravadas."""
+        lines = [
+            record(),
+            "{ quebrado",
+            "",
+            record(notified_department="Inexistente", ocurrence_date="ontem"),
+            record(patient_involved=True),
+            record(patient=dict(PATIENT, attendance="abc")),
+            record(),
+        ]
+        results = self.ingest(lines, chunk_size=2)
+        self.assertEqual([result["line"] for result in results], [1, 2, 4, 5, 6, 7])
+        self.assertIn("id", results[0])
+        self.assertEqual(results[1]["errors"], {"__all__": ["JSON inválido."]})
+        self.assertEqual(
+            set(results[2]["errors"]), {"notified_department", "ocurrence_date"}
+        )
+        self.assertEqual(set(results[3]["errors"]), {"patient"})
+        self.assertEqual(set(results[4]["errors"]), {"patient.attendance"})
+        self.assertIn("id", results[5])
+        self.assertEqual(EventOcurrence.objects.count(), 2)
+        self.assertFalse(EventPatient.objects.exists())
+
+    def test_view(self):
+        """Testa se o endpoint exige permissão, aceita NDJSON e responde por linha."""
+        url = reverse("events:event_ingest")
+        body = "\n".join([record(patient=PATIENT), record(notified_department=None)])
+        self.assertEqual(
+            self.client.post(url, body, content_type="application/x-ndjson").status_code,
+            403,
+        )
+
+        self.set_permission(EventOcurrence, "add_eventocurrence")
+        self.assertEqual(
+            self.client.post(url, body, content_type="text/plain").status_code, 415
+        )
+        response = self.client.post(url, body, content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, 200)
+        results = [json.loads(line) for line in response.content.decode().splitlines()]
+        self.assertEqual(results[0]["id"], EventOcurrence.objects.get().pk)
+        self.assertEqual(
+            results[1],
+            {"line": 2, "errors": {"notified_department": ["Este campo é obrigatório."]}},
+        )
+
+    def test_command(self):
+        """Testa se o comando importa um arquivo NDJSON."""
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson") as file:
+            file.write("\n".join([record(), record(), "[]"]))
+            file.flush()
+            out, err = StringIO(), StringIO()
+            call_command("ingest_ocurrences", file.name, stdout=out, stderr=err)
+        self.assertIn("2 occurrences created, 1 lines rejected", out.getvalue())
+        self.assertIn('"line": 3', err.getvalue())
+        self.assertEqual(EventOcurrence.objects.count(), 2)
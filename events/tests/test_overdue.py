@@ -0,0 +1,111 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from classifications.models import (
+    DamageClassification,
+    IncidentClassification,
+    OcurrenceClassification,
+)
+from departments.models import Department
+from events.models import (
+    DepartmentOverdueCounter,
+    EventOcurrence,
+    ResponseOcurrence,
+)
+from events.models.metas_models import Metas
+from events.models.ocurrence_description_models import OcurrenceDescription
+from events.services import overdue_services
+from utils.test import SetUpInitial
+
+
+class OverdueSweepTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.today = timezone.localdate()
+        self.department = Department.objects.get(id=2)
+        self.description = OcurrenceDescription.objects.create(
+            name="Não se Aplica", owner=self.user
+        )
+        self.meta = Metas.objects.create(name="Meta 1", owner=self.user)
+        self.incident = IncidentClassification.objects.create(
+            classification="Incidente sem dano"
+        )
+        self.ocurrence_classification = OcurrenceClassification.objects.create(
+            classification="Improcedente"
+        )
+        self.damage = DamageClassification.objects.create(classification="Dano Leve")
+
+    def create_response(self, days, **kwargs):
+        now = timezone.now()
+        ocurrence = EventOcurrence.objects.create(
+            ocurrence_date=now.date(),
+            ocurrence_time=now.time(),
+            reporting_department=Department.objects.get(id=1),
+            notified_department=self.department,
+            description_ocurrence="Descrição",
+            immediate_action="Ação",
+        )
+        return ResponseOcurrence.objects.create(
+            ocurrence=ocurrence,
+            owner=self.user,
+            ocurrence_description=self.description,
+            meta=self.meta,
+            description="Tratativa",
+            incident_classification=self.incident,
+            ocurrence_classification=self.ocurrence_classification,
+            damage_classification=self.damage,
+            deadline_response=self.today + timedelta(days=days),
+            **kwargs,
+        )
+
+    def overdue(self):
+        return set(
+            ResponseOcurrence.objects.filter(is_overdue=True).values_list(
+                "pk", flat=True
+            )
+        )
+
+    def counter(self):
+        return DepartmentOverdueCounter.objects.get(department=self.department).overdue
+
+    def test_sweep_flags_and_counts(self):
+        """Testa se a varredura marca as tratativas vencidas e conta por setor."""
+        late = self.create_response(-3)
+        later = self.create_response(-1)
+        self.create_response(0)
+        self.create_response(-5, resolved=True)
+
+        call_command("sweep_overdue_responses", stdout=StringIO())
+        self.assertEqual(self.overdue(), {late.pk, later.pk})
+        self.assertEqual(self.counter(), 2)
+
+        late.resolved = True
+        late.save()
+        call_command("sweep_overdue_responses", stdout=StringIO())
+        self.assertEqual(self.overdue(), {later.pk})
+        self.assertEqual(self.counter(), 1)
+
+        ResponseOcurrence.objects.filter(pk=later.pk).update(
+            deadline_response=self.today + timedelta(days=2)
+        )
+        call_command("sweep_overdue_responses", stdout=StringIO())
+        self.assertEqual(self.overdue(), set())
+        self.assertEqual(self.counter(), 0)
+
+    def test_flag_in_bounded_batches(self):
+        """Testa se a varredura respeita o limite de lotes, da mais antiga para a mais nova."""
+        oldest = self.create_response(-10)
+        self.create_response(-5)
+        self.create_response(-1)
+
+        self.assertEqual(
+            list(overdue_services.flag_overdue(batch_size=1, max_batches=1)), [1]
+        )
+        self.assertEqual(self.overdue(), {oldest.pk})
+        self.assertEqual(
+            list(overdue_services.flag_overdue(batch_size=1)), [1, 1]
+        )
+        self.assertEqual(len(self.overdue()), 3)
@@ -0,0 +1,99 @@
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from departments.models import Department
+from events.models.event_ocurrence_models import EventOcurrence
+from events.views.event_ocurrence_views import EventListView
+from utils.test import SetUpInitial
+
+
+class PageCacheTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.ocurrence = self.create_ocurrence()
+
+    def create_ocurrence(self):
+        now = timezone.now()
+        return EventOcurrence.objects.create(
+            ocurrence_date=now.date(),
+            ocurrence_time=now.time(),
+            reporting_department=Department.objects.get(id=1),
+            notified_department=Department.objects.get(id=2),
+            description_ocurrence="Descrição",
+            immediate_action="Ação",
+        )
+
+    def test_list_cached_until_change(self):
+        """Testa se a lista fica em cache até uma ocorrência mudar."""
+        url = reverse("events:event_no_response")
+        first = self.client.get(url)
+        self.assertEqual(list(first.context["events"]), [self.ocurrence])
+        self.assertIn("private", first["Cache-Control"])
+
+        cached = self.client.get(url)
+        self.assertIsNone(cached.context)
+        self.assertEqual(cached.content, first.content)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ocurrence = self.create_ocurrence()
+        self.assertEqual(
+            list(self.client.get(url).context["events"]), [self.ocurrence, ocurrence]
+        )
+
+    def test_datatable_count_cached(self):
+        """Testa se a contagem da tabela é reaproveitada entre requisições."""
+        url = reverse("events:event_no_response")
+
+        def count_queries(draw):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, {"draw": draw})
+                b"".join(response.streaming_content)
+            return [q for q in context.captured_queries if "COUNT(" in q["sql"]]
+
+        self.assertEqual(len(count_queries(1)), 1)
+        self.assertEqual(count_queries(2), [])
+
+    def test_success_invalidated_by_department(self):
+        """Testa se a página de sucesso é atualizada quando o setor muda."""
+        url = reverse("events:event_success", args=[self.ocurrence.pk])
+        self.assertContains(self.client.get(url), "TI")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            department = Department.objects.get(id=2)
+            department.name = "Tecnologia"
+            department.save()
+        self.assertContains(self.client.get(url), "Tecnologia")
+
+    def test_not_found_not_cached(self):
+        """Testa se respostas de erro não ficam em cache."""
+        url = reverse("events:event_success", args=[self.ocurrence.pk + 1])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        with self.captureOnCommitCallbacks(execute=True):
+            ocurrence = self.create_ocurrence()
+        self.assertEqual(ocurrence.pk, self.ocurrence.pk + 1)
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_key_varies_on_user_and_departments(self):
+        """Testa se a chave da página depende do usuário e dos seus setores."""
+        other = self.User.objects.create_user(
+            email="outro@123.com", username="outro", password="password"
+        )
+        other.departments.add(Department.objects.get(id=2))
+        colleague = self.User.objects.create_user(
+            email="colega@123.com", username="colega", password="password"
+        )
+        colleague.departments.add(Department.objects.get(id=1))
+
+        def key_for(user):
+            request = RequestFactory().get(reverse("events:event_no_response"))
+            request.user = user
+            view = EventListView()
+            view.setup(request)
+            return view.get_page_cache_key()
+
+        self.assertEqual(key_for(self.user), key_for(self.user))
+        self.assertNotEqual(key_for(self.user), key_for(colleague))
+        self.assertNotEqual(key_for(self.user), key_for(other))
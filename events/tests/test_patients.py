@@ -0,0 +1,93 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from departments.models import Department
+from events.models import EventOcurrence, EventPatient
+from events.services import patient_services
+from utils.test import SetUpInitial
+
+
+class PatientUpsertTest(SetUpInitial):
+    def patient_data(self, **kwargs):
+        data = {
+            "patient_name": "José da Silva",
+            "attendance": 123,
+            "record": 456,
+            "birth_date": "1950-01-01",
+            "internment_date": "2026-09-30",
+        }
+        data.update(kwargs)
+        return data
+
+    def create_ocurrence(self, patient):
+        now = timezone.now()
+        return EventOcurrence.objects.create(
+            ocurrence_date=now.date(),
+            ocurrence_time=now.time(),
+            reporting_department=Department.objects.get(id=1),
+            notified_department=Department.objects.get(id=2),
+            patient_involved=True,
+            patient=patient,
+            description_ocurrence="Descrição",
+            immediate_action="Ação",
+        )
+
+    def test_unique_active_patient(self):
+        """Testa se só existe um paciente ativo por atendimento e prontuário."""
+        patient = EventPatient.objects.create(**self.patient_data())
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            EventPatient.objects.create(**self.patient_data())
+
+        patient.soft_delete()
+        EventPatient.objects.create(**self.patient_data())
+
+    def test_upsert_reuses_patient(self):
+        """Testa se o paciente do mesmo atendimento é reaproveitado e atualizado."""
+        patient, created = patient_services.upsert_patient(self.patient_data())
+        self.assertTrue(created)
+        again, created = patient_services.upsert_patient(
+            self.patient_data(patient_name="José da Silva Santos")
+        )
+        self.assertFalse(created)
+        self.assertEqual(again.pk, patient.pk)
+        again.refresh_from_db()
+        self.assertEqual(again.patient_name_search, "jose da silva santos")
+
+    def test_bulk_upsert(self):
+        """Testa se o upsert em lote reaproveita pacientes existentes e repetidos."""
+        existing = EventPatient.objects.create(**self.patient_data())
+        patients = [
+            EventPatient(**self.patient_data(patient_name="Atualizado")),
+            EventPatient(**self.patient_data(attendance=789)),
+            EventPatient(**self.patient_data(attendance=789)),
+        ]
+        saved = patient_services.upsert_patients(patients)
+        self.assertEqual(saved[0].pk, existing.pk)
+        self.assertEqual(saved[1].pk, saved[2].pk)
+        self.assertEqual(EventPatient.objects.count(), 2)
+        existing.refresh_from_db()
+        self.assertEqual(existing.patient_name, "Atualizado")
+
+    def test_merge_command(self):
+        """Testa se o comando une pacientes duplicados e reaponta as ocorrências."""
+        with connection.cursor() as cursor:
+            cursor.execute('DROP INDEX "unique_active_patient"')
+        first = EventPatient.objects.create(**self.patient_data())
+        second = EventPatient.objects.create(**self.patient_data())
+        other = EventPatient.objects.create(**self.patient_data(attendance=789))
+        third = EventPatient.objects.create(**self.patient_data(attendance=789))
+        ocurrences = [self.create_ocurrence(patient) for patient in (first, second, third)]
+
+        call_command("merge_duplicate_patients", batch_size=1, stdout=StringIO())
+
+        self.assertEqual(
+            set(EventPatient.objects.values_list("pk", flat=True)), {first.pk, other.pk}
+        )
+        self.assertEqual(
+            [EventOcurrence.objects.get(pk=o.pk).patient_id for o in ocurrences],
+            [first.pk, first.pk, other.pk],
+        )
+        self.assertFalse(patient_services.duplicate_groups(EventPatient).exists())
@@ -0,0 +1,126 @@
+from django.utils import timezone
+
+from classifications.models import (
+    DamageClassification,
+    IncidentClassification,
+    OcurrenceClassification,
+)
+from departments.models import Department
+from events.models import EventPatient, ResponseOcurrence
+from events.models.event_ocurrence_models import EventOcurrence
+from events.models.gender_models import Gender
+from events.models.metas_models import Metas
+from events.models.ocurrence_description_models import OcurrenceDescription
+from events.models.race_models import Race
+from events.services.reference_services import reference_data
+from utils.test import SetUpInitial
+
+
+class ReferenceDataTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        self.patient = EventPatient.objects.create(
+            patient_name="Maria da Silva",
+            attendance=123,
+            record=456,
+            birth_date=now.date(),
+            internment_date=now.date(),
+            genere=Gender.objects.create(name="Feminino"),
+            race=Race.objects.create(name="Parda"),
+        )
+        ocurrence = EventOcurrence.objects.create(
+            ocurrence_date=now.date(),
+            ocurrence_time=now.time(),
+            reporting_department=Department.objects.get(id=1),
+            notified_department=Department.objects.get(id=2),
+            patient_involved=True,
+            patient=self.patient,
+            description_ocurrence="Descrição",
+            immediate_action="Ação",
+        )
+        self.response = ResponseOcurrence.objects.create(
+            ocurrence=ocurrence,
+            owner=self.user,
+            ocurrence_description=OcurrenceDescription.objects.create(
+                name="Não se Aplica", owner=self.user
+            ),
+            meta=Metas.objects.create(name="Meta 1", owner=self.user),
+            description="Tratativa",
+            incident_classification=IncidentClassification.objects.create(
+                classification="Incidente sem dano"
+            ),
+            ocurrence_classification=OcurrenceClassification.objects.create(
+                classification="Improcedente"
+            ),
+            damage_classification=DamageClassification.objects.create(
+                classification="Dano Leve"
+            ),
+        )
+
+    def test_foreign_keys_without_queries(self):
+        """Testa se as tabelas de referência são acessadas sem consultas."""
+        for model in reference_data.models:
+            reference_data.table(model)
+        response = ResponseOcurrence.objects.get(pk=self.response.pk)
+        patient = EventPatient.objects.get(pk=self.patient.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [
+                    str(response.meta),
+                    str(response.ocurrence_description),
+                    str(response.incident_classification),
+                    str(response.ocurrence_classification),
+                    str(response.damage_classification),
+                    str(patient.genere),
+                    str(patient.race),
+                ],
+                [
+                    "Meta 1",
+                    "Não se Aplica",
+                    "Incidente sem dano",
+                    "Improcedente",
+                    "Dano Leve",
+                    "Feminino",
+                    "Parda",
+                ],
+            )
+
+    def test_reloaded_on_change(self):
+        """Testa se a tabela é recarregada quando uma linha muda."""
+        reference_data.table(Gender)
+        with self.captureOnCommitCallbacks(execute=True):
+            Gender.objects.filter(pk=self.patient.genere_id).update(name="Outro")
+        self.assertEqual(
+            str(EventPatient.objects.get(pk=self.patient.pk).genere), "Feminino"
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            gender = Gender.objects.get(pk=self.patient.genere_id)
+            gender.name = "Masculino"
+            gender.save()
+        self.assertEqual(
+            str(EventPatient.objects.get(pk=self.patient.pk).genere), "Masculino"
+        )
+
+    def test_soft_deleted_rows_resolve(self):
+        """Testa se linhas excluídas continuam acessíveis pela chave estrangeira."""
+        with self.captureOnCommitCallbacks(execute=True):
+            DamageClassification.objects.filter(
+                pk=self.response.damage_classification_id
+            ).soft_delete()
+        damage = ResponseOcurrence.objects.get(pk=self.response.pk).damage_classification
+        self.assertEqual(damage.classification, "Dano Leve")
+        self.assertTrue(damage.is_deleted)
+
+    def test_rows_are_copies(self):
+        """Testa se alterar uma linha obtida não altera a tabela."""
+        response = ResponseOcurrence.objects.get(pk=self.response.pk)
+        response.meta.name = "Alterada"
+        self.assertEqual(
+            ResponseOcurrence.objects.get(pk=self.response.pk).meta.name, "Meta 1"
+        )
+        self.assertIsNot(
+            reference_data.get(Metas, self.response.meta_id),
+            reference_data.get(Metas, self.response.meta_id),
+        )
@@ -0,0 +1,129 @@
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+
+from classifications.models import (
+    DamageClassification,
+    IncidentClassification,
+    OcurrenceClassification,
+)
+from departments.models import Department
+from events.models import EventOcurrence, ResponseOcurrence
+from events.models.metas_models import Metas
+from events.models.ocurrence_description_models import OcurrenceDescription
+from events.services import search_services
+from utils.test import SetUpInitial
+from utils.text import fold, stem
+
+
+class TextHelpersTest(SetUpInitial):
+    def test_fold(self):
+        """Testa se acentos e maiúsculas são removidos."""
+        self.assertEqual(fold("Administração"), "administracao")
+
+    def test_stem_groups_inflections(self):
+        """Testa se flexões da mesma palavra têm o mesmo radical."""
+        self.assertEqual(stem("queda"), stem("quedas"))
+        self.assertEqual(stem("medicacao"), stem("medicado"))
+        self.assertEqual(stem("lesao"), stem("lesoes"))
+
+
+@skipUnless(search_services.is_supported(connection), "Busca textual indisponível.")
+class OcurrenceSearchTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.fall = self.create_ocurrence(
+            "Queda do paciente no banheiro", "Paciente avaliado pela equipe"
+        )
+        self.medication = self.create_ocurrence(
+            "Erro na administração de medicação", "Prescrição revisada"
+        )
+
+    def create_ocurrence(self, description, action):
+        now = timezone.now()
+        return EventOcurrence.objects.create(
+            ocurrence_date=now.date(),
+            ocurrence_time=now.time(),
+            reporting_department=Department.objects.get(id=1),
+            notified_department=Department.objects.get(id=2),
+            description_ocurrence=description,
+            immediate_action=action,
+        )
+
+    def ids(self, query):
+        return [pk for pk, _ in search_services.search_ocurrences(query)]
+
+    def test_stemming_and_accent_folding(self):
+        """Testa se a busca ignora acentos e flexões."""
+        self.assertEqual(self.ids("quedas"), [self.fall.pk])
+        self.assertEqual(self.ids("MEDICACAO"), [self.medication.pk])
+        self.assertEqual(self.ids("prescricoes"), [self.medication.pk])
+        self.assertEqual(self.ids("queda de medicação"), [])
+
+    def test_blank_and_punctuation_queries(self):
+        """Testa se buscas vazias ou só com pontuação não retornam resultados."""
+        for query in ("", "   ", "_", "__ -- \"", "de"):
+            self.assertEqual(search_services.search_ocurrences(query), [])
+        self.assertEqual(search_services.sqlite_match_query("_ * \""), "")
+        self.assertEqual(self.ids("queda_banheiro"), [self.fall.pk])
+
+    def test_index_follows_changes(self):
+        """Testa se os gatilhos mantêm o índice atualizado."""
+        self.fall.description_ocurrence = "Paciente escorregou"
+        self.fall.save()
+        self.assertEqual(self.ids("queda"), [])
+        self.assertEqual(self.ids("escorregou"), [self.fall.pk])
+
+        EventOcurrence.objects.filter(pk=self.fall.pk).soft_delete()
+        self.assertEqual(self.ids("escorregou"), [])
+
+    def test_response_description_is_searched(self):
+        """Testa se a descrição da tratativa entra na busca."""
+        response = ResponseOcurrence.objects.create(
+            ocurrence=self.fall,
+            owner=self.user,
+            ocurrence_description=OcurrenceDescription.objects.create(
+                name="Não se Aplica", owner=self.user
+            ),
+            meta=Metas.objects.create(name="Meta 6", owner=self.user),
+            description="Instalado corrimão",
+            incident_classification=IncidentClassification.objects.create(
+                classification="Incidente sem dano"
+            ),
+            ocurrence_classification=OcurrenceClassification.objects.create(
+                classification="Improcedente"
+            ),
+            damage_classification=DamageClassification.objects.create(
+                classification="Nenhum"
+            ),
+        )
+        self.assertEqual(self.ids("corrimao"), [self.fall.pk])
+
+        response.delete()
+        self.assertEqual(self.ids("corrimao"), [])
+
+    def test_ranking(self):
+        """Testa se a descrição pesa mais do que a ação imediata."""
+        other = self.create_ocurrence("Equipe acionada", "Queda registrada")
+        self.assertEqual(self.ids("queda"), [self.fall.pk, other.pk])
+
+    def test_rebuild_command(self):
+        """Testa se o comando reconstrói o índice a partir das tabelas."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search_services.SEARCH_TABLE}")
+        self.assertEqual(self.ids("queda"), [])
+
+        call_command("rebuild_search_index", stdout=None)
+        self.assertEqual(self.ids("queda"), [self.fall.pk])
+
+    def test_search_view(self):
+        """Testa se a view de busca exige permissão e lista os resultados."""
+        url = reverse("events:event_search")
+        self.assertEqual(self.client.get(url, {"q": "queda"}).status_code, 403)
+
+        self.set_permission(EventOcurrence, "view_eventocurrence")
+        response = self.client.get(url, {"q": "queda"})
+        self.assertEqual(list(response.context["events"]), [self.fall])
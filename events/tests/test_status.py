@@ -0,0 +1,87 @@
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from classifications.models import (
+    DamageClassification,
+    IncidentClassification,
+    OcurrenceClassification,
+)
+from departments.models import Department
+from events.models import EventOcurrence, OcurrenceStatus, ResponseOcurrence
+from events.models.metas_models import Metas
+from events.models.ocurrence_description_models import OcurrenceDescription
+from utils.test import SetUpInitial
+
+
+class OcurrenceStatusTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        self.ocurrence = EventOcurrence.objects.create(
+            ocurrence_date=now.date(),
+            ocurrence_time=now.time(),
+            reporting_department=Department.objects.get(id=1),
+            notified_department=Department.objects.get(id=2),
+            description_ocurrence="Descrição",
+            immediate_action="Ação",
+        )
+
+    def create_response(self, **kwargs):
+        return ResponseOcurrence.objects.create(
+            ocurrence=self.ocurrence,
+            owner=self.user,
+            ocurrence_description=OcurrenceDescription.objects.create(
+                name="Não se Aplica", owner=self.user
+            ),
+            meta=Metas.objects.create(name="Meta 1", owner=self.user),
+            description="Tratativa",
+            incident_classification=IncidentClassification.objects.create(
+                classification="Incidente sem dano"
+            ),
+            ocurrence_classification=OcurrenceClassification.objects.create(
+                classification="Improcedente"
+            ),
+            damage_classification=DamageClassification.objects.create(
+                classification="Dano Leve"
+            ),
+            **kwargs,
+        )
+
+    def assertStatus(self, status):
+        self.ocurrence.refresh_from_db()
+        self.assertEqual(self.ocurrence.status, status)
+
+    def test_new_ocurrence_is_pending(self):
+        """Testa se uma nova ocorrência começa pendente."""
+        self.assertStatus(OcurrenceStatus.PENDING)
+
+    def test_status_follows_response(self):
+        """Testa se o status acompanha a criação e a resolução da tratativa."""
+        response = self.create_response()
+        self.assertStatus(OcurrenceStatus.RESPONDED)
+
+        response.resolved = True
+        response.save()
+        self.assertStatus(OcurrenceStatus.RESOLVED)
+
+        response.delete()
+        self.assertStatus(OcurrenceStatus.PENDING)
+
+    def test_backfill_command(self):
+        """Testa se o comando recalcula o status a partir das tratativas."""
+        self.create_response(resolved=True)
+        EventOcurrence.objects.update(status=OcurrenceStatus.PENDING)
+
+        call_command("backfill_ocurrence_status", batch_size=1, stdout=None)
+        self.assertStatus(OcurrenceStatus.RESOLVED)
+
+    def test_inbox_lists_only_pending(self):
+        """Testa se a lista de ocorrências para tratar mostra apenas pendentes."""
+        url = reverse("events:event_no_response")
+        self.assertEqual(
+            list(self.client.get(url).context["events"]), [self.ocurrence]
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_response()
+        self.assertEqual(list(self.client.get(url).context["events"]), [])
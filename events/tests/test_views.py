@@ -0,0 +1,77 @@
+from django.urls import reverse
+from django.utils import timezone
+
+from classifications.models import (
+    DamageClassification,
+    IncidentClassification,
+    OcurrenceClassification,
+)
+from departments.models import Department
+from events.models import EventOcurrence, EventPatient, ResponseOcurrence
+from events.models.gender_models import Gender
+from events.models.metas_models import Metas
+from events.models.ocurrence_description_models import OcurrenceDescription
+from events.models.race_models import Race
+from utils.test import SetUpInitial
+
+
+class EventResponseOcurrenceCreateViewTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.set_permission(ResponseOcurrence, "add_responseocurrence")
+        now = timezone.now()
+        self.patient = EventPatient.objects.create(
+            patient_name="Maria da Silva",
+            attendance=123,
+            record=456,
+            birth_date=now.date(),
+            internment_date=now.date(),
+            genere=Gender.objects.create(name="Feminino"),
+            race=Race.objects.create(name="Parda"),
+        )
+        self.ocurrence = EventOcurrence.objects.create(
+            ocurrence_date=now.date(),
+            ocurrence_time=now.time(),
+            reporting_department=Department.objects.get(id=1),
+            notified_department=Department.objects.get(id=2),
+            patient_involved=True,
+            patient=self.patient,
+            description_ocurrence="Descrição",
+            immediate_action="Ação",
+        )
+        self.url = reverse("events:response_event_create", args=[self.ocurrence.pk])
+
+    def create_response(self):
+        return ResponseOcurrence.objects.create(
+            ocurrence=self.ocurrence,
+            owner=self.user,
+            ocurrence_description=OcurrenceDescription.objects.create(
+                name="Não se Aplica", owner=self.user
+            ),
+            meta=Metas.objects.create(name="Meta 1", owner=self.user),
+            description="Tratativa",
+            incident_classification=IncidentClassification.objects.create(
+                classification="Incidente sem dano"
+            ),
+            ocurrence_classification=OcurrenceClassification.objects.create(
+                classification="Improcedente"
+            ),
+            damage_classification=DamageClassification.objects.create(
+                classification="Dano Leve"
+            ),
+        )
+
+    def test_page_queries(self):
+        """Testa se a página carrega ocorrência, paciente e tratativa em uma única consulta."""
+        response = self.create_response()
+        # Ocorrência com paciente, setores e tratativa; sessão, usuário e duas
+        # de permissões; e as opções dos quatro campos de seleção do formulário
+        with self.assertNumQueries(9):
+            page = self.client.get(self.url)
+        self.assertEqual(page.status_code, 200)
+        self.assertEqual(page.context["patient"], self.patient)
+        self.assertEqual(page.context["responses"], [response])
+
+        # Com as opções dos campos de seleção em cache
+        with self.assertNumQueries(5):
+            self.client.get(self.url)
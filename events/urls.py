@@ -17,9 +17,11 @@ Including another URLconf
 from django.urls import path
 
 from events.views.event_ocurrence_views import (
+    EventIngestionView,
+    EventListView,
     EventOcurrenceCreateView,
+    EventSearchView,
     EventSucessTemplateView,
-    EventListView,
 )
 from events.views.event_response_ocurrence_views import (
     EventResponseOcurrenceCreateView,
@@ -43,5 +45,15 @@ urlpatterns = [
         'events/no_response/',
         EventListView.as_view(),
         name='event_no_response'
-    )
+    ),
+    path(
+        'events/search/',
+        EventSearchView.as_view(),
+        name='event_search'
+    ),
+    path(
+        'events/ingest/',
+        EventIngestionView.as_view(),
+        name='event_ingest'
+    ),
 ]
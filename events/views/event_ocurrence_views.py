@@ -1,16 +1,41 @@
 """ Module views for Events """
+import json
 from datetime import datetime
 
-from django.http import HttpResponse
-from django.shortcuts import get_object_or_404
+from django.contrib.auth.mixins import (
+    LoginRequiredMixin,
+    PermissionRequiredMixin,
+)
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse, HttpResponseBadRequest
+from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse, reverse_lazy
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import TemplateView
 from django.views.generic.edit import CreateView
 from django.views.generic.list import ListView
 
 from events.forms.event_ocurrence_forms import EventOcurrenceForm
 from events.forms.event_patient_forms import EventPatientForm
-from events.models.event_ocurrence_models import EventOcurrence
+from events.models.event_ocurrence_models import (
+    EventOcurrence,
+    OcurrenceStatus,
+)
+from events.services import (
+    idempotency_services,
+    ingestion_services,
+    patient_services,
+    search_services,
+)
+from utils.datatables import Column
+from utils.mixins import (
+    CachePolicyMixin,
+    ConditionalGetMixin,
+    CursorPaginationMixin,
+    DataTablesMixin,
+)
 
 
 class EventOcurrenceCreateView(CreateView):
@@ -28,7 +53,13 @@ class EventOcurrenceCreateView(CreateView):
         template_name (str): The name of the template used to render the form.
         success_url (str): The URL to redirect to after successfully submitting the form.
 
+    Submissions are idempotent: the form carries a random key, or clients send it in the
+    `Idempotency-Key` header, and replays of a key return the occurrence it created.
+
     Methods:
+        post(request):
+            Redirects replayed submissions to their original occurrence.
+
         get_context_data(**kwargs):
             Returns the context data to be rendered in the template, including the patient form and the current date.
 
@@ -45,10 +76,31 @@ class EventOcurrenceCreateView(CreateView):
     form_class = EventOcurrenceForm
     template_name = 'event/events_form.html'
     success_url = reverse_lazy('events:event_success')
+    idempotency_key = None
+
+    def post(self, request, *args, **kwargs) -> HttpResponse:
+        """
+        Handles the submission, redirecting replays to the occurrence
+        created by the first submission of the same idempotency key.
+
+        Returns:
+            HttpResponse: The redirect to the success page of the original
+            occurrence, or the response of the form processing.
+        """
+        try:
+            self.idempotency_key = idempotency_services.key_of(request)
+        except ValueError:
+            return HttpResponseBadRequest('Chave de idempotência inválida.')
+        if self.idempotency_key:
+            ocurrence_id = idempotency_services.replayed(self.idempotency_key)
+            if ocurrence_id:
+                return redirect('events:event_success', pk=ocurrence_id)
+        return super().post(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs: dict) -> dict[str, dict]:
         """
-        Adds additional context data to the form view, including a patient form and the current date.
+        Adds additional context data to the form view, including a patient form, the current date
+        and the idempotency key of the submission.
 
         Args:
             **kwargs: Additional keyword arguments passed to the context.
@@ -59,11 +111,16 @@ class EventOcurrenceCreateView(CreateView):
         context: dict = super().get_context_data(**kwargs)
         context['patient_form'] = EventPatientForm(self.request.POST or None)
         context['current_date'] = datetime.now()
+        context['idempotency_key'] = self.idempotency_key or idempotency_services.new_key()
         return context
 
     def form_valid(self, form) -> HttpResponse:
         """
-        Handles valid form submission. If the patient involved is specified, it validates and saves the patient form.
+        Handles valid form submission. If the patient involved is specified, it validates the patient form
+        and saves the patient, reusing the existing row of the same attendance and record.
+
+        The idempotency key, the patient and the occurrence are saved in a single transaction. If
+        another submission with the same key committed first, redirects to its occurrence instead.
 
         Args:
             form (EventOcurrenceForm): The event occurrence form that has been submitted.
@@ -73,14 +130,29 @@ class EventOcurrenceCreateView(CreateView):
         """
         context = self.get_context_data()
         patient_form = context['patient_form']
-        if form.cleaned_data.get('patient_involved'):
-            if patient_form.is_valid():
-                patient = patient_form.save()
-                form.instance.patient = patient
-            else:
-                return self.form_invalid(form)
-
-        return super().form_valid(form)
+        patient_involved = form.cleaned_data.get('patient_involved')
+        if patient_involved and not patient_form.is_valid():
+            return self.form_invalid(form)
+
+        try:
+            with transaction.atomic():
+                if self.idempotency_key:
+                    stored_key = idempotency_services.claim(self.idempotency_key)
+                if patient_involved:
+                    patient, _ = patient_services.upsert_patient(patient_form.cleaned_data)
+                    form.instance.patient = patient
+                response = super().form_valid(form)
+                if self.idempotency_key:
+                    stored_key.ocurrence = self.object
+                    stored_key.save(update_fields=['ocurrence'])
+        except IntegrityError:
+            ocurrence_id = self.idempotency_key and idempotency_services.replayed(
+                self.idempotency_key
+            )
+            if not ocurrence_id:
+                raise
+            return redirect('events:event_success', pk=ocurrence_id)
+        return response
 
     def form_invalid(self, form) -> HttpResponse:
         """
@@ -105,7 +177,7 @@ class EventOcurrenceCreateView(CreateView):
         return reverse('events:event_success', kwargs={'pk': self.object.id})
 
 
-class EventSucessTemplateView(TemplateView):
+class EventSucessTemplateView(CachePolicyMixin, TemplateView):
     """
     View to display the success page after an event occurrence is submitted.
 
@@ -115,12 +187,14 @@ class EventSucessTemplateView(TemplateView):
 
     Attributes:
         template_name (str): The name of the template used to render the success page.
+        cache_tags (tuple[str]): The data shown by the page, invalidating its cache.
 
     Methods:
         get_context_data(**kwargs):
             Returns the context data to be rendered in the success page, including the event details.
     """
     template_name = "event/event_sucess.html"
+    cache_tags = ("events", "departments")
 
     def get_context_data(self, **kwargs: dict[str]) -> dict[str]:
         """
@@ -139,11 +213,116 @@ class EventSucessTemplateView(TemplateView):
         return context
 
 
-class EventListView(ListView):
+class EventListView(
+    ConditionalGetMixin,
+    CachePolicyMixin,
+    DataTablesMixin,
+    CursorPaginationMixin,
+    ListView,
+):
+    """
+    View listing the occurrences still waiting for a response.
+
+    Pages are selected by cursor on (created_at, id) and the total shown
+    is estimated, so no page has to count every pending occurrence. The
+    pending rows are read from the denormalized `status` column, served by
+    the partial index on pending occurrences, without joining responses.
+    The table is filled by DataTables from the same URL. Rendered pages
+    are cached until an occurrence, a response or a department changes,
+    and counts are recomputed by a single worker at a time. Refreshes of an
+    unchanged list are answered with 304 Not Modified.
+    """
     model = EventOcurrence
     template_name = "event/events_list.html"
     context_object_name = "events"
     paginate_by = 5
+    estimate_count = True
+    cache_count = True
+    datatable_cache_count = True
+    cache_tags = ("events", "responses", "departments")
+    cache_vary_on_permissions = True
+    datatable_columns = (
+        Column('id', searchable=True, lookup='exact', cast=int),
+        Column('reporting_department__name', searchable=True),
+        Column('notified_department__name', searchable=True),
+        Column('ocurrence_date'),
+        Column('patient_involved'),
+    )
+
+    def get_queryset(self):
+        return EventOcurrence.objects.filter(status=OcurrenceStatus.PENDING)
+
+    def is_conditional(self):
+        # DataTables requests carry a new `draw` each time and never revalidate.
+        return super().is_conditional() and not self.is_datatable_request()
+
+
+class EventSearchView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
+    """
+    View searching the occurrence narratives.
+
+    Searches the description, immediate action and response of the
+    occurrences through the full-text index (see
+    `events.services.search_services`), best matches first.
+
+    Attributes:
+        search_limit (int): The maximum number of results.
+    """
+    template_name = "event/events_search.html"
+    context_object_name = "events"
+    permission_required = "events.view_eventocurrence"
+    search_limit = 50
 
     def get_queryset(self):
-        return EventOcurrence.objects.filter(response_ocurrence__isnull=True)
\ No newline at end of file
+        """
+        Returns the occurrences matching the `q` query parameter, ranked.
+        """
+        self.query = self.request.GET.get("q", "").strip()
+        results = search_services.search_ocurrences(self.query, self.search_limit)
+        ocurrences = EventOcurrence.objects.select_related(
+            "reporting_department", "notified_department"
+        ).in_bulk([pk for pk, _ in results])
+        return [ocurrences[pk] for pk, _ in results if pk in ocurrences]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["query"] = self.query
+        return context
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class EventIngestionView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    """
+    Endpoint receiving occurrences in bulk from external systems.
+
+    Takes a POST of NDJSON, one occurrence per line with its patient in an
+    optional `patient` object, and answers NDJSON with the result of each
+    line: the `id` of the created occurrence or its `errors`. Valid lines
+    are saved even when others fail (see
+    `events.services.ingestion_services.ingest`).
+
+    CSRF checks are skipped so other systems can post with a session of a
+    service account. Only `application/x-ndjson` bodies are accepted,
+    which browsers cannot send cross-site without a CORS preflight.
+
+    Attributes:
+        content_type (str): The media type of requests and responses.
+        chunk_size (int): The number of lines inserted per transaction.
+    """
+    permission_required = "events.add_eventocurrence"
+    raise_exception = True
+    content_type = "application/x-ndjson"
+    chunk_size = 500
+
+    def post(self, request, *args, **kwargs):
+        if request.content_type != self.content_type:
+            return HttpResponse(
+                f"Envie os registros como {self.content_type}.", status=415
+            )
+        results = ingestion_services.ingest(request, chunk_size=self.chunk_size)
+        return HttpResponse(
+            "".join(
+                json.dumps(result, ensure_ascii=False) + "\n" for result in results
+            ),
+            content_type=self.content_type,
+        )
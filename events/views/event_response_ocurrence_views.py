@@ -4,6 +4,7 @@ from django.contrib.auth.mixins import (
     LoginRequiredMixin,
     PermissionRequiredMixin,
 )
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
 from django.views.generic.edit import FormView
@@ -11,7 +12,6 @@ from django.views.generic.list import ListView
 
 from events.forms.response_ocurrence_forms import ResponseOcurrenceForm
 from events.models.event_ocurrence_models import EventOcurrence
-from events.models.event_patient_models import EventPatient
 from events.models.response_ocurrence_models import ResponseOcurrence
 
 
@@ -33,17 +33,41 @@ class EventResponseOcurrenceCreateView(
     success_url = reverse_lazy('events:response_success')
     permission_required = "events.add_responseocurrence"
 
+    def get_ocurrence_queryset(self):
+        """
+        Returns the occurrences with everything the page shows loaded in
+        the same query: the patient with its gender and race, both
+        departments and the response with its foreign keys.
+
+        The response is a reverse one-to-one relation, so it is joined with
+        `select_related` instead of prefetched.
+        """
+        return EventOcurrence.objects.select_related(
+            'patient__genere',
+            'patient__race',
+            'reporting_department',
+            'notified_department',
+            'response_ocurrence__meta',
+            'response_ocurrence__ocurrence_description',
+            'response_ocurrence__incident_classification',
+            'response_ocurrence__ocurrence_classification',
+            'response_ocurrence__damage_classification',
+        )
+
     def dispatch(self, request, *args, **kwargs):
         """
         Retrieves the event occurrence corresponding to the provided `ocurrence_id`
         before processing the request.
         """
         ocurrence_id = self.kwargs.get('pk')
-        self.ocurrence = get_object_or_404(EventOcurrence, pk=ocurrence_id)
-        
+        self.ocurrence = get_object_or_404(
+            self.get_ocurrence_queryset(), pk=ocurrence_id
+        )
+
         if self.ocurrence.patient_involved:
-            patient_id = self.ocurrence.patient_id
-            self.patient = get_object_or_404(EventPatient, pk=patient_id)
+            if self.ocurrence.patient is None:
+                raise Http404('Paciente da ocorrência não encontrado.')
+            self.patient = self.ocurrence.patient
         return super().dispatch(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
@@ -52,7 +76,10 @@ class EventResponseOcurrenceCreateView(
         """
         context: dict = super().get_context_data(**kwargs)
         context['ocurrence'] = self.ocurrence
-        context['responses'] = ResponseOcurrence.objects.filter(ocurrence=self.ocurrence)
+        try:
+            context['responses'] = [self.ocurrence.response_ocurrence]
+        except ResponseOcurrence.DoesNotExist:
+            context['responses'] = []
         if self.ocurrence.patient_involved: context['patient'] = self.patient
         return context
 
@@ -0,0 +1,100 @@
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+from .search import folded_condition
+
+
+class SoftDeleteAdminMixin:
+    """
+    Admin mixin for models using `SoftDeleteModelMixin`.
+
+    Lists deleted objects too, adds a filter on `is_deleted` and provides
+    actions that soft delete or restore every selected object with a
+    single query through `SoftDeleteQuerySet`. The default
+    `delete_selected` action is removed, since it deletes the rows for good.
+
+    Methods:
+        get_queryset(request): Returns every object, including deleted ones.
+        get_list_filter(request): Adds `is_deleted` to the list filters.
+        get_actions(request): Returns the actions, without `delete_selected`.
+        soft_delete_selected(request, queryset): Soft deletes the selected objects.
+        restore_selected(request, queryset): Restores the selected objects.
+    """
+
+    actions = ["soft_delete_selected", "restore_selected"]
+
+    def get_queryset(self, request):
+        """Return every object, including the soft deleted ones."""
+        queryset = self.model.all_objects.get_queryset()
+        ordering = self.get_ordering(request)
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return queryset
+
+    def get_list_filter(self, request):
+        """Add `is_deleted` to the list filters."""
+        return (*super().get_list_filter(request), "is_deleted")
+
+    def get_actions(self, request):
+        """Drop the default action deleting the selected objects for good."""
+        actions = super().get_actions(request)
+        actions.pop("delete_selected", None)
+        return actions
+
+    @admin.action(
+        permissions=["delete"], description="Excluir (lógica) selecionados"
+    )
+    def soft_delete_selected(self, request, queryset):
+        updated = queryset.soft_delete()
+        self.message_user(
+            request, f"{updated} registro(s) excluído(s).", messages.SUCCESS
+        )
+
+    @admin.action(permissions=["change"], description="Restaurar selecionados")
+    def restore_selected(self, request, queryset):
+        updated = queryset.restore()
+        self.message_user(
+            request, f"{updated} registro(s) restaurado(s).", messages.SUCCESS
+        )
+
+
+class IndexedSearchAdminMixin:
+    """
+    Admin mixin replacing `icontains` searches with indexed lookups.
+
+    The search term is matched accent-insensitively anywhere in folded
+    shadow columns (see `utils.search.folded_condition`), served by their
+    trigram index on PostgreSQL, and exactly on the other fields, instead
+    of applying `UPPER` to every searched column of every row.
+
+    Attributes:
+        folded_search_fields (tuple[str]): Folded shadow columns, e.g. `name_search`.
+        exact_search_fields (tuple[str]): Fields matched by equality, e.g. numeric codes.
+
+    Methods:
+        get_search_fields(request): Returns the searched fields, to show the search box.
+        get_search_results(request, queryset, search_term): Filters the queryset by the search term.
+    """
+
+    folded_search_fields = ()
+    exact_search_fields = ()
+
+    def get_search_fields(self, request):
+        return (*self.folded_search_fields, *self.exact_search_fields)
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+
+        condition = Q()
+        for field in self.folded_search_fields:
+            condition |= folded_condition(queryset, field, search_term)
+        for field in self.exact_search_fields:
+            try:
+                value = self.model._meta.get_field(field).to_python(search_term)
+            except ValidationError:
+                continue
+            condition |= Q(**{field: value})
+        return queryset.filter(condition), False
@@ -0,0 +1,202 @@
+"""Archive tables mirroring the schema of soft deletable models."""
+
+from django.core.exceptions import ValidationError
+from django.db import connections, models, router, transaction
+from django.utils import timezone
+
+from . import signals
+
+
+def archive_model(model, module, name=None):
+    """
+    Build an archive model with the same columns as `model`.
+
+    Every concrete field is copied with its column name and type. The
+    primary key keeps the original values, foreign keys become plain
+    indexed `<name>_id` columns without database constraints, so archived
+    rows never block deletes elsewhere, and automatic timestamps are
+    preserved instead of being overwritten. An indexed `archived_at`
+    column records when the row was archived.
+
+    Must be called from the models module of the app owning the archive
+    table, so the model is registered and picked up by migrations.
+
+    Args:
+        model (type[Model]): The model to be mirrored.
+        module (str): The module defining the archive model, usually `__name__`.
+        name (str, optional): The archive model name. Defaults to `Archived<Model>`.
+
+    Returns:
+        type[Model]: The archive model, stored in `<table>_archive`.
+    """
+    opts = model._meta
+    attrs = {"__module__": module}
+    for field in opts.concrete_fields:
+        if field.primary_key:
+            attrs[field.attname] = models.BigIntegerField(primary_key=True)
+            continue
+        if field.is_relation:
+            attrs[field.attname] = models.BigIntegerField(
+                null=field.null, blank=field.blank, db_index=True
+            )
+            continue
+        _, _, args, kwargs = field.deconstruct()
+        kwargs.pop("unique", None)
+        kwargs.pop("auto_now", None)
+        kwargs.pop("auto_now_add", None)
+        attrs[field.attname] = field.__class__(*args, **kwargs)
+
+    attrs["archived_at"] = models.DateTimeField(
+        default=timezone.now, db_index=True
+    )
+    attrs["Meta"] = type(
+        "Meta",
+        (),
+        {
+            "db_table": f"{opts.db_table}_archive",
+            "verbose_name": f"{opts.verbose_name} (arquivo)",
+            "verbose_name_plural": f"{opts.verbose_name_plural} (arquivo)",
+        },
+    )
+    return type(name or f"Archived{opts.object_name}", (models.Model,), attrs)
+
+
+def _copy_rows(source, target, pks, extra_columns=None):
+    """
+    Copy rows between two tables with the same columns using a single
+    `INSERT ... SELECT`, so values are moved as stored, without loading
+    them into Python.
+    """
+    connection = connections[router.db_for_write(target)]
+    quote = connection.ops.quote_name
+    columns = [
+        field.column
+        for field in source._meta.concrete_fields
+        if field.column in {f.column for f in target._meta.concrete_fields}
+    ]
+    extra_columns = extra_columns or {}
+    insert_columns = columns + list(extra_columns)
+    select_columns = [quote(column) for column in columns] + ["%s"] * len(
+        extra_columns
+    )
+    placeholders = ", ".join(["%s"] * len(pks))
+    sql = (
+        f"INSERT INTO {quote(target._meta.db_table)} "
+        f"({', '.join(quote(column) for column in insert_columns)}) "
+        f"SELECT {', '.join(select_columns)} "
+        f"FROM {quote(source._meta.db_table)} "
+        f"WHERE {quote(source._meta.pk.column)} IN ({placeholders})"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*extra_columns.values(), *pks])
+
+
+def archive_batch(model, archived_model, queryset, batch_size) -> int:
+    """
+    Move one batch of rows from a model to its archive table.
+
+    The rows are copied and deleted inside a short transaction limited to
+    `batch_size` rows, so write locks are never held for long. Rows are
+    deleted through the ORM, so cascades and `post_delete` listeners run
+    as usual. Rows deleted by cascade, including many-to-many links, are
+    not archived, so `queryset` must leave out rows whose cascades would
+    lose data.
+    Since every batch commits on its own, an interrupted run resumes where
+    it stopped.
+
+    Args:
+        model (type[Model]): The model whose rows are archived.
+        archived_model (type[Model]): The archive model built by `archive_model`.
+        queryset (QuerySet): The rows eligible for archiving.
+        batch_size (int): The maximum number of rows moved.
+
+    Returns:
+        int: The number of rows archived.
+    """
+    with transaction.atomic():
+        pks = list(
+            queryset.order_by("pk").values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            return 0
+        archived_model._base_manager.filter(pk__in=pks).delete()
+        _copy_rows(model, archived_model, pks, {"archived_at": timezone.now()})
+        model._base_manager.filter(pk__in=pks).delete()
+    return len(pks)
+
+
+def missing_references(model, archived_model, pks) -> dict:
+    """
+    Find foreign keys of archived rows pointing to rows that are gone.
+
+    Args:
+        model (type[Model]): The model whose rows would be restored.
+        archived_model (type[Model]): The archive model built by `archive_model`.
+        pks (list[int]): The primary keys of the archived rows.
+
+    Returns:
+        dict[str, set[int]]: The missing primary keys, by foreign key name.
+    """
+    missing = {}
+    archived = archived_model._base_manager.filter(pk__in=pks)
+    for field in model._meta.concrete_fields:
+        if not field.is_relation:
+            continue
+        referenced = set(
+            archived.exclude(**{f"{field.attname}__isnull": True}).values_list(
+                field.attname, flat=True
+            )
+        )
+        existing = set(
+            field.related_model._base_manager.filter(
+                pk__in=referenced
+            ).values_list("pk", flat=True)
+        )
+        if referenced - existing:
+            missing[field.name] = referenced - existing
+    return missing
+
+
+def restore_rows(model, archived_model, pks) -> int:
+    """
+    Move rows from an archive table back to the model table.
+
+    Restored rows keep their primary keys and timestamps and are marked as
+    not deleted. A `restored` signal is sent for the batch.
+
+    Args:
+        model (type[Model]): The model whose rows are restored.
+        archived_model (type[Model]): The archive model built by `archive_model`.
+        pks (Iterable[int]): The primary keys of the archived rows.
+
+    Returns:
+        int: The number of rows restored.
+
+    Raises:
+        ValidationError: If a foreign key of the rows points to a row that
+            is not in its table, for instance because it was archived too.
+    """
+    with transaction.atomic():
+        pks = list(
+            archived_model._base_manager.filter(pk__in=list(pks)).values_list(
+                "pk", flat=True
+            )
+        )
+        if not pks:
+            return 0
+        missing = missing_references(model, archived_model, pks)
+        if missing:
+            raise ValidationError(
+                "Registros referenciados não encontrados: %(missing)s. "
+                "Restaure-os antes.",
+                params={
+                    "missing": ", ".join(
+                        f"{name}={sorted(ids)}" for name, ids in missing.items()
+                    )
+                },
+            )
+        _copy_rows(archived_model, model, pks)
+        archived_model._base_manager.filter(pk__in=pks).delete()
+        model._base_manager.filter(pk__in=pks).update(is_deleted=False)
+    signals.restored.send(sender=model, pks=pks)
+    return len(pks)
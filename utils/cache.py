@@ -0,0 +1,168 @@
+"""Helpers for versioned cache namespaces and expensive cached values."""
+
+import math
+import random
+import time
+
+from django.core.cache import cache
+
+
+def initial_version() -> int:
+    """
+    Return the version of a namespace whose counter is missing.
+
+    Taken from the clock, in microseconds, so a counter lost to a flush or
+    an eviction restarts above every version handed out before, and data
+    kept in memory under an old version is never mistaken for current.
+    """
+    return time.time_ns() // 1000
+
+
+def version_key(namespace: str) -> str:
+    """
+    Return the cache key holding the version counter of a namespace.
+
+    Args:
+        namespace (str): The name of the cache namespace.
+
+    Returns:
+        str: The cache key of the version counter.
+    """
+    return f"version:{namespace}"
+
+
+def get_version(namespace: str) -> int:
+    """
+    Return the current version of a cache namespace.
+
+    Versions are stored in the cache backend without expiration, so every
+    worker sharing the backend sees the same value. A missing counter is
+    initialized with `initial_version`.
+
+    Args:
+        namespace (str): The name of the cache namespace.
+
+    Returns:
+        int: The current version of the namespace.
+    """
+    key = version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, initial_version(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace: str) -> int:
+    """
+    Increment the version of a cache namespace.
+
+    Every key built with the previous version becomes unreachable and
+    expires on its own, which invalidates the whole namespace at once.
+
+    Args:
+        namespace (str): The name of the cache namespace.
+
+    Returns:
+        int: The new version of the namespace.
+    """
+    key = version_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, initial_version(), None)
+        return cache.get(key)
+
+
+def tag_namespace(tag: str) -> str:
+    """Return the namespace versioning the data of a cache tag."""
+    return f"tag:{tag}"
+
+
+def tag_versions(tags) -> tuple:
+    """
+    Return the current versions of cache tags.
+
+    Args:
+        tags (Iterable[str]): The tags, e.g. "events".
+
+    Returns:
+        tuple[int]: The version of each tag, in sorted tag order.
+    """
+    return tuple(get_version(tag_namespace(tag)) for tag in sorted(tags))
+
+
+def invalidate_tags(*tags) -> None:
+    """
+    Bump the versions of cache tags, which drops every entry keyed with
+    them.
+
+    Args:
+        *tags (str): The tags whose data changed.
+    """
+    for tag in tags:
+        bump_version(tag_namespace(tag))
+
+
+def get_or_refresh(key, compute, timeout, beta=1.0, lock_timeout=30, poll_interval=0.05):
+    """
+    Return a cached value, recomputing it in a single worker.
+
+    Guards expensive values, such as aggregates, against cache stampedes:
+
+    - Early refresh: a read may refresh the value before it expires, with
+      a probability growing as the expiry approaches and with the time the
+      value took to compute (XFetch), so a busy value is usually refreshed
+      by one reader before it expires at all.
+    - Single flight: the refresh takes a lock key with `cache.add`, and
+      only its holder computes the value.
+    - Stale while refreshing: the value stays in the cache `timeout`
+      seconds past its expiry. Readers that do not hold the lock get it
+      meanwhile instead of waiting. Readers finding no value at all wait
+      for the holder, up to `lock_timeout`, and compute it themselves if
+      it never comes.
+
+    Args:
+        key (str): The cache key of the value.
+        compute (Callable[[], Any]): Computes the value.
+        timeout (int): Seconds the value is fresh.
+        beta (float): How eagerly values are refreshed early. 0 disables it.
+        lock_timeout (int): Seconds the lock is held at most, in case its
+            holder dies.
+        poll_interval (float): Seconds between checks while waiting.
+
+    Returns:
+        Any: The cached or computed value.
+    """
+    entry = cache.get(key)
+    if entry is not None:
+        value, delta, expires = entry
+        if time.time() - delta * beta * math.log(1.0 - random.random()) < expires:
+            return value
+
+    lock = f"lock:{key}"
+    deadline = time.monotonic() + lock_timeout
+    locked = cache.add(lock, 1, lock_timeout)
+    while not locked:
+        if entry is not None:
+            return entry[0]
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(poll_interval)
+        entry = cache.get(key)
+        locked = entry is None and cache.add(lock, 1, lock_timeout)
+
+    try:
+        if locked:
+            # Another worker may have stored a newer value before the lock.
+            latest = cache.get(key)
+            if latest is not None and (entry is None or latest[2] > entry[2]):
+                return latest[0]
+        start = time.monotonic()
+        value = compute()
+        delta = time.monotonic() - start
+        cache.set(key, (value, delta, time.time() + timeout), timeout * 2)
+        return value
+    finally:
+        if locked:
+            cache.delete(lock)
@@ -0,0 +1,20 @@
+from django.utils.functional import SimpleLazyObject
+
+from .membership import get_membership
+
+
+def department_membership(request):
+    """
+    Expose the department membership of the current user to templates.
+
+    The membership is resolved lazily, so templates that never use it do
+    not trigger any query, and templates that do share the lookup already
+    made by the views of the same request.
+
+    Args:
+        request (HttpRequest): The current request.
+
+    Returns:
+        dict: A context with the `membership` variable.
+    """
+    return {"membership": SimpleLazyObject(lambda: get_membership(request))}
@@ -0,0 +1,161 @@
+"""Server-side processing of DataTables requests."""
+
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+
+
+class Column:
+    """
+    A column of a server-side DataTables table.
+
+    Attributes:
+        field (str): The ORM path of the column value, e.g. `notified_department__name`.
+        orderable (bool): Whether the table can be ordered by the column.
+        searchable (bool): Whether the global search matches the column.
+        lookup (str): The lookup used to search the column. Prefix lookups
+            keep the search on the column indexes.
+        cast (Callable, optional): Converts the search term for the column.
+            Terms it rejects with `ValueError` skip the column.
+    """
+
+    def __init__(
+        self, field, orderable=True, searchable=False, lookup="istartswith", cast=None
+    ):
+        self.field = field
+        self.orderable = orderable
+        self.searchable = searchable
+        self.lookup = lookup
+        self.cast = cast
+
+    def search_condition(self, term):
+        """
+        Build the condition matching the search term on the column.
+
+        Returns:
+            Q | None: The condition, or None when the term does not apply.
+        """
+        if not self.searchable:
+            return None
+        if self.cast is not None:
+            try:
+                term = self.cast(term)
+            except ValueError:
+                return None
+        return Q(**{f"{self.field}__{self.lookup}": term})
+
+
+def _to_int(value, default):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class DataTablesRequest:
+    """
+    The parameters of a DataTables server-side request.
+
+    Only the columns declared by the view are used: column indexes sent by
+    the browser select among them, so no arbitrary field can be ordered
+    or searched.
+
+    Attributes:
+        draw (int): The request counter, echoed back to DataTables.
+        start (int): The offset of the first row.
+        length (int): The number of rows, at most `max_length`.
+        search (str): The global search term.
+        ordering (list[str]): The `order_by` arguments.
+
+    Methods:
+        filter(queryset): Applies the global search.
+        page(queryset): Orders and slices the requested rows.
+    """
+
+    def __init__(self, params, columns, max_length=100):
+        self.columns = list(columns)
+        self.draw = _to_int(params.get("draw"), 0)
+        self.start = max(_to_int(params.get("start"), 0), 0)
+        length = _to_int(params.get("length"), 10)
+        self.length = max_length if length < 0 else min(max(length, 1), max_length)
+        self.search = params.get("search[value]", "").strip()[:100]
+
+        self.ordering = []
+        index = 0
+        while f"order[{index}][column]" in params:
+            column = _to_int(params.get(f"order[{index}][column]"), -1)
+            if 0 <= column < len(self.columns) and self.columns[column].orderable:
+                descending = params.get(f"order[{index}][dir]") == "desc"
+                self.ordering.append(
+                    f"{'-' if descending else ''}{self.columns[column].field}"
+                )
+            index += 1
+
+    @property
+    def fields(self) -> list:
+        """The ORM paths of the columns, in table order."""
+        return [column.field for column in self.columns]
+
+    def filter(self, queryset):
+        """Restrict a queryset to the rows matching the global search."""
+        if not self.search:
+            return queryset
+        condition = Q()
+        for column in self.columns:
+            column_condition = column.search_condition(self.search)
+            if column_condition is not None:
+                condition |= column_condition
+        if not condition:
+            return queryset.none()
+        return queryset.filter(condition)
+
+    def page(self, queryset):
+        """
+        Order and slice the requested rows.
+
+        The primary key is appended to the ordering, so rows never move
+        between pages.
+        """
+        if self.ordering:
+            queryset = queryset.order_by(*self.ordering, "pk")
+        return queryset[self.start : self.start + self.length]
+
+
+def stream_response(request, queryset, records_total, records_filtered):
+    """
+    Stream the response of a DataTables server-side request.
+
+    Rows are read with `values_list` in chunks and written as compact
+    JSON arrays as they come from the database, so the response never
+    builds model instances nor the whole payload in memory.
+
+    Args:
+        request (DataTablesRequest): The parsed request.
+        queryset (QuerySet): The rows of the page.
+        records_total (int): The number of rows before the search.
+        records_filtered (int): The number of rows after the search.
+
+    Returns:
+        StreamingHttpResponse: The `application/json` response.
+    """
+    header = json.dumps(
+        {
+            "draw": request.draw,
+            "recordsTotal": records_total,
+            "recordsFiltered": records_filtered,
+        },
+        separators=(",", ":"),
+    )
+
+    def content():
+        yield header[:-1] + ',"data":['
+        rows = queryset.values_list(*request.fields).iterator(chunk_size=request.length)
+        for index, row in enumerate(rows):
+            yield ("," if index else "") + json.dumps(
+                row, cls=DjangoJSONEncoder, separators=(",", ":")
+            )
+        yield "]}"
+
+    return StreamingHttpResponse(content(), content_type="application/json")
@@ -0,0 +1,147 @@
+"""Model choice fields and widgets rendered from the cache."""
+
+import hashlib
+
+from django import forms
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.forms.models import ModelChoiceIterator, ModelChoiceIteratorValue
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from .cache import bump_version, get_version
+
+
+def choices_namespace(model) -> str:
+    """
+    Return the cache namespace of the choices of a model.
+
+    Args:
+        model (type[Model]): The model whose rows are offered as choices.
+
+    Returns:
+        str: The namespace, versioned by `invalidate_choices`.
+    """
+    return f"choices:{model._meta.label_lower}"
+
+
+def invalidate_choices(model) -> None:
+    """Drop every cached choice list and option HTML of a model."""
+    bump_version(choices_namespace(model))
+
+
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    """
+    Iterator of model choices read from the cache.
+
+    The `(value, label)` pairs of the queryset are cached under the
+    version of the model's namespace and a digest of the SQL of the
+    queryset, so forms render their selects without querying. Saving,
+    deleting, soft deleting or restoring a row of the model bumps the
+    version (see `invalidate_choices`).
+
+    The values are yielded without their instance, so
+    `ModelChoiceIteratorValue.instance` is None.
+
+    Methods:
+        cache_key(): Returns the cache key of the choices of the queryset.
+        pairs(): Returns the cached `(value, label)` pairs.
+        options(): Returns the cached HTML of each `<option>`.
+    """
+
+    def cache_key(self) -> str:
+        """Return the cache key of the choices of the queryset."""
+        namespace = choices_namespace(self.queryset.model)
+        try:
+            sql = str(self.queryset.query)
+        except EmptyResultSet:
+            sql = ""
+        digest = hashlib.md5(sql.encode(), usedforsecurity=False).hexdigest()
+        return f"{namespace}:{get_version(namespace)}:{digest}"
+
+    def pairs(self) -> list:
+        """
+        Return the `(value, label)` pairs of the queryset, from the cache
+        or with a single query.
+        """
+        key = self.cache_key()
+        pairs = cache.get(key)
+        if pairs is None:
+            pairs = [
+                (self.field.prepare_value(obj), str(self.field.label_from_instance(obj)))
+                for obj in self.queryset
+            ]
+            cache.set(key, pairs, settings.CHOICES_CACHE_TIMEOUT)
+        return pairs
+
+    def options(self) -> list:
+        """
+        Return the HTML of each `<option>`, unselected, with the empty
+        choice first when the field has one.
+
+        Returns:
+            list[tuple[str, str]]: `(value, html)` pairs.
+        """
+        key = f"{self.cache_key()}:html"
+        options = cache.get(key)
+        if options is None:
+            choices = [(str(value), label) for value, label in self.pairs()]
+            if self.field.empty_label is not None:
+                choices.insert(0, ("", self.field.empty_label))
+            options = [
+                (value, format_html('<option value="{}">{}</option>', value, label))
+                for value, label in choices
+            ]
+            cache.set(key, options, settings.CHOICES_CACHE_TIMEOUT)
+        return options
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for value, label in self.pairs():
+            yield (ModelChoiceIteratorValue(value, None), label)
+
+    def __len__(self):
+        return len(self.pairs()) + (self.field.empty_label is not None)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.pairs())
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    """
+    `ModelChoiceField` whose choices come from the cache.
+
+    Rendering does not query the database. Validating a submitted value
+    still loads its row.
+    """
+
+    iterator = CachedModelChoiceIterator
+
+
+class CachedSelect(forms.Select):
+    """
+    `Select` rendering the cached option HTML of a `CachedModelChoiceField`.
+
+    Instead of rendering a template per option, the cached options are
+    joined and only the selected one is rendered again. Other choices are
+    rendered by `Select` as usual.
+    """
+
+    def render(self, name, value, attrs=None, renderer=None):
+        if not isinstance(self.choices, CachedModelChoiceIterator):
+            return super().render(name, value, attrs, renderer)
+        selected = set(self.format_value(value))
+        # Values are escaped, so the first ">" closes the opening tag.
+        options = "".join(
+            html.replace(">", " selected>", 1) if option_value in selected else html
+            for option_value, html in self.choices.options()
+        )
+        return format_html(
+            '<select name="{}"{}>{}</select>',
+            name,
+            flatatt(self.build_attrs(self.attrs, attrs)),
+            mark_safe(options),
+        )
@@ -1,16 +1,68 @@
 from django.db import models
+from django.utils import timezone
 
+from . import signals
 
-class NonDeletedManager(models.Manager):
+
+class SoftDeleteQuerySet(models.QuerySet):
+    """
+    QuerySet with bulk soft delete and restore.
+
+    Both operations issue a single `UPDATE` of `is_deleted` (and
+    `updated_at`, when the model has it) for the whole queryset instead of
+    saving each instance, then send one `soft_deleted` or `restored`
+    signal for the batch.
+
+    Methods:
+        soft_delete(): Marks every object of the queryset as deleted.
+        restore(): Marks every object of the queryset as not deleted.
+    """
+
+    def soft_delete(self) -> int:
+        """
+        Mark every object of the queryset as deleted.
+
+        Returns:
+            int: The number of objects marked as deleted.
+        """
+        return self._set_deleted(True, signals.soft_deleted)
+
+    def restore(self) -> int:
+        """
+        Mark every object of the queryset as not deleted.
+
+        Returns:
+            int: The number of objects restored.
+        """
+        return self._set_deleted(False, signals.restored)
+
+    def _set_deleted(self, is_deleted, signal) -> int:
+        """Update `is_deleted` of the rows that change and notify listeners."""
+        pks = list(
+            self.exclude(is_deleted=is_deleted).values_list("pk", flat=True)
+        )
+        if not pks:
+            return 0
+
+        values = {"is_deleted": is_deleted}
+        if any(field.name == "updated_at" for field in self.model._meta.fields):
+            values["updated_at"] = timezone.now()
+        updated = self.model._base_manager.filter(pk__in=pks).update(**values)
+        signal.send(sender=self.model, pks=pks)
+        return updated
+
+
+class NonDeletedManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
     """
     Custom Manager to filter out objects that are marked as deleted.
 
     This manager overrides the default `get_queryset` method to exclude 
     objects where the `is_deleted` attribute is set to True. It is 
     useful for implementing soft delete functionality in your models.
+    Its querysets support bulk `soft_delete()`.
 
     Inherits from:
-        models.Manager: The base manager class from Django.
+        models.Manager: The base manager class from Django, built from `SoftDeleteQuerySet`.
 
     Methods:
         get_queryset(): Returns a queryset that filters out deleted objects.
@@ -27,3 +79,12 @@ class NonDeletedManager(models.Manager):
             QuerySet: A queryset of non-deleted objects.
         """
         return super().get_queryset().filter(is_deleted=False)
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """
+    Manager including deleted objects, with bulk soft delete and restore.
+
+    Used as `all_objects` by `SoftDeleteModelMixin`, so deleted rows can be
+    restored in bulk with `Model.all_objects.filter(...).restore()`.
+    """
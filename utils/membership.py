@@ -0,0 +1,138 @@
+"""Department membership of the authenticated user."""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .cache import bump_version, get_version
+
+ADMIN_DEPARTMENT_NAME = "Administração"
+MEMBERSHIP_NAMESPACE = "departments:membership"
+
+
+class DepartmentMembership:
+    """
+    Snapshot of the departments a user belongs to.
+
+    The snapshot is loaded once per request through `get_membership` and
+    shared by the visibility mixins, permission checks and templates, so
+    none of them has to query `user.departments` again.
+
+    Across requests, the snapshot is kept in the cache backend under a key
+    made of the user ID and the version of the membership namespace. The
+    signals in `accounts.signals` drop or version out those keys whenever
+    the user's departments change.
+
+    Attributes:
+        user_id (int | None): The primary key of the user, or None for anonymous users.
+        department_ids (frozenset[int]): IDs of the user's departments.
+        department_names (frozenset[str]): Names of the user's departments.
+        is_admin (bool): Whether the user belongs to the "Administração" department.
+
+    Methods:
+        for_user(user): Loads the membership of a user from the cache, or with a single query.
+        shares_department(department_ids): Checks if any of the given departments is one of the user's.
+    """
+
+    __slots__ = ("user_id", "department_ids", "department_names", "is_admin")
+
+    def __init__(self, user_id=None, departments=()):
+        """
+        Initializes the membership from `(id, name)` pairs.
+
+        Args:
+            user_id (int, optional): The primary key of the user. Defaults to None.
+            departments (Iterable[tuple[int, str]]): The user's departments as `(id, name)` pairs.
+        """
+        departments = tuple(departments)
+        self.user_id = user_id
+        self.department_ids = frozenset(pk for pk, _ in departments)
+        self.department_names = frozenset(name for _, name in departments)
+        self.is_admin = ADMIN_DEPARTMENT_NAME in self.department_names
+
+    @classmethod
+    def for_user(cls, user):
+        """
+        Load the membership of a user from the cache, or with a single query.
+
+        Args:
+            user (User | AnonymousUser): The user whose departments are loaded.
+
+        Returns:
+            DepartmentMembership: The membership of the user. Anonymous users
+            get an empty membership without touching the database.
+        """
+        if not user.is_authenticated:
+            return cls()
+
+        key = membership_cache_key(user.pk)
+        departments = cache.get(key)
+        if departments is None:
+            departments = tuple(user.departments.values_list("id", "name"))
+            cache.set(key, departments, settings.MEMBERSHIP_CACHE_TIMEOUT)
+        return cls(user.pk, departments)
+
+    def shares_department(self, department_ids) -> bool:
+        """
+        Check if any of the given departments belongs to the user.
+
+        Args:
+            department_ids (Iterable[int]): The department IDs to check.
+
+        Returns:
+            bool: True if at least one of the IDs is one of the user's departments.
+        """
+        return not self.department_ids.isdisjoint(department_ids)
+
+    def __repr__(self) -> str:
+        return (
+            f"<DepartmentMembership user={self.user_id} "
+            f"departments={sorted(self.department_ids)} admin={self.is_admin}>"
+        )
+
+
+def membership_cache_key(user_id) -> str:
+    """
+    Return the cache key of the membership of a user.
+
+    Args:
+        user_id (int): The primary key of the user.
+
+    Returns:
+        str: The cache key, bound to the current namespace version.
+    """
+    return f"{MEMBERSHIP_NAMESPACE}:{get_version(MEMBERSHIP_NAMESPACE)}:{user_id}"
+
+
+def invalidate_membership(user_ids=None) -> None:
+    """
+    Drop cached memberships.
+
+    Args:
+        user_ids (Iterable[int], optional): The users whose memberships are
+            dropped. When None, the whole namespace is versioned out, which
+            invalidates the membership of every user at once.
+    """
+    if user_ids is None:
+        bump_version(MEMBERSHIP_NAMESPACE)
+        return
+    cache.delete_many([membership_cache_key(pk) for pk in user_ids])
+
+
+def get_membership(request) -> DepartmentMembership:
+    """
+    Return the department membership of the user of a request.
+
+    The membership is memoized on the request, so every mixin, template
+    and permission check of the same request reuses a single lookup.
+
+    Args:
+        request (HttpRequest): The current request.
+
+    Returns:
+        DepartmentMembership: The membership of `request.user`.
+    """
+    membership = getattr(request, "_department_membership", None)
+    if membership is None:
+        membership = DepartmentMembership.for_user(request.user)
+        request._department_membership = membership
+    return membership
@@ -1,13 +1,32 @@
+import hashlib
+from calendar import timegm
+from functools import partial
+
 from django.conf import settings
 from django.contrib import messages
-from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import InvalidPage
 from django.db import models
-from django.db.models import Q
-from django.http import HttpResponseRedirect
+from django.db.backends.utils import names_digest
+from django.db.models import Count, Max
+from django.db.models.signals import class_prepared
+from django.http import Http404, HttpResponseRedirect
 from django.shortcuts import redirect
 from django.urls import reverse, reverse_lazy
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+from django.views.generic.detail import SingleObjectMixin
 
-from . import manager
+from . import datatables, manager, signals
+from .cache import get_or_refresh, tag_versions
+from .membership import get_membership
+from .pagination import CursorPaginator, cached_count, estimated_count
+from .visibility import filter_visible
 
 
 class TimestampModelMixin(models.Model):
@@ -45,7 +64,15 @@ class SoftDeleteModelMixin(models.Model):
     Attributes:
         is_deleted (BooleanField): A flag indicating whether the object has been soft deleted.
         objects (NonDeletedManager): Custom manager that filters out deleted objects.
-        all_objects (models.Manager): Default manager that includes all objects, regardless of deletion status.
+        all_objects (SoftDeleteManager): Manager that includes all objects, regardless of deletion status.
+
+    Both managers return `SoftDeleteQuerySet`, whose `soft_delete()` and 
+    `restore()` update many rows with a single query.
+
+    Since both managers' common path filters on `is_deleted=False`, every 
+    concrete subclass gets partial indexes restricted to non-deleted rows 
+    (see `add_soft_delete_indexes`): one on `created_at` and one on each 
+    foreign key column, followed by `created_at` when the model has it.
 
     Methods:
         soft_delete(): Marks the object as deleted and saves it.
@@ -57,23 +84,88 @@ class SoftDeleteModelMixin(models.Model):
 
     is_deleted = models.BooleanField(default=False)
     objects = manager.NonDeletedManager()
-    all_objects = models.Manager()
+    all_objects = manager.SoftDeleteManager()
 
     def soft_delete(self):
         """Marks the object as deleted and saves it."""
         self.is_deleted = True
         self.save()
+        signals.soft_deleted.send(sender=self.__class__, pks=[self.pk])
 
     def restore(self):
         """Restores the object by marking it as not deleted and saves it."""
         self.is_deleted = False
         self.save()
+        signals.restored.send(sender=self.__class__, pks=[self.pk])
 
     class Meta:
         abstract = True
 
 
 
+def soft_delete_index_name(model, fields) -> str:
+    """
+    Build the name of a partial index on non-deleted rows.
+
+    Follows Django's own index naming scheme, so names stay deterministic 
+    across runs and within the 30 characters accepted by every backend.
+
+    Args:
+        model (type[Model]): The model owning the index.
+        fields (list[str]): The indexed field names.
+
+    Returns:
+        str: The index name, ending with `_nd` (not deleted).
+    """
+    table_name = model._meta.db_table
+    column_names = [model._meta.get_field(name).column for name in fields]
+    digest = names_digest(table_name, *column_names, length=6)
+    return f"{table_name[:11]}_{column_names[0][:7]}_{digest}_nd"
+
+
+def add_soft_delete_indexes(sender, **kwargs):
+    """
+    Add partial indexes on non-deleted rows to soft deletable models.
+
+    Connected to `class_prepared`, so the indexes become part of the model 
+    options and are picked up by `makemigrations` like any index declared 
+    in `Meta.indexes`. Partial indexes are supported by SQLite and 
+    PostgreSQL.
+    """
+    if not issubclass(sender, SoftDeleteModelMixin):
+        return
+    opts = sender._meta
+    if opts.abstract or opts.proxy:
+        return
+
+    field_names = {field.name for field in opts.local_fields}
+    paths = []
+    if "created_at" in field_names:
+        paths.append(["created_at"])
+    for field in opts.local_fields:
+        if field.many_to_one and field.concrete:
+            paths.append(
+                [field.name, "created_at"]
+                if "created_at" in field_names
+                else [field.name]
+            )
+
+    existing = {index.name for index in opts.indexes}
+    for fields in paths:
+        name = soft_delete_index_name(sender, fields)
+        if name not in existing:
+            opts.indexes.append(
+                models.Index(
+                    fields=fields,
+                    condition=models.Q(is_deleted=False),
+                    name=name,
+                )
+            )
+
+
+class_prepared.connect(add_soft_delete_indexes)
+
+
 class SoftDeleteViewMixin:
     """
     View mixin that overrides the delete method to perform a soft delete.
@@ -84,14 +176,25 @@ class SoftDeleteViewMixin:
 
     Methods:
         delete(request, *args, **kwargs): Performs a soft delete on the object.
+        get_soft_delete_queryset(): Returns the queryset to be soft deleted in bulk.
         post(request, *args, **kwargs): Handles POST requests and calls delete.
     """
 
     def delete(self, request, *args, **kwargs):
         self.object = self.get_object()
-        self.object.soft_delete()
+        self.get_soft_delete_queryset().soft_delete()
         return HttpResponseRedirect(self.get_success_url())
 
+    def get_soft_delete_queryset(self):
+        """
+        Return the queryset soft deleted by `delete`.
+
+        Defaults to the current object. Views deleting several selected
+        objects override it, so all of them are soft deleted with a single 
+        query.
+        """
+        return type(self.object).all_objects.filter(pk=self.object.pk)
+
     def post(self, request, *args, **kwargs):
         """Handles POST requests and calls the delete method."""
         return self.delete(request, *args, **kwargs)
@@ -144,7 +247,10 @@ class DepartmentListFilterMixin:
     This mixin filters objects based on the user's department. If the 
     user belongs to the "Administração" department, all objects are 
     returned. Otherwise, only objects associated with the user's 
-    department or owned by the user are included.
+    department or owned by the user are included. The user's departments 
+    come from the request-scoped `DepartmentMembership`, loaded once per 
+    request. Visibility is expressed with semi-join subqueries 
+    (see `utils.visibility`), so the queryset never needs `DISTINCT`.
 
     Methods:
         get_queryset(): Returns a filtered queryset based on the user's department.
@@ -152,27 +258,13 @@ class DepartmentListFilterMixin:
     """
 
     def get_queryset(self):
-        user = self.request.user
         queryset = super().get_queryset()
 
         if queryset is None:
             queryset = self.model.objects.none()
 
         queryset = queryset.filter(is_deleted=False)
-
-        if user.departments.filter(name="Administração").exists():
-            return queryset
-
-        if hasattr(self.model, "department"):
-            return queryset.filter(
-                Q(owner=user)
-                | Q(owner__departments__in=user.departments.all())
-                | Q(department__in=user.departments.all())
-            ).distinct()
-
-        return queryset.filter(
-            Q(owner=user) | Q(owner__departments__in=user.departments.all())
-        ).distinct()
+        return filter_visible(queryset, get_membership(self.request))
 
     def handle_no_permission(self):
         """Handles cases where the user lacks permission to access a resource."""
@@ -187,37 +279,174 @@ class DepartmentListFilterMixin:
 
 
 
+class CursorPaginationMixin:
+    """
+    Mixin to paginate a ListView by cursor instead of page number.
+
+    Pages are read from the `cursor` query parameter and fetched by
+    seeking past the last row of the previous page (see
+    `utils.pagination.CursorPaginator`), so deep pages cost the same as
+    the first one. The context keeps the names used by `ListView`, and
+    `components/_pagination.html` renders cursor pages as well.
+
+    Attributes:
+        cursor_ordering (tuple[str]): The unique ordering of the pages.
+        cursor_kwarg (str): The query parameter holding the cursor.
+        estimate_count (bool): Whether the total shown is estimated instead of counted.
+        cache_count (bool): Whether the total shown is cached for `AGGREGATE_CACHE_TIMEOUT` seconds.
+
+    Methods:
+        get_paginator(queryset, per_page): Returns the cursor paginator of the view.
+        paginate_queryset(queryset, page_size): Returns the page selected by the request cursor.
+    """
+
+    paginator_class = CursorPaginator
+    cursor_ordering = ("created_at", "id")
+    cursor_kwarg = "cursor"
+    estimate_count = False
+    cache_count = False
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        return self.paginator_class(
+            queryset,
+            per_page,
+            ordering=self.cursor_ordering,
+            estimate_count=self.estimate_count,
+            count_timeout=settings.AGGREGATE_CACHE_TIMEOUT if self.cache_count else None,
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = self.get_paginator(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidPage as error:
+            raise Http404(str(error))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class DataTablesMixin:
+    """
+    Mixin to serve a ListView as a DataTables server-side data source.
+
+    Requests carrying the DataTables `draw` parameter are answered with
+    the JSON rows of the requested page instead of the template. Search,
+    ordering and paging are translated into ORM queries over
+    `datatable_columns` (see `utils.datatables`), on top of
+    `get_queryset()`, so visibility filters apply as usual. The template
+    gets the data source URL as `datatable_url`.
+
+    Attributes:
+        datatable_columns (tuple[Column]): The columns of the table, in order.
+        datatable_max_length (int): The maximum number of rows per request.
+        datatable_estimate_count (bool): Whether the total is estimated instead of counted.
+        datatable_cache_count (bool): Whether the counts are cached for
+            `AGGREGATE_CACHE_TIMEOUT` seconds (see `utils.pagination.cached_count`).
+
+    Methods:
+        is_datatable_request(): Checks if the request comes from DataTables.
+        get_datatable_response(): Returns the JSON response of a DataTables request.
+    """
+
+    datatable_columns = ()
+    datatable_max_length = 100
+    datatable_estimate_count = False
+    datatable_cache_count = False
+
+    def is_datatable_request(self) -> bool:
+        """Check if the request comes from DataTables."""
+        return "draw" in self.request.GET
+
+    def get(self, request, *args, **kwargs):
+        if self.is_datatable_request():
+            return self.get_datatable_response()
+        return super().get(request, *args, **kwargs)
+
+    def get_datatable_response(self):
+        params = datatables.DataTablesRequest(
+            self.request.GET, self.datatable_columns, self.datatable_max_length
+        )
+        queryset = self.get_queryset()
+        records_total = self.get_datatable_count(
+            queryset, self.datatable_estimate_count
+        )
+
+        filtered = params.filter(queryset)
+        if params.search:
+            records_filtered = self.get_datatable_count(filtered)
+        else:
+            records_filtered = records_total
+        return datatables.stream_response(
+            params, params.page(filtered), records_total, records_filtered
+        )
+
+    def get_datatable_count(self, queryset, estimate=False) -> int:
+        """Count the rows of a queryset, through the cache with `datatable_cache_count`."""
+        if self.datatable_cache_count:
+            return cached_count(queryset, settings.AGGREGATE_CACHE_TIMEOUT, estimate)
+        if estimate:
+            return estimated_count(queryset)
+        return queryset.count()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["datatable_url"] = self.request.path
+        return context
+
+
 class DepartmentPermissionMixin:
     """
     Mixin to check if the user has permission to access an object.
 
     This mixin ensures that the user can only access objects they own 
     or are associated with through their department. Users in the 
-    "Administração" department have access to all objects.
+    "Administração" department have access to all objects. The user's 
+    departments come from the request-scoped `DepartmentMembership`.
 
     Methods:
+        get_permission_object(): Loads the object with its owner and the owner's departments.
+        get_object(queryset=None): Returns the object loaded by `dispatch` instead of querying it again.
         dispatch(request, *args, **kwargs): Checks access permission and returns the appropriate response.
     """
 
+    def get_permission_object(self):
+        """
+        Load the object checked by `dispatch`, with its owner and the
+        owner's departments, in two queries.
+
+        The instance is kept on the view and returned by `get_object`, so
+        the generic detail, update and delete views reuse it instead of
+        loading the object again.
+        """
+        queryset = (
+            self.get_queryset()
+            .select_related("owner")
+            .prefetch_related("owner__departments")
+        )
+        self._permission_object = self.get_object(queryset)
+        return self._permission_object
+
+    def get_object(self, queryset=None):
+        """Return the object already loaded by `dispatch`, if any."""
+        obj = getattr(self, "_permission_object", None)
+        if queryset is None and obj is not None:
+            return obj
+        return super().get_object(queryset)
+
     def dispatch(self, request, *args, **kwargs):
-        obj = self.get_object()
-        User = get_user_model()
-        try:
-            user_profile = User.objects.get(id=request.user.id)
-        except User.DoesNotExist:
+        if not request.user.is_authenticated:
             messages.error(request, "Perfil do usuário não encontrado.")
             return HttpResponseRedirect(reverse("home"))
 
-        is_owner = request.user == obj.owner
-        is_department_admin = "Administração" in user_profile.departments.values_list(
-            "name", flat=True
+        obj = self.get_permission_object()
+        membership = get_membership(request)
+        is_owner = request.user.pk == obj.owner_id
+        is_department_admin = membership.is_admin
+        is_in_department = (
+            hasattr(self.model, "department")
+            and obj.department_id in membership.department_ids
         )
-        is_in_department = hasattr(self.model, "department") and str(
-            obj.department
-        ) in request.user.departments.values_list("name", flat=True)
-        is_department_in_owner_dep = (
-            request.user.departments.values_list
-            in obj.owner.departments.values_list("name", flat=True)
+        is_department_in_owner_dep = membership.shares_department(
+            department.id for department in obj.owner.departments.all()
         )
 
         if not (
@@ -232,3 +461,207 @@ class DepartmentPermissionMixin:
             return HttpResponseRedirect(reverse("home"))
 
         return super().dispatch(request, *args, **kwargs)
+
+
+class CachePolicyMixin:
+    """
+    Mixin caching the rendered GET responses of a view.
+
+    The policy is declared on the view: `cache_tags` names the data shown
+    by the page. Pages are cached under a key made of the view, the full
+    path, the versions of the tags, the user and their departments (see
+    `DepartmentMembership`), so a page rendered for a user, which may show
+    their name or messages, is never served to another one. Views whose
+    template also checks permissions set `cache_vary_on_permissions`. Bumping a tag with
+    `utils.cache.invalidate_tags` drops every page showing its data.
+
+    Only successful, non-streaming responses are cached, and never pages
+    rendering a CSRF token. They are marked private, so shared proxies do
+    not keep them. Place the mixin after the login and permission mixins,
+    so access is checked before the cache is read. Behind
+    `ConditionalGetMixin`, the key also includes the ETag of the page, so
+    the page follows changes made without signals, such as bulk updates.
+
+    Attributes:
+        cache_tags (tuple[str]): The tags of the data shown by the view.
+        cache_timeout (int | None): Seconds a page stays cached. Defaults to `VIEW_CACHE_TIMEOUT`.
+        cache_vary_on_permissions (bool): Whether the key also varies on the user's permissions.
+
+    Methods:
+        get_cache_tags(): Returns the tags of the data shown by the view.
+        get_page_cache_key(): Returns the cache key of the page of the request.
+    """
+
+    cache_tags = ()
+    cache_timeout = None
+    cache_vary_on_permissions = False
+
+    def get_cache_tags(self):
+        return self.cache_tags
+
+    def get_page_cache_key(self) -> str:
+        """
+        Return the cache key of the page of the request.
+
+        Returns:
+            str: The key, bound to the current versions of the tags.
+        """
+        membership = get_membership(self.request)
+        parts = [
+            self.request.get_full_path(),
+            str(tag_versions(self.get_cache_tags())),
+            str(self.request.user.is_authenticated),
+            str(self.request.user.pk),
+            str(sorted(membership.department_ids)),
+            str(getattr(self, "etag", None)),
+        ]
+        if self.cache_vary_on_permissions:
+            parts.append(str(sorted(self.request.user.get_all_permissions())))
+        digest = hashlib.md5("|".join(parts).encode()).hexdigest()
+        view = type(self)
+        return f"view:{view.__module__}.{view.__qualname__}:{digest}"
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return super().dispatch(request, *args, **kwargs)
+
+        key = self.get_page_cache_key()
+        response = cache.get(key)
+        if response is not None:
+            return response
+
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code != 200 or response.streaming:
+            return response
+
+        patch_cache_control(response, private=True)
+        timeout = self.cache_timeout
+        if timeout is None:
+            timeout = settings.VIEW_CACHE_TIMEOUT
+
+        def store(response):
+            if not response.cookies and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE"):
+                cache.set(key, response, timeout)
+
+        if getattr(response, "is_rendered", True):
+            store(response)
+        else:
+            response.add_post_render_callback(store)
+        return response
+
+
+class ConditionalGetMixin:
+    """
+    Mixin answering conditional GET requests of list and detail views
+    with 304 Not Modified, without rendering the template.
+
+    The validator is computed before rendering. Detail views use the
+    `updated_at` of the object, which is loaded once and reused by the
+    view. List views use the latest `updated_at` and the number of rows of
+    `get_queryset()`, read with a single aggregate query and cached for
+    `AGGREGATE_CACHE_TIMEOUT` seconds under the versions of `cache_tags`,
+    so the tags of a list view must include those of its own model. Both
+    are combined with the user and their departments, which decide what
+    the page shows, and with the versions of `cache_tags`, so changes to
+    related data shown by the page, such as department names, also change
+    it.
+
+    The ETag is weak. Detail views also send Last-Modified. List views do
+    not, since deleting a row can leave the latest `updated_at` unchanged.
+    Place the mixin after the login and permission mixins and before
+    `CachePolicyMixin`.
+
+    Attributes:
+        cache_tags (tuple[str]): The tags of the related data shown by the view.
+        etag (str): The ETag of the page of the request, set by `dispatch`.
+
+    Methods:
+        is_conditional(): Checks if the request is answered with validators.
+        get_validators(): Returns the ETag and last modification of the page.
+        get_summary_cache_key(queryset): Returns the cache key of the summary of a list.
+        get_object(queryset=None): Returns the object loaded by `get_validators` instead of querying it again.
+    """
+
+    cache_tags = ()
+
+    def get_cache_tags(self):
+        return self.cache_tags
+
+    def get_validators(self):
+        """
+        Return the validators of the page of the request.
+
+        Returns:
+            tuple[str, datetime | None]: The weak ETag and, for detail views,
+            the last modification of the object.
+        """
+        if isinstance(self, SingleObjectMixin):
+            self._conditional_object = self.get_object()
+            last_modified = self._conditional_object.updated_at
+            state = [self._conditional_object.pk, last_modified]
+        else:
+            last_modified = None
+            queryset = self.get_queryset().order_by()
+            summary = get_or_refresh(
+                self.get_summary_cache_key(queryset),
+                partial(
+                    queryset.aggregate,
+                    updated_at=Max("updated_at"),
+                    count=Count("pk"),
+                ),
+                settings.AGGREGATE_CACHE_TIMEOUT,
+            )
+            state = [summary["updated_at"], summary["count"]]
+
+        membership = get_membership(self.request)
+        state += [
+            self.request.user.pk,
+            sorted(membership.department_ids),
+            tag_versions(self.get_cache_tags()),
+        ]
+        digest = hashlib.md5(repr(state).encode()).hexdigest()
+        return f'W/"{digest}"', last_modified
+
+    def get_summary_cache_key(self, queryset) -> str:
+        """
+        Return the cache key of the summary of a list, which changes with
+        its query and with the versions of `cache_tags`.
+        """
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            sql, params = "", ()
+        state = [queryset.db, sql, params, tag_versions(self.get_cache_tags())]
+        digest = hashlib.md5(repr(state).encode()).hexdigest()
+        return f"conditional:summary:{digest}"
+
+    def get_object(self, queryset=None):
+        """Return the object already loaded by `get_validators`, if any."""
+        obj = getattr(self, "_conditional_object", None)
+        if queryset is None and obj is not None:
+            return obj
+        return super().get_object(queryset)
+
+    def is_conditional(self) -> bool:
+        """Check if the request is answered with validators. Views override it to skip some requests."""
+        return self.request.method in ("GET", "HEAD")
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.is_conditional():
+            return super().dispatch(request, *args, **kwargs)
+
+        self.etag, last_modified = self.get_validators()
+        etag = self.etag
+        if last_modified is not None:
+            last_modified = timegm(last_modified.utctimetuple())
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code == 200:
+                response.headers["ETag"] = etag
+                if last_modified is not None:
+                    response.headers["Last-Modified"] = http_date(last_modified)
+        patch_vary_headers(response, ("Cookie",))
+        return response
@@ -0,0 +1,317 @@
+"""Keyset (cursor) pagination for list views."""
+
+import base64
+import binascii
+import hashlib
+import json
+from functools import partial
+
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.paginator import InvalidPage
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from .cache import get_or_refresh
+
+
+class InvalidCursor(InvalidPage):
+    """Raised when a cursor cannot be decoded or does not match the ordering."""
+
+
+def estimated_count(queryset, limit=1000) -> int:
+    """
+    Estimate the number of rows of a queryset without scanning all of them.
+
+    PostgreSQL returns the row estimate of the query plan. Other databases
+    count at most `limit` rows.
+
+    Args:
+        queryset (QuerySet): The rows to be counted.
+        limit (int): Rows counted at most when the database cannot estimate.
+
+    Returns:
+        int: The estimated number of rows.
+    """
+    queryset = queryset.order_by()
+    if connections[queryset.db].vendor == "postgresql":
+        plan = json.loads(queryset.explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+    return queryset[:limit].count()
+
+
+def cached_count(queryset, timeout, estimate=False, limit=1000) -> int:
+    """
+    Count the rows of a queryset through the cache.
+
+    The count is keyed by the SQL of the queryset and recomputed by a
+    single worker when it expires, while the others keep the previous
+    count (see `utils.cache.get_or_refresh`). It may lag behind writes by
+    up to `timeout` seconds.
+
+    Args:
+        queryset (QuerySet): The rows to be counted.
+        timeout (int): Seconds a count is fresh.
+        estimate (bool): Whether the count is estimated with `estimated_count`.
+        limit (int): Rows counted at most when estimating without PostgreSQL.
+
+    Returns:
+        int: The number of rows.
+    """
+    queryset = queryset.order_by()
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    if estimate:
+        kind, compute = f"estimate:{limit}", partial(estimated_count, queryset, limit)
+    else:
+        kind, compute = "exact", queryset.count
+    digest = hashlib.md5(f"{queryset.db}|{sql}|{params}".encode()).hexdigest()
+    return get_or_refresh(f"count:{kind}:{digest}", compute, timeout)
+
+
+class CursorPaginator:
+    """
+    Paginate a queryset by seeking past the last row of the previous page.
+
+    Pages are selected with a condition on the ordering columns, such as
+    `(created_at, id) > (last_created_at, last_id)`, instead of an
+    `OFFSET`. With an index on the ordering columns every page costs the
+    same as the first one, however deep it is.
+
+    The ordering must be unique, so it should end with the primary key.
+
+    Attributes:
+        queryset (QuerySet): The rows to be paginated.
+        per_page (int): The number of rows per page.
+        ordering (tuple[str]): The ordering columns, optionally prefixed with "-".
+        estimate_count (bool): Whether `count` is estimated instead of exact.
+        count_limit (int): Rows counted at most when the database cannot estimate.
+        count_timeout (int | None): Seconds the count is cached, see `cached_count`.
+            None counts on every page.
+
+    Methods:
+        page(cursor): Returns the page pointed by a cursor.
+        last_cursor(): Returns the cursor of the last page.
+        encode_cursor(values, backwards): Builds the cursor of a position.
+        decode_cursor(cursor): Returns the position and direction of a cursor.
+    """
+
+    def __init__(
+        self,
+        queryset,
+        per_page,
+        ordering=("created_at", "id"),
+        estimate_count=False,
+        count_limit=1000,
+        count_timeout=None,
+    ):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.estimate_count = estimate_count
+        self.count_limit = count_limit
+        self.count_timeout = count_timeout
+
+    @cached_property
+    def fields(self):
+        """The model fields of the ordering columns and whether they are descending."""
+        opts = self.queryset.model._meta
+        return [
+            (opts.get_field(name.lstrip("-")), name.startswith("-"))
+            for name in self.ordering
+        ]
+
+    def encode_cursor(self, values, backwards=False) -> str:
+        """
+        Build the cursor of a position.
+
+        Args:
+            values (Iterable | None): The values of the ordering columns of a
+                row. None points to the start, or the end when `backwards`.
+            backwards (bool): Whether the cursor points to the rows before it.
+
+        Returns:
+            str: An URL safe token.
+        """
+        if values is not None:
+            values = [
+                value.isoformat() if hasattr(value, "isoformat") else value
+                for value in values
+            ]
+        payload = {"b": backwards, "v": values}
+        return base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":")).encode()
+        ).decode()
+
+    def decode_cursor(self, cursor):
+        """
+        Return the position and direction of a cursor.
+
+        Args:
+            cursor (str): A token built by `encode_cursor`.
+
+        Returns:
+            tuple[list | None, bool]: The values of the ordering columns and
+            whether the cursor points backwards.
+
+        Raises:
+            InvalidCursor: If the token is malformed.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            values, backwards = payload["v"], bool(payload["b"])
+            if values is None:
+                return None, backwards
+            if len(values) != len(self.fields):
+                raise ValueError(values)
+            values = [
+                field.to_python(value)
+                for (field, _), value in zip(self.fields, values)
+            ]
+            return values, backwards
+        except (binascii.Error, KeyError, TypeError, ValueError, ValidationError) as error:
+            raise InvalidCursor("Cursor inválido.") from error
+
+    def last_cursor(self) -> str:
+        """Return the cursor of the last page."""
+        return self.encode_cursor(None, backwards=True)
+
+    def position(self, obj) -> list:
+        """Return the values of the ordering columns of a row."""
+        return [getattr(obj, field.attname) for field, _ in self.fields]
+
+    def seek_condition(self, values, backwards):
+        """
+        Build the condition selecting the rows after (or before) a position.
+
+        For ordering `(a, b)` moving forward it is `a > x OR (a = x AND b > y)`,
+        which databases resolve as a range scan on an index over `(a, b)`.
+        """
+        condition = Q()
+        for index, (field, descending) in enumerate(self.fields):
+            lookup = "lt" if descending != backwards else "gt"
+            term = Q(**{f"{field.attname}__{lookup}": values[index]})
+            for (previous, _), value in zip(self.fields[:index], values):
+                term &= Q(**{previous.attname: value})
+            condition |= term
+        return condition
+
+    def page(self, cursor=None) -> "CursorPage":
+        """
+        Return the page pointed by a cursor.
+
+        Args:
+            cursor (str, optional): A cursor from a previous page. Defaults to the first page.
+
+        Returns:
+            CursorPage: The page, fetched with a single query.
+
+        Raises:
+            InvalidCursor: If the cursor is malformed.
+        """
+        values, backwards = (None, False)
+        if cursor:
+            values, backwards = self.decode_cursor(cursor)
+
+        ordering = [
+            f"{'-' if descending != backwards else ''}{field.attname}"
+            for field, descending in self.fields
+        ]
+        queryset = self.queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self.seek_condition(values, backwards))
+
+        rows = list(queryset[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if backwards:
+            rows.reverse()
+            return CursorPage(
+                rows, self, has_next=values is not None, has_previous=has_more
+            )
+        return CursorPage(
+            rows, self, has_next=has_more, has_previous=values is not None
+        )
+
+    @cached_property
+    def count(self) -> int:
+        """
+        The number of rows of the queryset.
+
+        Exact by default. With `estimate_count`, PostgreSQL returns the
+        planner estimate, which costs no scan at all, and other databases
+        count at most `count_limit` rows. With `count_timeout`, the count
+        comes from the cache.
+        """
+        if self.count_timeout is not None:
+            return cached_count(
+                self.queryset, self.count_timeout, self.estimate_count, self.count_limit
+            )
+        if not self.estimate_count:
+            return self.queryset.count()
+        return estimated_count(self.queryset, self.count_limit)
+
+    @cached_property
+    def display_count(self) -> str:
+        """The count formatted for templates, marking estimated values."""
+        if not self.estimate_count:
+            return str(self.count)
+        if connections[self.queryset.db].vendor == "postgresql":
+            return f"~{self.count}"
+        if self.count >= self.count_limit:
+            return f"{self.count_limit}+"
+        return str(self.count)
+
+
+class CursorPage:
+    """
+    A page of a `CursorPaginator`.
+
+    Unlike Django's `Page`, a cursor page has no number: it links to the
+    pages around it through `next_cursor` and `previous_cursor`.
+
+    Attributes:
+        object_list (list): The rows of the page.
+        paginator (CursorPaginator): The paginator of the page.
+        next_cursor (str | None): The cursor of the next page, if any.
+        previous_cursor (str | None): The cursor of the previous page, if any.
+    """
+
+    is_cursor_page = True
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = None
+        self.previous_cursor = None
+        if object_list and has_next:
+            self.next_cursor = paginator.encode_cursor(
+                paginator.position(object_list[-1])
+            )
+        if object_list and has_previous:
+            self.previous_cursor = paginator.encode_cursor(
+                paginator.position(object_list[0]), backwards=True
+            )
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __repr__(self) -> str:
+        return f"<CursorPage of {len(self)} rows>"
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
@@ -0,0 +1,136 @@
+"""In-process registry of small reference tables."""
+
+import copy
+from types import MappingProxyType
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.fields.related_descriptors import (
+    ForwardManyToOneDescriptor,
+)
+
+from .cache import bump_version, get_version
+
+
+class ReferenceRegistry:
+    """
+    Small, rarely changing tables held in memory by every worker.
+
+    Each registered model is loaded with a single query the first time it
+    is needed and kept as a read-only mapping of primary key to instance,
+    soft deleted rows included, so old rows still resolve.
+
+    Every table is tagged with the version of its cache namespace. Writes
+    bump that version (see `invalidate`), and each worker reloads the
+    table on its next access. Checking the version is a cache lookup, not
+    a query.
+
+    Attributes:
+        namespace (str): The prefix of the cache namespaces of the tables.
+
+    Methods:
+        register(*models): Adds models to the registry.
+        table(model): Returns the table of a model, reloading it if it changed.
+        get(model, pk): Returns a copy of a row of a registered model.
+        invalidate(model): Makes every worker reload the table of a model.
+        resolve_foreign_keys(model, *names): Resolves foreign keys through the registry.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.models = set()
+        self._tables = {}
+
+    def register(self, *models) -> None:
+        """Add models to the registry."""
+        self.models.update(models)
+
+    def is_registered(self, model) -> bool:
+        """Check if a model is held by the registry."""
+        return model in self.models
+
+    def namespace_of(self, model) -> str:
+        """Return the cache namespace versioning the table of a model."""
+        return f"{self.namespace}:{model._meta.label_lower}"
+
+    def table(self, model) -> MappingProxyType:
+        """
+        Return the rows of a registered model keyed by primary key.
+
+        The version is read before loading, so a write committed while
+        loading leaves the table outdated only until the next access.
+
+        Args:
+            model (type[Model]): A registered model.
+
+        Returns:
+            MappingProxyType: The read-only table of the model.
+        """
+        version = get_version(self.namespace_of(model))
+        loaded = self._tables.get(model)
+        if loaded is None or loaded[0] != version:
+            rows = {obj.pk: obj for obj in model._base_manager.order_by()}
+            loaded = (version, MappingProxyType(rows))
+            self._tables[model] = loaded
+        return loaded[1]
+
+    def get(self, model, pk, default=None):
+        """
+        Return a row of a registered model.
+
+        The row is a copy, so changing it does not change the table.
+
+        Args:
+            model (type[Model]): A registered model.
+            pk (Any): The primary key of the row.
+            default (Any, optional): Returned if there is no such row. Defaults to None.
+        """
+        obj = self.table(model).get(pk)
+        return default if obj is None else copy.copy(obj)
+
+    def invalidate(self, model) -> None:
+        """Make every worker reload the table of a model on its next access."""
+        bump_version(self.namespace_of(model))
+
+    def resolve_foreign_keys(self, model, *names) -> None:
+        """
+        Make foreign keys of a model load their rows from the registry.
+
+        Accessing `instance.<name>` then costs no query when the row is in
+        the registry. `select_related` and `prefetch_related` keep working
+        as before.
+
+        Args:
+            model (type[Model]): The model holding the foreign keys.
+            *names (str): The names of foreign keys to registered models.
+
+        Raises:
+            ImproperlyConfigured: If a foreign key targets an unregistered
+                model or a column other than its primary key.
+        """
+        for name in names:
+            field = model._meta.get_field(name)
+            target = field.remote_field.model
+            if not self.is_registered(target):
+                raise ImproperlyConfigured(f"{target._meta.label} is not registered.")
+            if field.target_field != target._meta.pk:
+                raise ImproperlyConfigured(f"{field} does not target a primary key.")
+            setattr(model, name, RegistryForwardDescriptor(field, self))
+
+
+class RegistryForwardDescriptor(ForwardManyToOneDescriptor):
+    """
+    Forward foreign key descriptor loading the related row from a
+    `ReferenceRegistry`, falling back to a query for rows missing there.
+    """
+
+    def __init__(self, field_with_rel, registry):
+        super().__init__(field_with_rel)
+        self.registry = registry
+
+    def get_object(self, instance):
+        obj = self.registry.get(
+            self.field.remote_field.model, getattr(instance, self.field.attname)
+        )
+        if obj is None:
+            return super().get_object(instance)
+        return obj
@@ -0,0 +1,35 @@
+"""Accent-insensitive, indexed lookups over folded shadow columns."""
+
+from django.db.models import Q
+
+from .text import fold
+
+# Upper bound appended to a prefix to turn it into a range.
+PREFIX_END = "\U0010ffff"
+
+
+def folded_condition(queryset, field, term, prefix=False):
+    """
+    Build the condition matching a search term on a folded shadow column.
+
+    The term is folded like the column (see `utils.text.fold`), so the
+    match ignores case and diacritics. By default the term is matched
+    anywhere in the column, like `icontains`. On PostgreSQL the column has
+    a trigram index, which serves substring matches. Elsewhere substring
+    matches scan the column, and `prefix` trades them for a range over the
+    column's B-tree index.
+
+    Args:
+        queryset (QuerySet): The queryset to be filtered.
+        field (str): The name of the shadow column, e.g. `name_search`.
+        term (str): The search typed by the user.
+        prefix (bool): Whether the term is only matched at the start of the column.
+
+    Returns:
+        Q: A condition to be passed to `QuerySet.filter`.
+    """
+    term = fold(term).strip()
+    if prefix:
+        return Q(**{f"{field}__gte": term, f"{field}__lt": term + PREFIX_END})
+    return Q(**{f"{field}__contains": term})
+
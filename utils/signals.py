@@ -0,0 +1,19 @@
+from django.dispatch import Signal
+
+soft_deleted = Signal()
+"""
+Sent once per batch of objects marked as deleted.
+
+Sent by `SoftDeleteQuerySet.soft_delete()` and
+`SoftDeleteModelMixin.soft_delete()` with the model as `sender` and the
+primary keys of the affected rows as `pks`.
+"""
+
+restored = Signal()
+"""
+Sent once per batch of objects restored from a soft delete.
+
+Sent by `SoftDeleteQuerySet.restore()` and `SoftDeleteModelMixin.restore()`
+with the model as `sender` and the primary keys of the affected rows as
+`pks`.
+"""
@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.test import TestCase
 
 from departments.models import Department
@@ -35,11 +36,16 @@ class SetUpInitial(TestCase):
         to avoid duplication, and the test user is assigned to the 
         'Administração' department.
 
+        The cache is cleared first, so data cached by a previous test for
+        rows that were rolled back is not served again.
+
         Side Effects:
+            - Clears the cache.
             - Creates a new user in the database.
             - Creates or retrieves specified departments.
             - Logs the user in for client-based testing.
         """
+        cache.clear()
         self.user = self.User.objects.create_user(
             email='testuser@123.com', password='password'
         )
@@ -0,0 +1,153 @@
+import importlib.util
+import os
+import tempfile
+import threading
+import time
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from core.caches import caches_from_env
+from utils.cache import (
+    bump_version,
+    get_or_refresh,
+    get_version,
+    invalidate_tags,
+    tag_versions,
+)
+
+REDIS_URL = os.environ.get("CACHE_TEST_REDIS_URL")
+
+
+class CachesFromEnvTest(SimpleTestCase):
+    def test_defaults_to_locmem(self):
+        """Testa se o cache padrão é em memória."""
+        config = caches_from_env({}, "/app")["default"]
+        self.assertEqual(
+            config["BACKEND"], "django.core.cache.backends.locmem.LocMemCache"
+        )
+        self.assertEqual(config["OPTIONS"], {"MAX_ENTRIES": 10000})
+        self.assertEqual(config["TIMEOUT"], 300)
+
+    def test_file_and_redis(self):
+        """Testa a configuração dos caches em arquivo e Redis."""
+        config = caches_from_env(
+            {"CACHE_BACKEND": "file", "CACHE_MAX_ENTRIES": "50"}, "/app"
+        )["default"]
+        self.assertEqual(config["LOCATION"], os.path.join("/app", "cache"))
+        self.assertEqual(config["OPTIONS"], {"MAX_ENTRIES": 50})
+
+        config = caches_from_env(
+            {"CACHE_BACKEND": "Redis", "CACHE_LOCATION": "redis://cache:6379/0"}
+        )["default"]
+        self.assertEqual(
+            config["BACKEND"], "django.core.cache.backends.redis.RedisCache"
+        )
+        self.assertEqual(config["LOCATION"], "redis://cache:6379/0")
+        self.assertNotIn("OPTIONS", config)
+
+    def test_unknown_backend(self):
+        """Testa se um backend desconhecido é recusado."""
+        with self.assertRaises(ValueError):
+            caches_from_env({"CACHE_BACKEND": "memcached"})
+
+
+class BackendTest(SimpleTestCase):
+    """Testa as versões de namespaces e tags em cada backend."""
+
+    def check_backend(self, environ):
+        with override_settings(CACHES=caches_from_env(environ)):
+            cache.clear()
+            version = get_version("backend-test")
+            self.assertEqual(bump_version("backend-test"), version + 1)
+            self.assertEqual(get_version("backend-test"), version + 1)
+
+            before = tag_versions(["events", "departments"])
+            invalidate_tags("events")
+            after = tag_versions(["departments", "events"])
+            self.assertEqual(after[0], before[0])
+            self.assertEqual(after[1], before[1] + 1)
+            cache.clear()
+
+    def test_locmem(self):
+        self.check_backend({"CACHE_BACKEND": "locmem", "CACHE_LOCATION": "test"})
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.check_backend({"CACHE_BACKEND": "file", "CACHE_LOCATION": directory})
+
+    @skipUnless(
+        REDIS_URL and importlib.util.find_spec("redis"),
+        "Defina CACHE_TEST_REDIS_URL com um servidor compatível com Redis.",
+    )
+    def test_redis(self):
+        self.check_backend({"CACHE_BACKEND": "redis", "CACHE_LOCATION": REDIS_URL})
+
+
+class GetOrRefreshTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+        self.calls_lock = threading.Lock()
+
+    def compute(self, value=42, delay=0.2):
+        def compute():
+            with self.calls_lock:
+                self.calls += 1
+            time.sleep(delay)
+            return value
+
+        return compute
+
+    def run_threads(self, target, count=20):
+        barrier = threading.Barrier(count)
+        results = []
+
+        def run():
+            barrier.wait()
+            results.append(target())
+
+        threads = [threading.Thread(target=run) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_single_flight(self):
+        """Testa se requisições simultâneas calculam o valor uma única vez."""
+        results = self.run_threads(
+            lambda: get_or_refresh("aggregate", self.compute(), 60)
+        )
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [42] * 20)
+
+    def test_serves_stale_while_refreshing(self):
+        """Testa se o valor expirado é servido enquanto outro processo recalcula."""
+        cache.set("aggregate", (1, 0.1, time.time() - 1), 60)
+        results = self.run_threads(
+            lambda: get_or_refresh("aggregate", self.compute(2), 60)
+        )
+        self.assertEqual(self.calls, 1)
+        self.assertIn(2, results)
+        self.assertGreater(results.count(1), 0)
+        self.assertEqual(get_or_refresh("aggregate", self.compute(3), 60), 2)
+
+    def test_early_refresh(self):
+        """Testa se o valor é recalculado antes de expirar conforme a probabilidade."""
+        cache.set("aggregate", (1, 1.0, time.time() + 10), 60)
+        with mock.patch("utils.cache.random.random", return_value=0.0):
+            self.assertEqual(get_or_refresh("aggregate", self.compute(2, 0), 60), 1)
+        with mock.patch("utils.cache.random.random", return_value=0.99999999):
+            self.assertEqual(get_or_refresh("aggregate", self.compute(2, 0), 60), 2)
+        self.assertEqual(self.calls, 1)
+
+    def test_lock_released_on_error(self):
+        """Testa se uma falha no cálculo libera o lock."""
+        def fail():
+            raise RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            get_or_refresh("aggregate", fail, 60)
+        self.assertEqual(get_or_refresh("aggregate", self.compute(delay=0), 60), 42)
@@ -0,0 +1,90 @@
+import json
+
+from django.urls import reverse
+from django.utils import timezone
+
+from departments.models import Department
+from events.models import EventOcurrence
+from utils.test import SetUpInitial
+
+
+class DataTablesMixinTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        self.url = reverse("events:event_no_response")
+        self.reporting = Department.objects.get(id=1)
+        self.notified = Department.objects.get(id=2)
+        self.events = [
+            EventOcurrence.objects.create(
+                ocurrence_date=now.date(),
+                ocurrence_time=now.time(),
+                reporting_department=self.reporting if index % 2 else self.notified,
+                notified_department=self.notified,
+                description_ocurrence=f"Ocorrência {index}",
+                immediate_action="Ação",
+            )
+            for index in range(6)
+        ]
+
+    def get_json(self, **params):
+        params.setdefault("draw", 1)
+        response = self.client.get(self.url, params)
+        self.assertEqual(response["Content-Type"], "application/json")
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_page_of_rows(self):
+        """Testa se a requisição retorna apenas a página pedida, em arrays."""
+        data = self.get_json(
+            draw=3, start=2, length=2, **{"order[0][column]": 0, "order[0][dir]": "asc"}
+        )
+        self.assertEqual(data["draw"], 3)
+        self.assertEqual(data["recordsTotal"], 6)
+        self.assertEqual(data["recordsFiltered"], 6)
+        self.assertEqual([row[0] for row in data["data"]], [e.pk for e in self.events[2:4]])
+        self.assertEqual(data["data"][0][2], self.notified.name)
+
+    def test_ordering_descending(self):
+        """Testa se a ordenação pedida pelo DataTables é aplicada."""
+        data = self.get_json(**{"order[0][column]": 0, "order[0][dir]": "desc"})
+        self.assertEqual(
+            [row[0] for row in data["data"]], [e.pk for e in reversed(self.events)]
+        )
+
+    def test_search(self):
+        """Testa se a busca filtra pelo prefixo do setor ou pelo ID."""
+        data = self.get_json(**{"search[value]": self.reporting.name[:4]})
+        self.assertEqual(data["recordsFiltered"], 3)
+        self.assertEqual(len(data["data"]), 3)
+
+        data = self.get_json(**{"search[value]": str(self.events[0].pk)})
+        self.assertEqual([row[0] for row in data["data"]], [self.events[0].pk])
+
+    def test_invalid_parameters_are_ignored(self):
+        """Testa se colunas desconhecidas e tamanhos excessivos são ignorados."""
+        data = self.get_json(
+            length=100000, start="x", **{"order[0][column]": 99, "order[0][dir]": "desc"}
+        )
+        self.assertEqual(len(data["data"]), 6)
+
+    def test_page_is_rendered_without_rows(self):
+        """Testa se a página HTML aponta para a fonte de dados do DataTables."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.context["datatable_url"], self.url)
+        self.assertContains(response, '"serverSide": true')
+
+    def test_department_names_are_escaped(self):
+        """Testa se nomes de setor com HTML não são inseridos como marcação."""
+        name = "<script>alert(1)</script>"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.notified.name = name
+            self.notified.save()
+
+        data = self.get_json()
+        self.assertEqual(data["data"][0][2], name)
+
+        response = self.client.get(self.url)
+        self.assertNotContains(response, name)
+        self.assertContains(
+            response, '"render": $.fn.dataTable.render.text()', count=2
+        )
@@ -0,0 +1,48 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from departments.models import Department
+from events.models import EventOcurrence, EventPatient
+from utils.mixins import soft_delete_index_name
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Plano de consulta do SQLite.')
+class SoftDeletePartialIndexTest(TestCase):
+    def assertUsesIndex(self, queryset, fields):
+        """Verifica se o plano da consulta usa o índice parcial esperado."""
+        name = soft_delete_index_name(queryset.model, fields)
+        self.assertIn(name, [index.name for index in queryset.model._meta.indexes])
+        self.assertIn(f'USING INDEX {name}', queryset.explain())
+
+    def test_list_queries_use_created_at_index(self):
+        """Testa se as listagens ordenadas usam o índice parcial de created_at."""
+        self.assertUsesIndex(EventOcurrence.objects.all(), ['created_at'])
+        self.assertUsesIndex(EventPatient.objects.all(), ['created_at'])
+        self.assertUsesIndex(
+            Department.objects.order_by('created_at'), ['created_at']
+        )
+
+    def test_foreign_key_queries_use_partial_index(self):
+        """Testa se filtros por chave estrangeira usam o índice parcial."""
+        self.assertUsesIndex(
+            EventOcurrence.objects.filter(notified_department_id=1),
+            ['notified_department', 'created_at'],
+        )
+        self.assertUsesIndex(
+            EventOcurrence.objects.filter(reporting_department_id=1),
+            ['reporting_department', 'created_at'],
+        )
+        self.assertUsesIndex(
+            Department.objects.filter(owner_id=1).order_by('created_at'),
+            ['owner', 'created_at'],
+        )
+
+    def test_indexes_are_partial(self):
+        """Testa se os índices adicionados cobrem só registros não excluídos."""
+        index = next(
+            index for index in EventOcurrence._meta.indexes
+            if index.name.endswith('_nd')
+        )
+        self.assertIsNotNone(index.condition)
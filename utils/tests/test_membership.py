@@ -0,0 +1,82 @@
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+
+from departments.models import Department
+from departments.views import DepartmentListView
+from utils.membership import get_membership
+from utils.test import SetUpInitial
+
+
+class DepartmentMembershipTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+
+    def make_request(self, user):
+        request = self.factory.get('/')
+        request.user = user
+        return request
+
+    def test_membership_is_loaded_once_per_request(self):
+        """Testa se a associação é carregada com uma única consulta por requisição."""
+        request = self.make_request(self.user)
+        with self.assertNumQueries(1):
+            membership = get_membership(request)
+            self.assertIs(get_membership(request), membership)
+        self.assertTrue(membership.is_admin)
+        self.assertEqual(membership.department_ids, {1})
+        self.assertEqual(membership.department_names, {'Administração'})
+
+    def test_anonymous_membership_is_empty(self):
+        """Testa se usuários anônimos recebem uma associação vazia sem consultas."""
+        with self.assertNumQueries(0):
+            membership = get_membership(self.make_request(AnonymousUser()))
+        self.assertFalse(membership.is_admin)
+        self.assertEqual(membership.department_ids, frozenset())
+
+    def test_list_filter_uses_membership(self):
+        """Testa se a listagem filtra pelos departamentos do usuário."""
+        other = self.User.objects.create_user(
+            email='other@123.com', username='other', password='password'
+        )
+        ti = Department.objects.get(name='TI')
+        other.departments.add(ti)
+        Department.objects.create(name='Financeiro', owner=self.user)
+        Department.objects.create(name='Compras', owner=other)
+
+        view = DepartmentListView()
+        view.setup(self.make_request(other))
+        names = set(view.get_queryset().values_list('name', flat=True))
+        self.assertEqual(names, {'Compras'})
+
+        view = DepartmentListView()
+        view.setup(self.make_request(self.user))
+        self.assertEqual(view.get_queryset().count(), 4)
+
+    def test_membership_is_cached_across_requests(self):
+        """Testa se a associação é reaproveitada entre requisições sem SQL."""
+        get_membership(self.make_request(self.user))
+        with self.assertNumQueries(0):
+            membership = get_membership(self.make_request(self.user))
+        self.assertTrue(membership.is_admin)
+
+    def test_departments_change_invalidates_cache(self):
+        """Testa se alterar os departamentos do usuário invalida o cache."""
+        get_membership(self.make_request(self.user))
+        ti = Department.objects.get(name='TI')
+
+        self.user.departments.add(ti)
+        membership = get_membership(self.make_request(self.user))
+        self.assertEqual(membership.department_ids, {1, ti.id})
+
+        ti.users.remove(self.user)
+        membership = get_membership(self.make_request(self.user))
+        self.assertEqual(membership.department_ids, {1})
+
+    def test_department_soft_delete_invalidates_cache(self):
+        """Testa se a exclusão lógica de um departamento invalida o cache."""
+        get_membership(self.make_request(self.user))
+        Department.objects.get(id=1).soft_delete()
+        membership = get_membership(self.make_request(self.user))
+        self.assertFalse(membership.is_admin)
+        self.assertEqual(membership.department_ids, frozenset())
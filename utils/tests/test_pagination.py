@@ -0,0 +1,111 @@
+from django.urls import reverse
+from django.utils import timezone
+
+from departments.models import Department
+from events.models.event_ocurrence_models import EventOcurrence
+from utils.pagination import CursorPaginator, InvalidCursor
+from utils.test import SetUpInitial
+
+
+class CursorPaginatorTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        for index in range(7):
+            Department.objects.create(name=f"Setor {index}", owner=self.user)
+        self.queryset = Department.objects.all()
+        self.expected = list(self.queryset.order_by("created_at", "id"))
+
+    def walk_forward(self, paginator):
+        pages, cursor = [], None
+        while True:
+            page = paginator.page(cursor)
+            pages.append(page)
+            if not page.has_next():
+                return pages
+            cursor = page.next_cursor
+
+    def test_walks_every_row_once(self):
+        """Testa se as páginas percorrem todos os registros, sem repetição."""
+        pages = self.walk_forward(CursorPaginator(self.queryset, 5))
+        rows = [row for page in pages for row in page]
+        self.assertEqual(rows, self.expected)
+        self.assertFalse(pages[0].has_previous())
+        self.assertTrue(pages[-1].has_previous())
+
+    def test_previous_cursor_returns_previous_page(self):
+        """Testa se o cursor anterior volta para a página anterior."""
+        paginator = CursorPaginator(self.queryset, 3)
+        first = paginator.page()
+        second = paginator.page(first.next_cursor)
+        back = paginator.page(second.previous_cursor)
+        self.assertEqual(list(back), list(first))
+        self.assertFalse(back.has_previous())
+        self.assertTrue(back.has_next())
+
+    def test_last_cursor(self):
+        """Testa se o cursor da última página traz os últimos registros."""
+        paginator = CursorPaginator(self.queryset, 5)
+        last = paginator.page(paginator.last_cursor())
+        self.assertEqual(list(last), self.expected[-5:])
+        self.assertFalse(last.has_next())
+        self.assertTrue(last.has_previous())
+
+    def test_page_is_a_single_query(self):
+        """Testa se cada página, mesmo distante, custa uma única consulta."""
+        paginator = CursorPaginator(self.queryset, 2)
+        cursor = paginator.page(paginator.page().next_cursor).next_cursor
+        with self.assertNumQueries(1):
+            paginator.page(cursor)
+
+    def test_invalid_cursor(self):
+        """Testa se um cursor malformado gera InvalidCursor."""
+        paginator = CursorPaginator(self.queryset, 5)
+        for cursor in ("???", "eyJ2IjpbMV19", paginator.encode_cursor(["x", "y"])):
+            with self.assertRaises(InvalidCursor):
+                paginator.page(cursor)
+
+    def test_estimated_count_is_bounded(self):
+        """Testa se a contagem estimada para no limite configurado."""
+        paginator = CursorPaginator(
+            self.queryset, 5, estimate_count=True, count_limit=4
+        )
+        self.assertEqual(paginator.count, 4)
+        self.assertEqual(paginator.display_count, "4+")
+        self.assertEqual(
+            CursorPaginator(self.queryset, 5).count, len(self.expected)
+        )
+
+
+class EventListViewPaginationTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        self.events = [
+            EventOcurrence.objects.create(
+                ocurrence_date=now.date(),
+                ocurrence_time=now.time(),
+                reporting_department=Department.objects.get(id=1),
+                notified_department=Department.objects.get(id=2),
+                description_ocurrence=f"Ocorrência {index}",
+                immediate_action="Ação",
+            )
+            for index in range(7)
+        ]
+
+    def test_pages_by_cursor(self):
+        """Testa se a lista de ocorrências pagina por cursor."""
+        url = reverse("events:event_no_response")
+        response = self.client.get(url)
+        self.assertEqual(list(response.context["events"]), self.events[:5])
+        page = response.context["page_obj"]
+        self.assertTrue(page.has_next())
+
+        response = self.client.get(url, {"cursor": page.next_cursor})
+        self.assertEqual(list(response.context["events"]), self.events[5:])
+
+    def test_invalid_cursor_is_not_found(self):
+        """Testa se um cursor inválido retorna 404."""
+        response = self.client.get(
+            reverse("events:event_no_response"), {"cursor": "???"}
+        )
+        self.assertEqual(response.status_code, 404)
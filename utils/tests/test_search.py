@@ -0,0 +1,81 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import RequestFactory
+from django.urls import reverse
+
+from departments import views
+from departments.models import Department
+from events.models import EventPatient
+from utils.search import folded_condition
+from utils.test import SetUpInitial
+
+
+class FoldedSearchTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.admin_department = Department.objects.get(name='Administração')
+        self.patient = EventPatient.objects.create(
+            patient_name="João Conceição",
+            attendance=123,
+            record=456,
+            birth_date="1980-01-01",
+            internment_date="2024-01-01",
+        )
+
+    def search(self, queryset, field, term):
+        return list(queryset.filter(folded_condition(queryset, field, term)))
+
+    def test_shadow_column_set_on_save(self):
+        """Testa se a coluna normalizada é preenchida ao salvar."""
+        self.assertEqual(self.admin_department.name_search, "administracao")
+        self.assertEqual(self.patient.patient_name_search, "joao conceicao")
+
+        self.patient.patient_name = "José"
+        self.patient.save(update_fields=["patient_name"])
+        self.patient.refresh_from_db()
+        self.assertEqual(self.patient.patient_name_search, "jose")
+
+    def test_search_ignores_accents_and_case(self):
+        """Testa se a busca encontra nomes com ou sem acentos."""
+        departments = Department.objects.all()
+        for term in ("administracao", "ADMINISTRAÇÃO", "Admin", "istraç"):
+            self.assertEqual(
+                self.search(departments, "name_search", term),
+                [self.admin_department],
+            )
+        self.assertEqual(
+            self.search(EventPatient.objects.all(), "patient_name_search", "joao"),
+            [self.patient],
+        )
+
+    @skipUnless(connection.vendor == "sqlite", "Plano de consulta do SQLite.")
+    def test_search_uses_index(self):
+        """Testa se a busca por prefixo usa o índice da coluna normalizada."""
+        queryset = Department.objects.all()
+        plan = queryset.filter(
+            folded_condition(queryset, "name_search", "admin", prefix=True)
+        ).explain()
+        self.assertIn("departments_name_se_34815d_idx", plan)
+
+    def test_department_list_filter(self):
+        """Testa se a listagem de setores filtra o nome sem acentos."""
+        request = RequestFactory().get("/", {"name": "administracao"})
+        request.user = self.user
+        view = views.DepartmentListView()
+        view.setup(request)
+        self.assertEqual(list(view.get_queryset()), [self.admin_department])
+
+    def test_admin_search(self):
+        """Testa se a busca do admin usa o nome normalizado e os números exatos."""
+        self.user.is_staff = self.user.is_superuser = True
+        self.user.save()
+        url = reverse("admin:events_eventpatient_changelist")
+
+        for term in ("joao", "conceicao", "123"):
+            response = self.client.get(url, {"q": term})
+            self.assertEqual(
+                list(response.context["cl"].result_list), [self.patient]
+            )
+        response = self.client.get(url, {"q": "maria"})
+        self.assertEqual(list(response.context["cl"].result_list), [])
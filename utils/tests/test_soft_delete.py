@@ -0,0 +1,78 @@
+from django.contrib.admin import helpers
+from django.urls import reverse
+
+from classifications.models import DamageClassification
+from utils.signals import restored, soft_deleted
+from utils.test import SetUpInitial
+
+
+class SoftDeleteQuerySetTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.damages = [
+            DamageClassification.objects.create(classification=name)
+            for name in ('Nenhum', 'Dano Leve', 'Dano Grave')
+        ]
+        self.batches = []
+        soft_deleted.connect(self.record, sender=DamageClassification)
+        restored.connect(self.record, sender=DamageClassification)
+        self.addCleanup(soft_deleted.disconnect, self.record, sender=DamageClassification)
+        self.addCleanup(restored.disconnect, self.record, sender=DamageClassification)
+
+    def record(self, sender, pks, signal, **kwargs):
+        self.batches.append((signal, sorted(pks)))
+
+    def test_bulk_soft_delete_single_update(self):
+        """Testa se a exclusão em lote usa um único UPDATE e um único sinal."""
+        with self.assertNumQueries(2):
+            updated = DamageClassification.objects.all().soft_delete()
+        self.assertEqual(updated, 3)
+        self.assertFalse(DamageClassification.objects.exists())
+        self.assertEqual(
+            self.batches, [(soft_deleted, [d.pk for d in self.damages])]
+        )
+
+    def test_bulk_restore(self):
+        """Testa se a restauração em lote afeta apenas registros excluídos."""
+        self.damages[0].soft_delete()
+        self.batches.clear()
+
+        restored_count = DamageClassification.all_objects.all().restore()
+        self.assertEqual(restored_count, 1)
+        self.assertEqual(DamageClassification.objects.count(), 3)
+        self.assertEqual(self.batches, [(restored, [self.damages[0].pk])])
+
+    def test_bulk_soft_delete_updates_timestamp(self):
+        """Testa se a exclusão em lote atualiza o campo updated_at."""
+        before = self.damages[0].updated_at
+        DamageClassification.objects.filter(pk=self.damages[0].pk).soft_delete()
+        self.damages[0].refresh_from_db()
+        self.assertGreater(self.damages[0].updated_at, before)
+
+    def test_admin_soft_delete_action(self):
+        """Testa a ação do admin que exclui logicamente os selecionados."""
+        self.user.is_staff = True
+        self.user.is_superuser = True
+        self.user.save()
+        response = self.client.post(
+            reverse('admin:classifications_damageclassification_changelist'),
+            {
+                'action': 'soft_delete_selected',
+                helpers.ACTION_CHECKBOX_NAME: [d.pk for d in self.damages[:2]],
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(DamageClassification.objects.count(), 1)
+        self.assertEqual(len(self.batches), 1)
+
+    def test_admin_without_hard_delete_action(self):
+        """Testa se o admin não oferece a exclusão definitiva dos selecionados."""
+        self.user.is_staff = True
+        self.user.is_superuser = True
+        self.user.save()
+        response = self.client.get(
+            reverse('admin:classifications_damageclassification_changelist')
+        )
+        actions = dict(response.context['action_form'].fields['action'].choices)
+        self.assertIn('soft_delete_selected', actions)
+        self.assertNotIn('delete_selected', actions)
@@ -0,0 +1,62 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from departments.models import Department
+from utils.membership import DepartmentMembership
+from utils.test import SetUpInitial
+from utils.visibility import filter_visible
+
+
+class VisibilityFilterTest(SetUpInitial):
+    def setUp(self):
+        super().setUp()
+        self.other = self.User.objects.create_user(
+            email='other@123.com', username='other', password='password'
+        )
+        self.ti = Department.objects.get(name='TI')
+        self.finance = Department.objects.create(
+            name='Financeiro', owner=self.user
+        )
+        self.other.departments.add(self.ti, self.finance)
+
+    def test_rows_are_not_duplicated_without_distinct(self):
+        """Testa se o filtro não duplica linhas nem usa DISTINCT."""
+        viewer = self.User.objects.create_user(
+            email='viewer@123.com', username='viewer', password='password'
+        )
+        viewer.departments.add(self.ti, self.finance)
+        owned = Department.objects.create(name='Compras', owner=self.other)
+
+        queryset = filter_visible(
+            Department.objects.all(), DepartmentMembership.for_user(viewer)
+        )
+        self.assertNotIn('DISTINCT', str(queryset.query))
+        self.assertEqual(list(queryset), [owned])
+
+    def test_admin_sees_everything(self):
+        """Testa se administradores veem todos os registros."""
+        queryset = Department.objects.all()
+        membership = DepartmentMembership.for_user(self.user)
+        self.assertIs(filter_visible(queryset, membership), queryset)
+
+    def test_user_without_departments_sees_own_rows(self):
+        """Testa se usuários sem departamento veem apenas seus registros."""
+        owned = Department.objects.create(name='Compras', owner=self.other)
+        self.other.departments.clear()
+        queryset = filter_visible(
+            Department.objects.all(), DepartmentMembership.for_user(self.other)
+        )
+        self.assertEqual(list(queryset), [owned])
+
+
+class BenchmarkVisibilityCommandTest(SetUpInitial):
+    def test_benchmark_rolls_back(self):
+        """Testa se o benchmark executa e não mantém os dados gerados."""
+        out = StringIO()
+        call_command(
+            'benchmark_visibility', rows=50, users=5, repeat=1, stdout=out
+        )
+        self.assertIn('legacy', out.getvalue())
+        self.assertIn('subquery', out.getvalue())
+        self.assertEqual(Department.objects.count(), 2)
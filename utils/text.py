@@ -0,0 +1,89 @@
+"""Text normalization helpers for search."""
+
+import re
+import unicodedata
+
+# Runs of letters and digits. Underscores and punctuation separate words,
+# as in the `unicode61` tokenizer of SQLite full-text search.
+WORD_RE = re.compile(r"[^\W_]+")
+
+# Accent-folded Portuguese words too common to narrow a search.
+STOPWORDS = frozenset(
+    "a as ao aos com da das de do dos e em na nas no nos o os ou para "
+    "pela pelas pelo pelos por que se um uma".split()
+)
+
+# Suffixes stripped by `stem`, longest first, with the minimum length of
+# the stem left behind. A light take on the RSLP rules for Portuguese.
+SUFFIXES = (
+    ("amentos", 3),
+    ("imentos", 3),
+    ("amento", 3),
+    ("imento", 3),
+    ("mente", 4),
+    ("acoes", 3),
+    ("icoes", 3),
+    ("acao", 3),
+    ("icao", 3),
+    ("coes", 3),
+    ("cao", 3),
+    ("oes", 3),
+    ("aes", 3),
+    ("ados", 3),
+    ("idos", 3),
+    ("adas", 3),
+    ("idas", 3),
+    ("ado", 3),
+    ("ido", 3),
+    ("ada", 3),
+    ("ida", 3),
+    ("res", 3),
+    ("zes", 3),
+    ("ao", 3),
+    ("s", 3),
+)
+
+
+def fold(value: str) -> str:
+    """
+    Lowercase a text and strip its diacritics.
+
+    Args:
+        value (str): The text to be normalized.
+
+    Returns:
+        str: The accent-folded, lowercased text, e.g. "administracao" for "Administração".
+    """
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    return "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold()
+
+
+def words(value: str) -> list:
+    """Return the accent-folded words of a text."""
+    return WORD_RE.findall(fold(value))
+
+
+def stem(word: str) -> str:
+    """
+    Reduce an accent-folded Portuguese word to a prefix shared by its
+    inflections, e.g. "qued" for "queda" and "quedas", "medic" for
+    "medicação" and "medicado".
+
+    Used where the database has no Portuguese stemmer: the stem is
+    searched as a prefix, so over-stemming only widens the match.
+
+    Args:
+        word (str): An accent-folded word.
+
+    Returns:
+        str: The stem of the word.
+    """
+    for suffix, minimum in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= minimum:
+            word = word[: -len(suffix)]
+            break
+    if len(word) > 4 and word[-1] in "aeo":
+        word = word[:-1]
+    return word
@@ -0,0 +1,103 @@
+"""Department-based row visibility built from semi-join subqueries."""
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+
+
+def visibility_condition(model, user_id, department_ids):
+    """
+    Build the condition selecting the rows of `model` visible to a user.
+
+    A row is visible when the user owns it, when its owner shares one of
+    the user's departments or, for models with a `department` field, when
+    that department is one of the user's. Owners sharing a department are
+    matched with an `owner_id IN (SELECT ...)` semi-join over the
+    user/department relation instead of a join, so each row is matched at
+    most once and the queryset never needs `DISTINCT`. Every branch of the
+    condition is served by the index on the owner or department column.
+
+    Args:
+        model (type[Model]): A model with an `owner` field, optionally with a `department` field.
+        user_id (int): The primary key of the user.
+        department_ids (Iterable[int]): The IDs of the user's departments.
+
+    Returns:
+        Q: A condition to be passed to `QuerySet.filter`.
+    """
+    department_ids = sorted(department_ids)
+    condition = Q(owner_id=user_id)
+    if not department_ids:
+        return condition
+
+    user_departments = get_user_model().departments.through.objects
+    condition |= Q(
+        owner_id__in=user_departments.filter(
+            department_id__in=department_ids
+        ).values("user_id")
+    )
+    if hasattr(model, "department"):
+        condition |= Q(department_id__in=department_ids)
+    return condition
+
+
+def indexed_visibility_condition(model, user_id, department_ids):
+    """
+    Build the visibility condition of a model from the visibility index.
+
+    Used for models listed in `VISIBILITY_INDEX_MODELS`, whose visible
+    departments are materialized in `departments.DepartmentVisibility`.
+    The lookup is a single semi-join served by the index on
+    (content_type, department, object_id).
+
+    Args:
+        model (type[Model]): A model with an `owner` field.
+        user_id (int): The primary key of the user.
+        department_ids (Iterable[int]): The IDs of the user's departments.
+
+    Returns:
+        Q: A condition to be passed to `QuerySet.filter`.
+    """
+    department_ids = sorted(department_ids)
+    condition = Q(owner_id=user_id)
+    if not department_ids:
+        return condition
+
+    DepartmentVisibility = apps.get_model("departments", "DepartmentVisibility")
+    condition |= Q(
+        pk__in=DepartmentVisibility.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            department_id__in=department_ids,
+        ).values("object_id")
+    )
+    return condition
+
+
+def filter_visible(queryset, membership):
+    """
+    Restrict a queryset to the rows visible to a department membership.
+
+    Models listed in `VISIBILITY_INDEX_MODELS` are filtered through the
+    visibility index, every other model through `visibility_condition`.
+
+    Args:
+        queryset (QuerySet): The queryset to be restricted.
+        membership (DepartmentMembership): The membership of the user.
+
+    Returns:
+        QuerySet: The queryset itself for admins, otherwise the rows the
+        user can see.
+    """
+    if membership.is_admin:
+        return queryset
+
+    model = queryset.model
+    if model._meta.label in settings.VISIBILITY_INDEX_MODELS:
+        build_condition = indexed_visibility_condition
+    else:
+        build_condition = visibility_condition
+    return queryset.filter(
+        build_condition(model, membership.user_id, membership.department_ids)
+    )